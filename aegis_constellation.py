@@ -5,11 +5,23 @@ A swarm of intelligent agents demonstrating emergent coordination.
 Each agent has distinct visual identity and purposeful behavior.
 """
 from PIL import Image, ImageDraw, ImageFont, ImageFilter
+import argparse
+import functools
 import math
 import random
-from dataclasses import dataclass
-from typing import List, Tuple
+import sys
+from dataclasses import dataclass, replace
+from typing import Iterator, List, NamedTuple, Tuple
 import colorsys
+import os
+
+from background_cache import BACKGROUNDS
+from framebuffer import Framebuffer, Stamp
+from output_pipeline import GifSink, OutputPipeline, add_output_arguments, extra_sinks
+from palette import build_palette, mix
+from parallel_render import render_frames
+from profiling import Profiler, add_profile_argument
+from svg_backend import SvgAnimation, add_svg_argument, hex_color, report_size, tap
 
 # ============================================================================
 # CONFIGURATION
@@ -19,7 +31,13 @@ WIDTH = 830
 HEIGHT = 180
 TOTAL_FRAMES = 180  # Shorter loop, smaller file
 FRAME_DURATION = 50  # ~20fps, still smooth
+PREVIEW_FRAME = 60  # Saved as a still PNG
 BACKGROUND = (8, 10, 18)  # Deep space
+GRID_COLOR = (20, 25, 40)
+GRID_SPACING = 40
+
+# Functions timed by --profile
+PROFILED = ('draw_frame', 'draw_frame_numpy', 'draw_agent_glow', 'get_boid_forces')
 
 # Agent definitions with clear roles
 AGENT_SPECS = {
@@ -79,10 +97,68 @@ AGENT_SPECS = {
     },
 }
 
+# Color themes for the scene around the agents. Frames are rendered once in
+# the default theme; every theme shares its palette layout, so a variant
+# only swaps the frames' color table.
+DEFAULT_THEME = 'dark'
+THEMES = {
+    'dark': {
+        'background': BACKGROUND,
+        'grid': GRID_COLOR,
+        'connection': (60, 180, 100),
+    },
+    'light': {
+        'background': (246, 248, 250),
+        'grid': (225, 229, 235),
+        'connection': (120, 200, 150),
+    },
+}
+
+# Fixed global palette: background, grid, lines, agent colors and highlights,
+# plus ramps from the background and grid toward each glow color
+CONNECTION_COLOR = THEMES[DEFAULT_THEME]['connection']
+GLOW_MIX = 0.12  # Strongest glow tint over the background
+
+
+def _highlight(color, amount):
+    return tuple(min(255, c + amount) for c in color)
+
+
+def theme_palette(theme: str):
+    """The global palette with a theme's colors, entry for entry."""
+    colors = THEMES[theme]
+    background, grid = colors['background'], colors['grid']
+    return build_palette(
+        colors=[background, grid, colors['connection']]
+        + [spec['color'] for spec in AGENT_SPECS.values()]
+        + [spec['glow'] for spec in AGENT_SPECS.values()]
+        + [_highlight(AGENT_SPECS['thea']['color'], 60), _highlight(AGENT_SPECS['forge']['color'], 50)],
+        ramps=[(background, mix(background, spec['glow'], GLOW_MIX), 16) for spec in AGENT_SPECS.values()]
+        + [(grid, mix(grid, spec['glow'], GLOW_MIX), 8) for spec in AGENT_SPECS.values()],
+    )
+
+
+PALETTE = theme_palette(DEFAULT_THEME)
+
 # Formation phases
 PHASE_DURATION = 60  # frames per phase
 PHASES = ['scatter', 'converge', 'orbit']
 
+# Steering parameters by behavior
+BOID_PARAMS = {
+    'leader':    {'sep': 80, 'ali': 0.0, 'coh': 0.0, 'target': 0.02,  'max_speed': 2.0, 'orbit': 0.15},
+    'guardian':  {'sep': 40, 'ali': 0.3, 'coh': 0.5, 'target': 0.01,  'max_speed': 2.0, 'orbit': 0.15},
+    'builder':   {'sep': 30, 'ali': 0.5, 'coh': 0.8, 'target': 0.015, 'max_speed': 2.0, 'orbit': 0.15},
+    'connector': {'sep': 25, 'ali': 0.4, 'coh': 0.3, 'target': 0.02,  'max_speed': 3.0, 'orbit': 0.15},
+    'aesthetic': {'sep': 35, 'ali': 0.6, 'coh': 0.4, 'target': 0.012, 'max_speed': 2.0, 'orbit': 0.15},
+    'anchor':    {'sep': 50, 'ali': 0.2, 'coh': 0.2, 'target': 0.005, 'max_speed': 0.8, 'orbit': 0.05},
+}
+ALIGN_RADIUS = 100
+
+# Neighbour lookup
+NEIGHBOR_RADIUS = 150  # Largest boid radius (cohesion)
+MAX_STEP = max(p['max_speed'] for p in BOID_PARAMS.values())  # Max move per update
+
 # ============================================================================
 # AGENT CLASS
 # ============================================================================
@@ -117,6 +193,54 @@ class Agent:
         return self.spec['behavior']
 
 
+# ============================================================================
+# SPATIAL HASH
+# ============================================================================
+
+class SpatialHash:
+    """Uniform grid of agent buckets, rebuilt once per frame.
+
+    Cells are one neighbour radius wide plus the distance an agent can move
+    after the rebuild, so the 3x3 block around an agent always contains
+    every agent that can be within NEIGHBOR_RADIUS of it this frame.
+
+    This is no asymptotic gain on the default canvas. A 152px cell is most
+    of its 180px height, so the 3x3 block spans the full height and about
+    half the width, and each agent still scans about half of the swarm: a
+    frame stays O(N^2) with a ~2x smaller constant. No cell size can fix
+    that, since the 150px cohesion radius alone holds 30-40% of the agents
+    (spread out or in formation) at any density. Smaller cells culled to
+    the radius still scanned ~80% of the candidates and were slower at
+    40-160 agents. The cost per agent only stays flat when the canvas grows
+    with the swarm, at fixed density (see benchmarks/bench_spatial_hash.py).
+    """
+
+    def __init__(self, cell_size: float = NEIGHBOR_RADIUS + MAX_STEP):
+        self.cell_size = cell_size
+        self.cells = {}
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(x // self.cell_size), int(y // self.cell_size)
+
+    def rebuild(self, agents: List[Agent]):
+        """Re-bucket all agents at their current positions."""
+        cells = {}
+        for agent in agents:
+            cells.setdefault(self._cell(agent.x, agent.y), []).append(agent)
+        self.cells = cells
+
+    def nearby(self, x: float, y: float) -> List[Agent]:
+        """Agents in the 3x3 block of cells around (x, y)."""
+        cx, cy = self._cell(x, y)
+        found = []
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                bucket = self.cells.get((gx, gy))
+                if bucket:
+                    found.extend(bucket)
+        return found
+
+
 # ============================================================================
 # BOIDS ALGORITHM (Modified for AEGIS)
 # ============================================================================
@@ -124,17 +248,7 @@ class Agent:
 def get_boid_forces(agent: Agent, all_agents: List[Agent], target: Tuple[float, float], phase: str) -> Tuple[float, float]:
     """Calculate steering forces based on behavior type and phase."""
 
-    # Parameters vary by behavior
-    params = {
-        'leader': {'sep': 80, 'ali': 0.0, 'coh': 0.0, 'target': 0.02},
-        'guardian': {'sep': 40, 'ali': 0.3, 'coh': 0.5, 'target': 0.01},
-        'builder': {'sep': 30, 'ali': 0.5, 'coh': 0.8, 'target': 0.015},
-        'connector': {'sep': 25, 'ali': 0.4, 'coh': 0.3, 'target': 0.02},
-        'aesthetic': {'sep': 35, 'ali': 0.6, 'coh': 0.4, 'target': 0.012},
-        'anchor': {'sep': 50, 'ali': 0.2, 'coh': 0.2, 'target': 0.005},
-    }
-
-    p = params.get(agent.behavior, params['connector'])
+    p = BOID_PARAMS.get(agent.behavior, BOID_PARAMS['connector'])
 
     # Separation
     sep_x, sep_y = 0, 0
@@ -159,13 +273,13 @@ def get_boid_forces(agent: Agent, all_agents: List[Agent], target: Tuple[float,
             sep_y += dy / dist
 
         # Alignment (match velocity of same type)
-        if dist < 100 and other.agent_type == agent.agent_type:
+        if dist < ALIGN_RADIUS and other.agent_type == agent.agent_type:
             ali_x += other.vx
             ali_y += other.vy
             ali_count += 1
 
         # Cohesion (move toward center of flock)
-        if dist < 150:
+        if dist < NEIGHBOR_RADIUS:
             coh_x += other.x
             coh_y += other.y
             coh_count += 1
@@ -198,9 +312,8 @@ def get_boid_forces(agent: Agent, all_agents: List[Agent], target: Tuple[float,
         dy = agent.y - cy
         dist = math.sqrt(dx*dx + dy*dy) + 0.001
         # Perpendicular force (orbit)
-        orbit_strength = 0.15 if agent.behavior != 'anchor' else 0.05
-        tar_x += (-dy / dist) * orbit_strength
-        tar_y += (dx / dist) * orbit_strength
+        tar_x += (-dy / dist) * p['orbit']
+        tar_y += (dx / dist) * p['orbit']
 
     # Combine forces
     fx = sep_x * 0.5 + ali_x + coh_x + tar_x
@@ -254,16 +367,19 @@ def get_formation_target(agent: Agent, frame: int, phase: str) -> Tuple[float, f
         return base_x + math.sin(t * 0.1 + agent.index) * 10, base_y
 
 
-def update_agent(agent: Agent, all_agents: List[Agent], frame: int, phase: str):
-    """Update agent position with smooth motion."""
+def update_agent(agent: Agent, all_agents: List[Agent], frame: int, phase: str,
+                 grid: SpatialHash = None):
+    """Update agent position with smooth motion.
+
+    With a grid, only agents in nearby cells are considered as neighbours.
+    """
 
     target = get_formation_target(agent, frame, phase)
-    fx, fy = get_boid_forces(agent, all_agents, target, phase)
+    neighbors = grid.nearby(agent.x, agent.y) if grid is not None else all_agents
+    fx, fy = get_boid_forces(agent, neighbors, target, phase)
 
     # Apply forces with damping
-    max_speed = 3.0 if agent.behavior == 'connector' else 2.0
-    if agent.behavior == 'anchor':
-        max_speed = 0.8
+    max_speed = BOID_PARAMS[agent.behavior]['max_speed']
 
     agent.vx = agent.vx * 0.95 + fx
     agent.vy = agent.vy * 0.95 + fy
@@ -294,6 +410,12 @@ def update_agent(agent: Agent, all_agents: List[Agent], frame: int, phase: str):
 # RENDERING
 # ============================================================================
 
+# Glow sprites, keyed by (agent type, pulse level)
+GLOW_PULSE_LEVELS = 16
+GLOW_PULSE_MIN = 0.2  # Lowest value of the 0.6 +/- 0.4 pulse
+GLOW_BLUR = 3
+_glow_sprites = {}
+
 def draw_connection_lines(draw: ImageDraw, agents: List[Agent], frame: int):
     """Draw subtle connection lines between related agents."""
 
@@ -326,30 +448,64 @@ def draw_connection_lines(draw: ImageDraw, agents: List[Agent], frame: int):
             alpha = int(40 * pulse * (1 - closest_dist / 100))
             color = (60, 220, 120, alpha)
             draw.line([(agent.x, agent.y), (closest.x, closest.y)],
-                     fill=(60, 180, 100), width=1)
+                     fill=CONNECTION_COLOR, width=1)
 
 
-def draw_agent_glow(img: Image, agent: Agent, frame: int):
-    """Draw soft glow around agent."""
+def get_glow_sprite(agent_type: str, level: int) -> Image:
+    """Pre-rendered, pre-blurred glow for an agent type at a pulse level."""
 
-    # Create glow layer
-    glow = Image.new('RGBA', img.size, (0, 0, 0, 0))
-    glow_draw = ImageDraw.Draw(glow)
+    key = (agent_type, level)
+    sprite = _glow_sprites.get(key)
+    if sprite is not None:
+        return sprite
 
-    # Pulse intensity
-    pulse = 0.6 + 0.4 * math.sin(frame * 0.15 + agent.index * 0.5)
+    spec = AGENT_SPECS[agent_type]
+    size = spec['size']
+    outer = size * 4
+    half = outer + GLOW_BLUR * 3  # Room for the blur to fade out
+    pulse = GLOW_PULSE_MIN + (1 - GLOW_PULSE_MIN) * level / (GLOW_PULSE_LEVELS - 1)
+
+    sprite = Image.new('RGBA', (half * 2 + 1, half * 2 + 1), (0, 0, 0, 0))
+    sprite_draw = ImageDraw.Draw(sprite)
 
     # Draw multiple rings for soft glow
-    for radius in range(agent.size * 4, agent.size, -2):
-        alpha = int(20 * pulse * (1 - radius / (agent.size * 4)))
-        r, g, b = agent.glow
-        glow_draw.ellipse(
-            [agent.x - radius, agent.y - radius,
-             agent.x + radius, agent.y + radius],
+    r, g, b = spec['glow']
+    for radius in range(outer, size, -2):
+        alpha = int(20 * pulse * (1 - radius / outer))
+        sprite_draw.ellipse(
+            [half - radius, half - radius, half + radius, half + radius],
             fill=(r, g, b, alpha)
         )
 
-    return glow
+    sprite = sprite.filter(ImageFilter.GaussianBlur(radius=GLOW_BLUR))
+    _glow_sprites[key] = sprite
+    return sprite
+
+
+def glow_level(agent: Agent, frame: int) -> int:
+    """The agent's pulse intensity, quantized to a cached sprite level."""
+    pulse = 0.6 + 0.4 * math.sin(frame * 0.15 + agent.index * 0.5)
+    return round((pulse - GLOW_PULSE_MIN) / (1 - GLOW_PULSE_MIN) * (GLOW_PULSE_LEVELS - 1))
+
+
+def draw_agent_glow(img: Image, agent: Agent, frame: int):
+    """Composite the agent's soft glow into its bounding box on img."""
+
+    sprite = get_glow_sprite(agent.agent_type, glow_level(agent, frame))
+
+    half = sprite.width // 2
+    left = round(agent.x) - half
+    top = round(agent.y) - half
+
+    # alpha_composite rejects negative destinations, so clip on the top/left
+    src_left = max(0, -left)
+    src_top = max(0, -top)
+    if src_left >= sprite.width or src_top >= sprite.height:
+        return
+    if left + src_left >= img.width or top + src_top >= img.height:
+        return
+    img.alpha_composite(sprite, dest=(left + src_left, top + src_top),
+                        source=(src_left, src_top))
 
 
 def draw_agent_core(draw: ImageDraw, agent: Agent, frame: int):
@@ -374,8 +530,7 @@ def draw_agent_core(draw: ImageDraw, agent: Agent, frame: int):
             (x, y + size * 0.6),
             (x - size * 0.5, y),
         ]
-        highlight = tuple(min(255, c + 60) for c in agent.color)
-        draw.polygon(inner, fill=highlight)
+        draw.polygon(inner, fill=_highlight(agent.color, 60))
 
     elif agent.behavior == 'guardian':
         # Sentinel: Triangle (shield/arrow)
@@ -396,7 +551,7 @@ def draw_agent_core(draw: ImageDraw, agent: Agent, frame: int):
         # Inner detail
         draw.rectangle(
             [x - size * 0.4, y - size * 0.4, x + size * 0.4, y + size * 0.4],
-            fill=tuple(min(255, c + 50) for c in agent.color)
+            fill=_highlight(agent.color, 50)
         )
 
     elif agent.behavior == 'connector':
@@ -430,42 +585,59 @@ def draw_agent_core(draw: ImageDraw, agent: Agent, frame: int):
 
 
 def draw_frame(agents: List[Agent], frame: int, phase: str) -> Image:
-    """Render a complete frame."""
+    """Render a complete frame, mapped onto the global palette."""
 
-    # Create base image
-    img = Image.new('RGBA', (WIDTH, HEIGHT), (*BACKGROUND, 255))
+    # Start from the cached background with its subtle grid pattern
+    img = BACKGROUNDS.get((WIDTH, HEIGHT), BACKGROUND, GRID_COLOR, GRID_SPACING, mode='RGBA')
     draw = ImageDraw.Draw(img)
 
-    # Subtle grid pattern
-    grid_color = (20, 25, 40)
-    for x in range(0, WIDTH, 40):
-        alpha = 0.3 + 0.1 * math.sin(frame * 0.05 + x * 0.01)
-        draw.line([(x, 0), (x, HEIGHT)], fill=grid_color, width=1)
-    for y in range(0, HEIGHT, 40):
-        draw.line([(0, y), (WIDTH, y)], fill=grid_color, width=1)
-
     # Draw connection lines first (behind agents)
     draw_connection_lines(draw, agents, frame)
 
-    # Composite glow layers
-    glow_composite = Image.new('RGBA', img.size, (0, 0, 0, 0))
+    # Composite pre-blurred glow sprites around each agent
     for agent in agents:
-        glow = draw_agent_glow(img, agent, frame)
-        glow_composite = Image.alpha_composite(glow_composite, glow)
+        draw_agent_glow(img, agent, frame)
 
-    # Apply glow with blur
-    glow_composite = glow_composite.filter(ImageFilter.GaussianBlur(radius=3))
-    img = Image.alpha_composite(img, glow_composite)
-
-    # Draw agent cores
-    draw = ImageDraw.Draw(img)
-
-    # Sort by y for depth effect
+    # Draw agent cores, sorted by y for depth effect
     sorted_agents = sorted(agents, key=lambda a: a.y)
     for agent in sorted_agents:
         draw_agent_core(draw, agent, frame)
 
-    return img.convert('RGB')
+    return PALETTE.map(img)
+
+
+_glow_stamps = {}
+
+
+def draw_frame_numpy(agents: List[Agent], frame: int, phase: str) -> Image:
+    """draw_frame with the glows stamped into a NumPy framebuffer; same pixels.
+
+    The glow sprites are composited at whole pixels, so every agent's glow
+    goes down in one batch. Lines and cores sit at sub-pixel positions,
+    where a stamp would not fill what ImageDraw does, so those are still
+    drawn before and after the framebuffer.
+    """
+    img = BACKGROUNDS.get((WIDTH, HEIGHT), BACKGROUND, GRID_COLOR, GRID_SPACING)
+    draw_connection_lines(ImageDraw.Draw(img), agents, frame)
+
+    fb = Framebuffer(img)
+    for agent in agents:
+        key = (agent.agent_type, glow_level(agent, frame))
+        stamp = _glow_stamps.get(key)
+        if stamp is None:
+            stamp = _glow_stamps[key] = Stamp.sprite(get_glow_sprite(*key), composite='over')
+        fb.place(stamp, round(agent.x), round(agent.y))
+    img = fb.image()
+
+    draw = ImageDraw.Draw(img)
+    for agent in sorted(agents, key=lambda a: a.y):
+        draw_agent_core(draw, agent, frame)
+    return PALETTE.map(img)
+
+
+# Frame renderers selectable with --renderer, by function name: they are
+# looked up per call, so --profile's wrappers are the ones called
+RENDERERS = {'draw': 'draw_frame', 'numpy': 'draw_frame_numpy'}
 
 
 # ============================================================================
@@ -494,10 +666,22 @@ def create_agents() -> List[Agent]:
     return agents
 
 
-def main():
-    print("Initializing AEGIS Constellation...")
+class FrameSnapshot(NamedTuple):
+    """Agent copies plus frame/phase: everything draw_frame needs."""
+    frame: int
+    phase: str
+    agents: Tuple[Agent, ...]
+
+
+def simulate(engine: str = 'python') -> Iterator[FrameSnapshot]:
+    """Run the swarm, yielding a snapshot of every frame."""
+
     agents = create_agents()
-    frames = []
+    grid = SpatialHash()
+    swarm = None
+    if engine == 'numpy':
+        from aegis_constellation_numpy import SwarmArrays
+        swarm = SwarmArrays(agents)
 
     for frame_num in range(TOTAL_FRAMES):
         # Determine phase
@@ -505,33 +689,128 @@ def main():
         phase = PHASES[phase_idx]
 
         # Update all agents
-        for agent in agents:
-            update_agent(agent, agents, frame_num, phase)
-
-        # Render frame
-        img = draw_frame(agents, frame_num, phase)
-        frames.append(img)
+        if swarm is not None:
+            swarm.step(frame_num, phase)
+            swarm.sync(agents)
+        else:
+            grid.rebuild(agents)
+            for agent in agents:
+                update_agent(agent, agents, frame_num, phase, grid)
 
         if frame_num % 30 == 0:
             print(f"  Frame {frame_num}/{TOTAL_FRAMES} ({phase})")
 
-    # Save animation
-    print("Saving animation...")
-    frames[0].save(
-        'aegis_constellation.gif',
-        save_all=True,
-        append_images=frames[1:],
-        duration=FRAME_DURATION,
-        loop=0,
-        optimize=False  # Better quality
-    )
+        yield FrameSnapshot(frame_num, phase, tuple(replace(a) for a in agents))
+
+
+def render_snapshot(snapshot: FrameSnapshot, renderer: str = 'draw') -> Image:
+    """Render one frame from its snapshot (runs in worker processes too)."""
+    draw = getattr(sys.modules[__name__], RENDERERS[renderer])
+    return draw(list(snapshot.agents), snapshot.frame, snapshot.phase)
+
+
+# ============================================================================
+# SVG OUTPUT
+# ============================================================================
+
+def svg_agent_shape(agent_type: str) -> str:
+    """draw_agent_core (and a flat glow) as an SVG fragment around the origin.
+
+    Shapes that follow the agent's heading point along +x; the track rotates them.
+    """
+    spec = AGENT_SPECS[agent_type]
+    size = spec['size']
+    color, glow = hex_color(spec['color']), hex_color(spec['glow'])
+    behavior = spec['behavior']
+    shape = f'<circle r="{size * 4}" fill="{glow}" opacity=".12"/>'
+
+    def polygon(points, fill):
+        return '<path d="M' + 'L'.join(f'{x:.1f} {y:.1f}' for x, y in points) + f'Z" fill="{fill}"/>'
+
+    if behavior == 'leader':
+        shape += polygon([(0, -size * 1.5), (size * 1.2, 0), (0, size * 1.5), (-size * 1.2, 0)], color)
+        shape += polygon([(0, -size * 0.6), (size * 0.5, 0), (0, size * 0.6), (-size * 0.5, 0)],
+                         hex_color(_highlight(spec['color'], 60)))
+    elif behavior == 'guardian':
+        shape += polygon([(size * 1.5, 0),
+                          (math.cos(2.5) * size, math.sin(2.5) * size),
+                          (math.cos(-2.5) * size, math.sin(-2.5) * size)], color)
+    elif behavior == 'builder':
+        shape += f'<rect x="-{size}" y="-{size}" width="{size * 2}" height="{size * 2}" fill="{color}"/>'
+        inner = size * 0.4
+        shape += (f'<rect x="-{inner:g}" y="-{inner:g}" width="{inner * 2:g}" height="{inner * 2:g}" '
+                  f'fill="{hex_color(_highlight(spec["color"], 50))}"/>')
+    elif behavior == 'connector':
+        # The motion trail, drawn at a typical speed
+        shape += f'<circle r="{size}" fill="{color}"/><path d="M-6 0H0" stroke="{glow}" stroke-width="2"/>'
+    elif behavior == 'aesthetic':
+        shape += f'<circle r="{size * 1.2:g}" fill="{color}"/>'
+    elif behavior == 'anchor':
+        shape += polygon([(math.cos(i * math.pi / 3 - math.pi / 6) * size,
+                           math.sin(i * math.pi / 3 - math.pi / 6) * size) for i in range(6)], color)
+    return shape
+
+
+def record_svg(anim: SvgAnimation, snapshot: FrameSnapshot):
+    """Add a snapshot's agents to the SVG; connection lines are left out."""
+    for agent in snapshot.agents:
+        key = (agent.agent_type, agent.index)
+        if key not in anim:
+            anim.add_track(key, svg_agent_shape(agent.agent_type))
+        angle = 0.0
+        if agent.behavior in ('guardian', 'connector'):
+            angle = math.degrees(math.atan2(agent.vy, agent.vx))
+        anim.place(snapshot.frame, key, agent.x, agent.y, angle)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render the AEGIS Constellation animation.")
+    parser.add_argument('--engine', choices=['python', 'numpy'], default='python',
+                        help="simulation engine: per-agent reference or batched NumPy")
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default='draw',
+                        help="composite glows with PIL, or stamp them into a NumPy framebuffer")
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help="render frames in N worker processes")
+    parser.add_argument('--seed', type=int, help="random seed for a reproducible animation")
+    add_output_arguments(parser, themes=THEMES)
+    add_svg_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler.install(sys.modules[__name__], PROFILED) if args.profile else None
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    print("Initializing AEGIS Constellation...")
 
-    # Also save a preview frame
-    frames[60].save('aegis_constellation_preview.png')
+    # Each frame is rendered once and fanned out to the GIF (streamed to
+    # disk), the preview PNG and any extra outputs
+    gif = GifSink('aegis_constellation.gif', FRAME_DURATION, loop=0)
+    sinks = [gif] + extra_sinks(args, FRAME_DURATION,
+                                stills={PREVIEW_FRAME: 'aegis_constellation_preview.png'},
+                                themes={name: theme_palette(name) for name in THEMES})
+    snapshots = simulate(args.engine)
+    svg = None
+    if args.svg:
+        svg = SvgAnimation(WIDTH, HEIGHT, TOTAL_FRAMES, FRAME_DURATION, BACKGROUND)
+        svg.set_grid(GRID_COLOR, GRID_SPACING)
+        snapshots = tap(snapshots, lambda snapshot: record_svg(svg, snapshot))
+    with OutputPipeline(sinks) as outputs:
+        for img in render_frames(functools.partial(render_snapshot, renderer=args.renderer),
+                                 snapshots, args.workers):
+            outputs.append(img)
+    writer = gif.writer
 
     print(f"Created aegis_constellation.gif")
-    print(f"  {len(frames)} frames @ {FRAME_DURATION}ms = {len(frames) * FRAME_DURATION / 1000:.1f}s loop")
+    print(f"  {writer.frame_count} frames @ {FRAME_DURATION}ms = {writer.frame_count * FRAME_DURATION / 1000:.1f}s loop")
     print(f"  {WIDTH}x{HEIGHT} pixels")
+    if args.workers <= 1:
+        print(f"  background cache: {BACKGROUNDS.hits} hits, {BACKGROUNDS.misses} misses")
+    if svg:
+        report_size(args.svg, svg.save(args.svg), 'aegis_constellation.gif',
+                    os.path.getsize('aegis_constellation.gif'))
+    if profiler:
+        profiler.report(args.profile)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+AEGIS Constellation - NumPy simulation engine
+Struct-of-arrays version of the boids update in aegis_constellation.
+All agents are stepped together with batched array operations; rendering
+still goes through the Agent objects, which are synced after each step.
+
+The reference engine updates agents one at a time, so later agents see the
+already-moved positions of earlier ones. This engine updates everyone from
+the same snapshot, so trajectories diverge but the motion statistics match.
+"""
+import math
+from typing import List
+
+import numpy as np
+
+from aegis_constellation import (
+    AGENT_SPECS, ALIGN_RADIUS, BOID_PARAMS, HEIGHT, NEIGHBOR_RADIUS,
+    TOTAL_FRAMES, WIDTH, Agent,
+)
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TYPE_NAMES = list(AGENT_SPECS)
+BEHAVIORS = [AGENT_SPECS[name]['behavior'] for name in TYPE_NAMES]
+
+# Pairwise work is done in row blocks of at most this many distances
+PAIR_BLOCK = 1 << 22
+
+DAMPING = 0.95
+MARGIN = 30
+BOUNDARY_PUSH = 0.5
+
+
+def _param_vector(key: str) -> np.ndarray:
+    """Per-type parameter vector, indexed by type code."""
+    return np.array([BOID_PARAMS[b][key] for b in BEHAVIORS], dtype=np.float64)
+
+
+SEP = _param_vector('sep')
+ALI = _param_vector('ali')
+COH = _param_vector('coh')
+TARGET = _param_vector('target')
+MAX_SPEED = _param_vector('max_speed')
+ORBIT = _param_vector('orbit')
+
+# ============================================================================
+# ENGINE
+# ============================================================================
+
+class SwarmArrays:
+    """All agent state in parallel arrays, indexed like the source agent list."""
+
+    def __init__(self, agents: List[Agent]):
+        self.x = np.array([a.x for a in agents], dtype=np.float64)
+        self.y = np.array([a.y for a in agents], dtype=np.float64)
+        self.vx = np.array([a.vx for a in agents], dtype=np.float64)
+        self.vy = np.array([a.vy for a in agents], dtype=np.float64)
+        self.type_code = np.array([TYPE_NAMES.index(a.agent_type) for a in agents], dtype=np.int8)
+        self.index = np.array([a.index for a in agents], dtype=np.int64)
+        self.behavior_masks = {
+            behavior: self.type_code == code for code, behavior in enumerate(BEHAVIORS)
+        }
+
+    def __len__(self):
+        return len(self.x)
+
+    def sync(self, agents: List[Agent]):
+        """Write positions and velocities back into the Agent objects."""
+        for agent, x, y, vx, vy in zip(agents, self.x.tolist(), self.y.tolist(),
+                                       self.vx.tolist(), self.vy.tolist()):
+            agent.x, agent.y, agent.vx, agent.vy = x, y, vx, vy
+
+    def formation_targets(self, frame: int, phase: str):
+        """Vectorized get_formation_target for every agent."""
+        cx, cy = WIDTH / 2, HEIGHT / 2
+        t = frame / TOTAL_FRAMES * math.pi * 4
+        idx = self.index.astype(np.float64)
+        tx = np.empty(len(self))
+        ty = np.empty(len(self))
+
+        m = self.behavior_masks['leader']
+        tx[m] = cx + math.sin(t * 0.3) * 30
+        ty[m] = cy + math.cos(t * 0.4) * 15
+
+        m = self.behavior_masks['guardian']
+        angle = (idx[m] / 6) * math.pi * 2 + t * 0.5
+        radius = 120 if phase == 'orbit' else 80
+        tx[m] = cx + np.cos(angle) * radius
+        ty[m] = cy + np.sin(angle) * radius * 0.4
+
+        m = self.behavior_masks['builder']
+        if phase == 'converge':
+            tx[m] = cx - 60 + (self.index[m] % 4) * 40
+            ty[m] = cy - 20 + (self.index[m] // 4) * 30
+        else:
+            angle = (idx[m] / 8) * math.pi * 2 + t * 0.3
+            tx[m] = cx + np.cos(angle) * 70
+            ty[m] = cy + np.sin(angle) * 35
+
+        m = self.behavior_masks['connector']
+        angle = (idx[m] / 10) * math.pi * 2 + t * 0.8
+        radius = 50 + np.sin(t * 2 + idx[m]) * 30
+        tx[m] = cx + np.cos(angle) * radius
+        ty[m] = cy + np.sin(angle) * radius * 0.5
+
+        m = self.behavior_masks['aesthetic']
+        tx[m] = cx + np.sin(t * 0.6 + idx[m] * 0.5) * 100
+        ty[m] = cy + np.cos(t * 0.4 + idx[m]) * 40
+
+        m = self.behavior_masks['anchor']
+        tx[m] = 100 + (self.index[m] % 4) * 180 + np.sin(t * 0.1 + idx[m]) * 10
+        ty[m] = 50 + (self.index[m] // 4) * 80
+
+        return tx, ty
+
+    def neighbor_sums(self):
+        """Separation, alignment and cohesion sums over all agent pairs."""
+        n = len(self)
+        sep_x, sep_y = np.zeros(n), np.zeros(n)
+        ali_x, ali_y, ali_n = np.zeros(n), np.zeros(n), np.zeros(n)
+        coh_x, coh_y, coh_n = np.zeros(n), np.zeros(n), np.zeros(n)
+        sep_radius = SEP[self.type_code]
+
+        block = max(1, PAIR_BLOCK // max(n, 1))
+        for start in range(0, n, block):
+            rows = slice(start, min(start + block, n))
+            dx = self.x[rows, None] - self.x[None, :]
+            dy = self.y[rows, None] - self.y[None, :]
+            dist = np.sqrt(dx * dx + dy * dy) + 0.001
+
+            # Exclude each agent from its own sums
+            others = np.ones(dist.shape, dtype=bool)
+            others[np.arange(dist.shape[0]), np.arange(rows.start, rows.stop)] = False
+
+            sep = others & (dist < sep_radius[rows, None])
+            sep_x[rows] = np.where(sep, dx / dist, 0.0).sum(axis=1)
+            sep_y[rows] = np.where(sep, dy / dist, 0.0).sum(axis=1)
+
+            same = self.type_code[rows, None] == self.type_code[None, :]
+            ali = others & same & (dist < ALIGN_RADIUS)
+            ali_x[rows] = ali @ self.vx
+            ali_y[rows] = ali @ self.vy
+            ali_n[rows] = ali.sum(axis=1)
+
+            coh = others & (dist < NEIGHBOR_RADIUS)
+            coh_x[rows] = coh @ self.x
+            coh_y[rows] = coh @ self.y
+            coh_n[rows] = coh.sum(axis=1)
+
+        return sep_x, sep_y, ali_x, ali_y, ali_n, coh_x, coh_y, coh_n
+
+    def step(self, frame: int, phase: str):
+        """Advance every agent by one frame."""
+        codes = self.type_code
+        sep_x, sep_y, ali_x, ali_y, ali_n, coh_x, coh_y, coh_n = self.neighbor_sums()
+
+        # Normalize alignment and cohesion where there were neighbours
+        has_ali = ali_n > 0
+        safe_ali = np.where(has_ali, ali_n, 1)
+        ali_x = np.where(has_ali, (ali_x / safe_ali - self.vx) * ALI[codes], 0.0)
+        ali_y = np.where(has_ali, (ali_y / safe_ali - self.vy) * ALI[codes], 0.0)
+
+        has_coh = coh_n > 0
+        safe_coh = np.where(has_coh, coh_n, 1)
+        coh_x = np.where(has_coh, (coh_x / safe_coh - self.x) * 0.01 * COH[codes], 0.0)
+        coh_y = np.where(has_coh, (coh_y / safe_coh - self.y) * 0.01 * COH[codes], 0.0)
+
+        # Target seeking
+        target_x, target_y = self.formation_targets(frame, phase)
+        tar_x = (target_x - self.x) * TARGET[codes]
+        tar_y = (target_y - self.y) * TARGET[codes]
+
+        # Phase-specific modifications
+        if phase == 'scatter':
+            sep_x, sep_y = sep_x * 2, sep_y * 2
+            coh_x, coh_y = coh_x * 0.3, coh_y * 0.3
+        elif phase == 'orbit':
+            dx = self.x - WIDTH / 2
+            dy = self.y - HEIGHT / 2
+            dist = np.sqrt(dx * dx + dy * dy) + 0.001
+            tar_x = tar_x + (-dy / dist) * ORBIT[codes]
+            tar_y = tar_y + (dx / dist) * ORBIT[codes]
+
+        fx = sep_x * 0.5 + ali_x + coh_x + tar_x
+        fy = sep_y * 0.5 + ali_y + coh_y + tar_y
+
+        # Apply forces with damping, then limit speed
+        self.vx = self.vx * DAMPING + fx
+        self.vy = self.vy * DAMPING + fy
+        speed = np.sqrt(self.vx ** 2 + self.vy ** 2)
+        max_speed = MAX_SPEED[codes]
+        scale = np.where(speed > max_speed, max_speed / np.where(speed > 0, speed, 1), 1.0)
+        self.vx *= scale
+        self.vy *= scale
+
+        self.x += self.vx
+        self.y += self.vy
+
+        # Soft boundaries
+        self.vx += np.where(self.x < MARGIN, BOUNDARY_PUSH,
+                            np.where(self.x > WIDTH - MARGIN, -BOUNDARY_PUSH, 0.0))
+        self.vy += np.where(self.y < MARGIN, BOUNDARY_PUSH,
+                            np.where(self.y > HEIGHT - MARGIN, -BOUNDARY_PUSH, 0.0))
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+AEGIS Constellation - simulation traces
+Records the per-frame swarm state to a compact binary trace, and replays a
+trace through draw_frame. Tweaking visuals then only costs render time: the
+boids run once, and the renderer memory-maps the trace so even very long
+recordings are never loaded whole.
+
+    python aegis_constellation_trace.py record constellation.trace --seed 1
+    python aegis_constellation_trace.py render constellation.trace --workers 4
+
+Trace layout (little-endian):
+    header   '<4sHHI'  magic b'AEGT', version, agent count, frame count
+    names    '<I'      byte length, then comma-separated agent type names,
+                       zero-padded to a multiple of 4
+    agents   '<BxH'    per agent: type code (into names), agent index
+    frames   '<IHxx'   frame number, phase code (into PHASES), then
+             '<4f'     x, y, vx, vy per agent
+"""
+import argparse
+import mmap
+import random
+import struct
+import sys
+from array import array
+from typing import Iterator, List
+
+from aegis_constellation import (
+    FRAME_DURATION, PHASES, PREVIEW_FRAME, Agent, FrameSnapshot, render_snapshot, simulate,
+)
+from output_pipeline import GifSink, OutputPipeline, StillSink
+from parallel_render import render_frames
+
+# ============================================================================
+# FORMAT
+# ============================================================================
+
+MAGIC = b'AEGT'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+NAMES_LENGTH = struct.Struct('<I')
+AGENT_ENTRY = struct.Struct('<BxH')
+FRAME_HEADER = struct.Struct('<IHxx')
+FLOATS_PER_AGENT = 4  # x, y, vx, vy
+
+
+def _pad4(n: int) -> int:
+    return (n + 3) & ~3
+
+
+# ============================================================================
+# RECORDING
+# ============================================================================
+
+class TraceWriter:
+    """Append frames of swarm state to a trace file."""
+
+    def __init__(self, path: str, agents: List[Agent]):
+        self.path = path
+        self.agent_count = len(agents)
+        self.frame_count = 0
+        self.type_names = list(dict.fromkeys(a.agent_type for a in agents))
+
+        names = ','.join(self.type_names).encode()
+        self._fp = open(path, 'wb')
+        self._fp.write(HEADER.pack(MAGIC, VERSION, self.agent_count, 0))
+        self._fp.write(NAMES_LENGTH.pack(len(names)))
+        self._fp.write(names.ljust(_pad4(len(names)), b'\0'))
+        for agent in agents:
+            self._fp.write(AGENT_ENTRY.pack(self.type_names.index(agent.agent_type), agent.index))
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def append(self, frame: int, phase: str, agents: List[Agent]) -> None:
+        """Write one frame; agents must be in the order given to the writer."""
+        values = array('f')
+        for agent in agents:
+            values.extend((agent.x, agent.y, agent.vx, agent.vy))
+        if sys.byteorder != 'little':
+            values.byteswap()
+        self._fp.write(FRAME_HEADER.pack(frame, PHASES.index(phase)))
+        values.tofile(self._fp)
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """Patch the frame count into the header and close the file."""
+        if self._fp is None:
+            return
+        self._fp.seek(0)
+        self._fp.write(HEADER.pack(MAGIC, VERSION, self.agent_count, self.frame_count))
+        self._fp.close()
+        self._fp = None
+
+
+def record(path: str, engine: str = 'python') -> int:
+    """Simulate the full animation into a trace file; returns the frame count."""
+    writer = None
+    try:
+        for snapshot in simulate(engine):
+            if writer is None:
+                writer = TraceWriter(path, list(snapshot.agents))
+            writer.append(snapshot.frame, snapshot.phase, snapshot.agents)
+    finally:
+        if writer is not None:
+            writer.close()
+    return writer.frame_count if writer is not None else 0
+
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+class TraceReader:
+    """Memory-mapped, random-access view of a trace file."""
+
+    def __init__(self, path: str):
+        self._fp = open(path, 'rb')
+        self._map = mmap.mmap(self._fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.agent_count, self.frame_count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} constellation trace")
+        offset = HEADER.size
+
+        (names_length,) = NAMES_LENGTH.unpack_from(self._map, offset)
+        offset += NAMES_LENGTH.size
+        self.type_names = bytes(self._map[offset:offset + names_length]).decode().split(',')
+        offset += _pad4(names_length)
+
+        self.agent_types = []
+        self.agent_indices = []
+        for _ in range(self.agent_count):
+            code, index = AGENT_ENTRY.unpack_from(self._map, offset)
+            self.agent_types.append(self.type_names[code])
+            self.agent_indices.append(index)
+            offset += AGENT_ENTRY.size
+
+        self._frames_offset = offset
+        self._floats = struct.Struct(f'<{self.agent_count * FLOATS_PER_AGENT}f')
+        self._record_size = FRAME_HEADER.size + self._floats.size
+
+    def __enter__(self) -> "TraceReader":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.frame_count
+
+    def __getitem__(self, i: int) -> FrameSnapshot:
+        if not 0 <= i < self.frame_count:
+            raise IndexError(i)
+        offset = self._frames_offset + i * self._record_size
+        frame, phase_code = FRAME_HEADER.unpack_from(self._map, offset)
+        values = self._floats.unpack_from(self._map, offset + FRAME_HEADER.size)
+        agents = tuple(
+            Agent(x=values[k], y=values[k + 1], vx=values[k + 2], vy=values[k + 3],
+                  agent_type=agent_type, index=index)
+            for k, agent_type, index in zip(range(0, len(values), FLOATS_PER_AGENT),
+                                            self.agent_types, self.agent_indices)
+        )
+        return FrameSnapshot(frame, PHASES[phase_code], agents)
+
+    def __iter__(self) -> Iterator[FrameSnapshot]:
+        for i in range(self.frame_count):
+            yield self[i]
+
+    def close(self) -> None:
+        self._map.close()
+        self._fp.close()
+
+
+def replay(path: str, output: str = 'aegis_constellation.gif', workers: int = 1,
+           preview: str = 'aegis_constellation_preview.png') -> int:
+    """Render a trace to a GIF (and preview PNG); returns the frame count."""
+    sinks = [GifSink(output, FRAME_DURATION, loop=0)]
+    if preview:
+        sinks.append(StillSink({PREVIEW_FRAME: preview}))
+    with TraceReader(path) as trace, OutputPipeline(sinks) as outputs:
+        for img in render_frames(render_snapshot, trace, workers):
+            outputs.append(img)
+    return outputs.frame_count
+
+
+# ============================================================================
+# MAIN
+# ============================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Record or replay AEGIS Constellation traces.")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rec = commands.add_parser('record', help="simulate and write a trace")
+    rec.add_argument('trace')
+    rec.add_argument('--engine', choices=['python', 'numpy'], default='python')
+    rec.add_argument('--seed', type=int, help="random seed for a reproducible swarm")
+
+    ren = commands.add_parser('render', help="render a trace through draw_frame")
+    ren.add_argument('trace')
+    ren.add_argument('--output', default='aegis_constellation.gif')
+    ren.add_argument('--preview', default='aegis_constellation_preview.png')
+    ren.add_argument('--workers', type=int, default=1, metavar='N')
+
+    args = parser.parse_args(argv)
+    if args.command == 'record':
+        if args.seed is not None:
+            random.seed(args.seed)
+        count = record(args.trace, args.engine)
+        print(f"Recorded {count} frames to {args.trace}")
+    else:
+        count = replay(args.trace, args.output, args.workers, args.preview)
+        print(f"Rendered {count} frames from {args.trace} to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,8 +5,26 @@ A visually striking snake game animation for GitHub profile README.
 AEGIS OS agents defend against a digital serpent threat.
 """
 from PIL import Image, ImageDraw, ImageFilter
+from collections import OrderedDict, deque, namedtuple
+import argparse
+import itertools
+import os
 import random
 import math
+import sys
+
+import numpy as np
+
+from background_cache import BACKGROUNDS
+from framebuffer import Framebuffer, Stamp, shape_stamp
+from output_pipeline import GifSink, OutputPipeline, add_output_arguments, extra_sinks
+from palette import build_palette
+from parallel_render import render_frames
+from profiling import Profiler, add_profile_argument
+from render_cache import RenderCache, cache_key
+from snake_body import SnakeBody
+from snake_planner import DistanceField
+from svg_backend import SvgAnimation, add_svg_argument, hex_color, report_size, tap
 
 # ============================================================================
 # CONFIGURATION
@@ -17,6 +35,14 @@ WIDTH, HEIGHT = 83, 7
 CELL_SIZE = 10
 TOTAL_FRAMES = 180
 FRAME_DURATION = 50  # milliseconds
+OUTPUT = 'aegis_snake.gif'
+
+# Modules whose source determines the rendered bytes (for the render cache)
+RENDER_MODULES = ('background_cache', 'gif_stream', 'output_pipeline', 'palette', 'parallel_render',
+                  'framebuffer', 'snake_body', 'snake_planner')
+
+# Functions timed by --profile
+PROFILED = ('draw_frame', 'draw_frame_atlas', 'draw_frame_numpy', 'draw_glow_circle', 'update_projectiles')
 
 # AEGIS Brand Colors
 COLORS = {
@@ -38,6 +64,58 @@ AGENTS = [
     {'name': 'Atlas', 'color': (50, 220, 100), 'glow': (80, 255, 130), 'behavior': 'tracker'},
 ]
 
+# Color themes: overrides of COLORS, plus the color glows and trails fade
+# from. Frames are rendered once in the default theme; every theme shares
+# its palette layout, so a variant only swaps the frames' color table.
+DEFAULT_THEME = 'dark'
+THEMES = {
+    'dark': {
+        'glow_base': (0, 0, 0),
+    },
+    'light': {
+        'background': (246, 248, 250),
+        'grid_line': (222, 226, 232),
+        'snake_head': (200, 40, 40),
+        'snake_tail': (225, 175, 175),
+        'particle': (225, 140, 30),
+        'glow_base': (246, 248, 250),
+    },
+}
+
+# Fixed global palette: the colors drawn solid, then the ramps drawn by glows,
+# trails, particles and the snake gradient (the board colors get one-step
+# ramps for blends that come out close to them). Frames are mapped onto it
+# once; only exact pixels take a solid entry, so a theme recolors each
+# entry's pixels and nothing else.
+SOLID_COLORS = ('background', 'grid_line', 'snake_head')
+EYE_COLOR = (255, 255, 200)
+HEAD_GLOW = (255, 100, 100)
+RAMP_STEPS = 16
+
+
+def _highlight(color):
+    return tuple(min(255, c + 60) for c in color)
+
+
+def theme_palette(theme):
+    """The global palette with a theme's colors, entry for entry"""
+    colors = dict(COLORS, **THEMES[theme])
+    base = colors['glow_base']
+    return build_palette(
+        colors=[colors[name] for name in SOLID_COLORS]
+        + [a['color'] for a in AGENTS] + [a['glow'] for a in AGENTS]
+        + [_highlight(a['color']) for a in AGENTS]
+        + [EYE_COLOR, (255, 255, 255)],
+        ramps=[(base, c, RAMP_STEPS) for c in
+               [a['color'] for a in AGENTS] + [a['glow'] for a in AGENTS]
+               + [colors['particle'], HEAD_GLOW]]
+        + [(colors['snake_tail'], colors['snake_head'], RAMP_STEPS)]
+        + [(colors[name], colors[name], 1) for name in ('background', 'grid_line')],
+    )
+
+
+PALETTE = theme_palette(DEFAULT_THEME)
+
 # ============================================================================
 # GAME CLASSES
 # ============================================================================
@@ -56,11 +134,20 @@ class Agent:
 
     def get_pulse_intensity(self, frame):
         """Calculate pulsing glow intensity"""
-        return 0.7 + 0.3 * math.sin(self.pulse_phase + frame * 0.15)
+        return pulse_intensity(self.pulse_phase, frame)
+
+
+def pulse_intensity(pulse_phase, frame):
+    """Pulsing glow intensity for an agent with the given phase offset"""
+    return 0.7 + 0.3 * math.sin(pulse_phase + frame * 0.15)
+
+
+_projectile_ids = itertools.count()
 
 
 class Projectile:
     def __init__(self, x, y, dx, dy, color, shooter):
+        self.ident = next(_projectile_ids)  # Lets the SVG backend follow it between frames
         self.x = x
         self.y = y
         self.dx = dx
@@ -68,23 +155,214 @@ class Projectile:
         self.color = color
         self.shooter = shooter
         self.life = 150
-        self.trail = []  # Store previous positions for trail effect
+        self.trail = deque(maxlen=5)  # Previous positions for the trail effect
 
     def update_trail(self):
         self.trail.append((self.x, self.y))
-        if len(self.trail) > 5:
-            self.trail.pop(0)
 
 
 class Particle:
-    def __init__(self, x, y, dx, dy, color, life=20):
+    """One spark of a small ParticlePool"""
+    __slots__ = ('x', 'y', 'dx', 'dy', 'life', 'max_life', 'color')
+
+    def __init__(self, x, y, dx, dy, life, max_life, color):
         self.x = x
         self.y = y
         self.dx = dx
         self.dy = dy
-        self.color = color
         self.life = life
-        self.max_life = life
+        self.max_life = max_life
+        self.color = color  # Index into the pool's colors
+
+
+class ParticlePool:
+    """Spark particles, in a list while there are few and in arrays when there are many.
+
+    A game's few dozen sparks are Particle objects updated in a plain loop,
+    which beats the fixed cost of a dozen small array operations. A burst
+    that takes the pool past ARRAY_MIN moves it into preallocated
+    struct-of-arrays buffers: live particles occupy slots [0, count), dead
+    ones are compacted out and every update is a handful of array
+    operations, so bursts of 100k particles cost about as much per frame as
+    a few thousand. Once compaction leaves LIST_MAX or fewer it moves back.
+    Either way particles stay in spawn order, which is the order they are
+    drawn in.
+
+    Bursts into the list draw each direction from `random`, which is
+    cheaper than a NumPy call for a handful of particles; bursts into the
+    arrays draw them from `rng`, by default a NumPy generator seeded from
+    `random` when first needed.
+    """
+
+    LIST_MAX = 64
+    ARRAY_MIN = 256
+
+    FIELDS = (('x', np.float64), ('y', np.float64), ('dx', np.float64), ('dy', np.float64),
+              ('life', np.int32), ('max_life', np.int32), ('color', np.uint8))
+
+    def __init__(self, capacity=256, rng=None):
+        self.particles = []  # Particle objects while the pool is small, else None
+        self.count = 0  # Live particles in the arrays
+        self.capacity = 0
+        self._soonest = 0  # updates until the first live particle in the arrays expires
+        self.rng = rng
+        self.colors = []  # RGB per color index
+        self._color_index = {}
+        self._grow(capacity)
+
+    def __len__(self):
+        return self.count if self.particles is None else len(self.particles)
+
+    def _grow(self, capacity):
+        for name, dtype in self.FIELDS:
+            buffer = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                buffer[:self.count] = getattr(self, name)[:self.count]
+            setattr(self, name, buffer)
+        self.capacity = capacity
+
+    def _buffers(self):
+        return [getattr(self, name) for name, _ in self.FIELDS]
+
+    def _to_arrays(self):
+        """Move the particles from the list into the arrays"""
+        particles, self.particles = self.particles, None
+        if len(particles) > self.capacity:
+            self._grow(max(len(particles), self.capacity * 2))
+        for name, _ in self.FIELDS:
+            getattr(self, name)[:len(particles)] = [getattr(p, name) for p in particles]
+        self.count = len(particles)
+        self._soonest = int(self.life[:self.count].min()) if self.count else 0
+
+    def _to_list(self):
+        """Move the particles from the arrays back into a list"""
+        live = slice(0, self.count)
+        self.particles = [Particle(*values) for values in zip(*(buffer[live].tolist()
+                                                                for buffer in self._buffers()))]
+        self.count = 0
+
+    def _color_code(self, color):
+        code = self._color_index.get(color)
+        if code is None:
+            code = self._color_index[color] = len(self.colors)
+            self.colors.append(color)
+        return code
+
+    def burst(self, x, y, count, min_speed, max_speed, color, life=20):
+        """Spawn `count` particles at (x, y) flying off in random directions"""
+        code = self._color_code(tuple(color))
+        if self.particles is not None and len(self.particles) + count <= self.ARRAY_MIN:
+            for _ in range(count):
+                angle = random.uniform(0, math.pi * 2)
+                speed = random.uniform(min_speed, max_speed)
+                self.particles.append(Particle(x, y, math.cos(angle) * speed, math.sin(angle) * speed,
+                                               life, life, code))
+            return
+        if self.particles is not None:
+            self._to_arrays()
+        if self.rng is None:
+            self.rng = np.random.default_rng(random.getrandbits(64))
+        angle = self.rng.uniform(0, math.pi * 2, count)
+        speed = self.rng.uniform(min_speed, max_speed, count)
+        end = self.count + count
+        if end > self.capacity:
+            self._grow(max(end, self.capacity * 2))
+        new = slice(self.count, end)
+        self.x[new] = x
+        self.y[new] = y
+        self.dx[new] = np.cos(angle) * speed
+        self.dy[new] = np.sin(angle) * speed
+        self.life[new] = life
+        self.max_life[new] = life
+        self.color[new] = code
+        self._soonest = min(self._soonest, life) if self.count else life
+        self.count = end
+
+    def update(self):
+        """Move every particle, age it, and drop the expired ones"""
+        if self.particles is not None:
+            # Survivors are collected into a new list rather than removed one by one
+            alive = []
+            for p in self.particles:
+                p.x += p.dx
+                p.y += p.dy
+                p.life -= 1
+                if p.life > 0:
+                    alive.append(p)
+            self.particles = alive
+            return
+        live = slice(0, self.count)
+        self.x[live] += self.dx[live]
+        self.y[live] += self.dy[live]
+        self.life[live] -= 1
+        # Every life ticks down together, so nothing expires before the
+        # shortest one does and the buffers need no scan until then
+        self._soonest -= 1
+        if self._soonest > 0:
+            return
+        keep = np.flatnonzero(self.life[live] > 0)
+        # Stable compaction, so the survivors keep their drawing order
+        for buffer in self._buffers():
+            buffer[:len(keep)] = buffer[keep]
+        self.count = len(keep)
+        if self.count <= self.LIST_MAX:
+            self._to_list()
+        else:
+            self._soonest = int(self.life[:self.count].min())
+
+    def draw_list(self, cell_size, width, height):
+        """(cx, cy, size, r, g, b) rows for the particles on a canvas, in drawing order.
+
+        Of identical rows only the last is kept: drawing the same disc again
+        later covers the earlier one, so the frame does not change.
+        """
+        if self.particles is not None:
+            return self._draw_list_small(cell_size, width, height)
+        live = slice(0, self.count)
+        alpha = self.life[live] / self.max_life[live]
+        cx = (self.x[live] * cell_size + cell_size // 2).astype(np.int64)
+        cy = (self.y[live] * cell_size + cell_size // 2).astype(np.int64)
+        size = (3 * alpha).astype(np.int64)
+        rgb = (np.array(self.colors, dtype=np.float64)[self.color[live]]
+               * alpha[:, None]).astype(np.int64)
+
+        # Cull off-canvas particles, then deduplicate on one packed integer
+        # per row (much faster than np.unique over rows), keeping the last
+        # of each in order
+        on = np.flatnonzero((cx >= -3) & (cx < width + 3) & (cy >= -3) & (cy < height + 3))
+        keys = ((rgb[on, 0] << 50) | (rgb[on, 1] << 42) | (rgb[on, 2] << 34)
+                | (size[on] << 32) | ((cy[on] + 4) << 16) | (cx[on] + 4))
+        _, first = np.unique(keys[::-1], return_index=True)
+        rows = on[np.sort(len(keys) - 1 - first)]
+        return np.column_stack([cx[rows], cy[rows], size[rows], rgb[rows]]).astype(np.int32)
+
+    def _draw_list_small(self, cell_size, width, height):
+        """draw_list computed particle by particle, with the same float arithmetic"""
+        if not self.particles:
+            return np.empty((0, 6), dtype=np.int32)
+        half = cell_size // 2
+        rows = {}
+        for p in self.particles:
+            alpha = p.life / p.max_life
+            cx, cy = int(p.x * cell_size + half), int(p.y * cell_size + half)
+            if -3 <= cx < width + 3 and -3 <= cy < height + 3:
+                r, g, b = self.colors[p.color]
+                row = (cx, cy, int(3 * alpha), int(r * alpha), int(g * alpha), int(b * alpha))
+                # Re-inserting moves a repeated row to its latest position
+                if row in rows:
+                    del rows[row]
+                rows[row] = None
+        return np.array(list(rows), dtype=np.int32).reshape(-1, 6)
+
+
+# ============================================================================
+# FRAME SNAPSHOTS
+# ============================================================================
+
+# Render-only copies of the game state, small enough to send to a worker
+AgentView = namedtuple('AgentView', 'x y color glow pulse_phase')
+ProjectileView = namedtuple('ProjectileView', 'ident x y color trail')
+FrameState = namedtuple('FrameState', 'frame agents projectiles particles snake snake_dir')
 
 
 # ============================================================================
@@ -93,10 +371,11 @@ class Particle:
 
 agents = []
 projectiles = []
-particles = []
-snake = []
+particles = ParticlePool()
+snake = SnakeBody()
 snake_dir = (1, 0)
 score = 0
+planner = None  # DistanceField to the agents when the snake hunts them (--plan)
 
 def init_game():
     global agents, projectiles, particles, snake, snake_dir, score
@@ -117,10 +396,10 @@ def init_game():
         ))
 
     projectiles = []
-    particles = []
+    particles = ParticlePool()
 
     # Initialize snake
-    snake = [(5 - i, 3) for i in range(8)]
+    snake = SnakeBody((5 - i, 3) for i in range(8))
     snake_dir = (1, 0)
     score = 0
 
@@ -129,25 +408,58 @@ def init_game():
 # DRAWING FUNCTIONS
 # ============================================================================
 
-def draw_glow_circle(draw, cx, cy, radius, color, intensity=1.0):
-    """Draw a soft glow effect"""
+# Glow stamps, keyed by (radius, color, intensity level); least recently used
+# stamps are dropped once there are more than GLOW_STAMP_LIMIT
+GLOW_LEVELS = 16
+GLOW_STAMP_LIMIT = 128
+_glow_stamps = OrderedDict()
+
+
+def get_glow_stamp(radius, color, level):
+    """Pre-rasterized RGBA glow: concentric rings whose alphas accumulate"""
+    key = (radius, color, level)
+    stamp = _glow_stamps.get(key)
+    if stamp is not None:
+        _glow_stamps.move_to_end(key)
+        return stamp
+
+    intensity = level / GLOW_LEVELS
+    glow_color = tuple(min(255, int(c * intensity)) for c in color)
+    half = math.ceil(radius)
+    size = half * 2 + 1
+    stamp = Image.new('RGBA', (size, size), glow_color + (0,))
+    ring = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    ring_draw = ImageDraw.Draw(ring)
     for r in range(int(radius), 0, -1):
         alpha = int(40 * intensity * (r / radius))
-        glow_color = tuple(min(255, int(c * intensity)) for c in color)
-        draw.ellipse(
-            [cx - r, cy - r, cx + r, cy + r],
-            fill=glow_color
-        )
+        ring_draw.rectangle([0, 0, size, size], fill=(0, 0, 0, 0))
+        ring_draw.ellipse([half - r, half - r, half + r, half + r], fill=glow_color + (alpha,))
+        stamp.alpha_composite(ring)
+
+    _glow_stamps[key] = stamp
+    if len(_glow_stamps) > GLOW_STAMP_LIMIT:
+        _glow_stamps.popitem(last=False)
+    return stamp
 
 
-def draw_agent(draw, agent, frame):
+def draw_glow_circle(img, cx, cy, radius, color, intensity=1.0):
+    """Blend a soft glow centred on (cx, cy) into img"""
+    level = max(0, min(GLOW_LEVELS, round(intensity * GLOW_LEVELS)))
+    if level == 0:
+        return
+    stamp = get_glow_stamp(radius, tuple(color), level)
+    half = stamp.width // 2
+    img.paste(stamp, (round(cx) - half, round(cy) - half), stamp)
+
+
+def draw_agent(img, draw, agent, frame):
     """Draw an agent with shield-like appearance and glow"""
     cx = agent.x * CELL_SIZE + CELL_SIZE // 2
     cy = agent.y * CELL_SIZE + CELL_SIZE // 2
-    pulse = agent.get_pulse_intensity(frame)
+    pulse = pulse_intensity(agent.pulse_phase, frame)
 
     # Outer glow
-    draw_glow_circle(draw, cx, cy, CELL_SIZE * 1.2, agent.glow, pulse * 0.4)
+    draw_glow_circle(img, cx, cy, CELL_SIZE * 1.2, agent.glow, pulse * 0.4)
 
     # Diamond shape (AEGIS shield)
     size = CELL_SIZE // 2 - 1
@@ -169,11 +481,10 @@ def draw_agent(draw, agent, frame):
         (cx, cy + inner_size),
         (cx - inner_size, cy),
     ]
-    highlight = tuple(min(255, c + 60) for c in agent.color)
-    draw.polygon(inner_diamond, fill=highlight)
+    draw.polygon(inner_diamond, fill=_highlight(agent.color))
 
 
-def draw_snake(draw, frame):
+def draw_snake(img, draw, snake, snake_dir, frame):
     """Draw snake with gradient and glow effects"""
     if not snake:
         return
@@ -203,22 +514,22 @@ def draw_snake(draw, frame):
         if segment_idx == 0:
             # Pulsing threat glow
             pulse = 0.6 + 0.4 * math.sin(frame * 0.2)
-            draw_glow_circle(draw, cx, cy, CELL_SIZE, (255, 100, 100), pulse * 0.3)
+            draw_glow_circle(img, cx, cy, CELL_SIZE, HEAD_GLOW, pulse * 0.3)
 
             # Eyes
             eye_offset = 2
             if snake_dir[0] > 0:  # Moving right
-                draw.ellipse([cx + eye_offset - 1, cy - 2, cx + eye_offset + 1, cy], fill=(255, 255, 200))
-                draw.ellipse([cx + eye_offset - 1, cy + 1, cx + eye_offset + 1, cy + 3], fill=(255, 255, 200))
+                draw.ellipse([cx + eye_offset - 1, cy - 2, cx + eye_offset + 1, cy], fill=EYE_COLOR)
+                draw.ellipse([cx + eye_offset - 1, cy + 1, cx + eye_offset + 1, cy + 3], fill=EYE_COLOR)
             elif snake_dir[0] < 0:  # Moving left
-                draw.ellipse([cx - eye_offset - 1, cy - 2, cx - eye_offset + 1, cy], fill=(255, 255, 200))
-                draw.ellipse([cx - eye_offset - 1, cy + 1, cx - eye_offset + 1, cy + 3], fill=(255, 255, 200))
+                draw.ellipse([cx - eye_offset - 1, cy - 2, cx - eye_offset + 1, cy], fill=EYE_COLOR)
+                draw.ellipse([cx - eye_offset - 1, cy + 1, cx - eye_offset + 1, cy + 3], fill=EYE_COLOR)
             elif snake_dir[1] != 0:  # Moving vertically
-                draw.ellipse([cx - 2, cy - 1, cx, cy + 1], fill=(255, 255, 200))
-                draw.ellipse([cx + 1, cy - 1, cx + 3, cy + 1], fill=(255, 255, 200))
+                draw.ellipse([cx - 2, cy - 1, cx, cy + 1], fill=EYE_COLOR)
+                draw.ellipse([cx + 1, cy - 1, cx + 3, cy + 1], fill=EYE_COLOR)
 
 
-def draw_projectile(draw, proj):
+def draw_projectile(img, draw, proj):
     """Draw projectile with trail effect"""
     # Draw trail
     for i, (tx, ty) in enumerate(proj.trail):
@@ -234,7 +545,7 @@ def draw_projectile(draw, proj):
     cy = proj.y * CELL_SIZE + CELL_SIZE // 2
 
     # Glow
-    draw_glow_circle(draw, cx, cy, 6, proj.color, 0.5)
+    draw_glow_circle(img, cx, cy, 6, proj.color, 0.5)
 
     # Core
     draw.ellipse([cx - 2, cy - 2, cx + 2, cy + 2], fill=proj.color)
@@ -243,50 +554,328 @@ def draw_projectile(draw, proj):
     draw.ellipse([cx - 1, cy - 1, cx + 1, cy + 1], fill=(255, 255, 255))
 
 
-def draw_particle(draw, particle):
-    """Draw explosion/spark particle"""
-    alpha = particle.life / particle.max_life
-    size = int(3 * alpha)
-    color = tuple(int(c * alpha) for c in particle.color)
-
-    cx = int(particle.x * CELL_SIZE + CELL_SIZE // 2)
-    cy = int(particle.y * CELL_SIZE + CELL_SIZE // 2)
+# Particle counts from which draw_particles switches to array writes
+PARTICLE_ARRAY_MIN = 64
+_disc_offsets = {}
+
+
+def disc_offsets(size):
+    """Pixel offsets (dx, dy arrays) covered by draw.ellipse of radius `size` around a point"""
+    offsets = _disc_offsets.get(size)
+    if offsets is None:
+        mask = Image.new('L', (size * 2 + 1, size * 2 + 1), 0)
+        ImageDraw.Draw(mask).ellipse([0, 0, size * 2, size * 2], fill=255)
+        ys, xs = np.nonzero(np.asarray(mask))
+        offsets = _disc_offsets[size] = (xs - size, ys - size)
+    return offsets
+
+
+def draw_particles(img, particles):
+    """Draw explosion/spark particles from FrameState rows, in row order.
+
+    Large batches are written straight into a pixel array: every pixel a
+    disc covers is collected, and each pixel takes the color of the last
+    row covering it, as drawing the discs one by one leaves it. A few
+    particles are cheaper to draw.
+    """
+    if len(particles) < PARTICLE_ARRAY_MIN:
+        draw = ImageDraw.Draw(img)
+        for cx, cy, size, r, g, b in particles.tolist():
+            draw.ellipse([cx - size, cy - size, cx + size, cy + size], fill=(r, g, b))
+        return img
+    pixels = np.array(img)
+    height, width = pixels.shape[:2]
+    index, order = [], []
+    for size in np.unique(particles[:, 2]).tolist():
+        rows = np.flatnonzero(particles[:, 2] == size)
+        dx, dy = disc_offsets(size)
+        x = particles[rows, 0, None] + dx
+        y = particles[rows, 1, None] + dy
+        inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+        index.append(y[inside] * width + x[inside])
+        order.append(np.broadcast_to(rows[:, None], inside.shape)[inside])
+    index, order = np.concatenate(index), np.concatenate(order)
+    last = np.full(width * height, -1, dtype=np.int64)
+    np.maximum.at(last, index, order)
+    shown = order == last[index]
+    pixels.reshape(width * height, -1)[index[shown]] = particles[order[shown], 3:6]
+    return Image.fromarray(pixels)
+
+
+def draw_frame(state):
+    """Draw a complete frame from a FrameState, mapped onto the global palette"""
+    # Background with grid lines every 5 columns and every row
+    img = BACKGROUNDS.get((WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE), COLORS['background'],
+                          COLORS['grid_line'], CELL_SIZE * 5, CELL_SIZE)
 
-    draw.ellipse([cx - size, cy - size, cx + size, cy + size], fill=color)
+    # Particles (behind everything)
+    img = draw_particles(img, state.particles)
+    draw = ImageDraw.Draw(img)
 
+    # Projectiles
+    for proj in state.projectiles:
+        draw_projectile(img, draw, proj)
 
-def draw_grid(draw):
-    """Draw subtle grid lines"""
-    for x in range(0, WIDTH * CELL_SIZE, CELL_SIZE * 5):
-        draw.line([(x, 0), (x, HEIGHT * CELL_SIZE)], fill=COLORS['grid_line'], width=1)
-    for y in range(0, HEIGHT * CELL_SIZE, CELL_SIZE):
-        draw.line([(0, y), (WIDTH * CELL_SIZE, y)], fill=COLORS['grid_line'], width=1)
+    # Snake
+    draw_snake(img, draw, state.snake, state.snake_dir, state.frame)
 
+    # Agents (on top)
+    for agent in state.agents:
+        draw_agent(img, draw, agent, state.frame)
 
-def draw_frame(frame_num):
-    """Draw a complete frame"""
-    img = Image.new("RGB", (WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE), COLORS['background'])
-    draw = ImageDraw.Draw(img)
+    return PALETTE.map(img)
 
-    # Grid
-    draw_grid(draw)
 
-    # Particles (behind everything)
-    for p in particles:
-        draw_particle(draw, p)
+# ============================================================================
+# SPRITE ATLAS
+# ============================================================================
 
-    # Projectiles
-    for proj in projectiles:
-        draw_projectile(draw, proj)
+class SpriteAtlas:
+    """Pre-rasterized RGBA sprites for agents, snake segments and projectiles.
+
+    Each sprite is drawn once with the same ImageDraw calls draw_agent,
+    draw_snake and draw_projectile use, centred in a square canvas. Opaque
+    shapes get alpha 255 and glow pixels keep the glow stamp's alpha, so
+    pasting a sprite with its own alpha as the mask gives the same pixels
+    as drawing the entity. Sprites are built on first use and kept.
+    """
+
+    def __init__(self):
+        self.sprites = {}
+
+    def _get(self, key, build):
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self.sprites[key] = build()
+        return sprite
+
+    @staticmethod
+    def _glow(radius, color, level):
+        """Transparent canvas, or the glow stamp, to draw a sprite on"""
+        half = math.ceil(radius)
+        if level == 0:
+            return Image.new('RGBA', (half * 2 + 1, half * 2 + 1), (0, 0, 0, 0)), half
+        return get_glow_stamp(radius, tuple(color), level).copy(), half
+
+    def agent(self, color, glow, level):
+        def build():
+            sprite, c = self._glow(CELL_SIZE * 1.2, glow, level)
+            draw = ImageDraw.Draw(sprite)
+            size = CELL_SIZE // 2 - 1
+            draw.polygon([(c, c - size), (c + size, c), (c, c + size), (c - size, c)],
+                         fill=color, outline=glow)
+            inner = size // 2
+            draw.polygon([(c, c - inner), (c + inner, c), (c, c + inner), (c - inner, c)],
+                         fill=_highlight(color))
+            return sprite
+        return self._get(('agent', color, glow, level), build)
+
+    def segment(self, color):
+        def build():
+            size = CELL_SIZE // 2 - 1
+            sprite = Image.new('RGBA', (size * 2 + 1, size * 2 + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(sprite).ellipse([0, 0, size * 2, size * 2], fill=color)
+            return sprite
+        return self._get(('segment', color), build)
+
+    def head(self, eyes, level):
+        """Head, pulse glow and eyes; `eyes` is 'right', 'left' or 'vertical'"""
+        def build():
+            sprite, c = self._glow(CELL_SIZE, HEAD_GLOW, level)
+            size = CELL_SIZE // 2 + 1
+            box = [c - size, c - size, c + size, c + size]
+            # The glow is blended over the head: do that on an opaque copy,
+            # then keep the result wherever the head is
+            head = Image.new('RGB', sprite.size)
+            ImageDraw.Draw(head).ellipse(box, fill=COLORS['snake_head'])
+            if level:
+                head.paste(sprite, (0, 0), sprite)
+            mask = Image.new('L', sprite.size, 0)
+            ImageDraw.Draw(mask).ellipse(box, fill=255)
+            sprite.paste(head.convert('RGBA'), (0, 0), mask)
+
+            draw = ImageDraw.Draw(sprite)
+            if eyes == 'right':
+                draw.ellipse([c + 1, c - 2, c + 3, c], fill=EYE_COLOR)
+                draw.ellipse([c + 1, c + 1, c + 3, c + 3], fill=EYE_COLOR)
+            elif eyes == 'left':
+                draw.ellipse([c - 3, c - 2, c - 1, c], fill=EYE_COLOR)
+                draw.ellipse([c - 3, c + 1, c - 1, c + 3], fill=EYE_COLOR)
+            elif eyes == 'vertical':
+                draw.ellipse([c - 2, c - 1, c, c + 1], fill=EYE_COLOR)
+                draw.ellipse([c + 1, c - 1, c + 3, c + 1], fill=EYE_COLOR)
+            return sprite
+        return self._get(('head', eyes, level), build)
+
+    def projectile(self, color):
+        def build():
+            sprite, c = self._glow(6, color, round(0.5 * GLOW_LEVELS))
+            draw = ImageDraw.Draw(sprite)
+            draw.ellipse([c - 2, c - 2, c + 2, c + 2], fill=color)
+            draw.ellipse([c - 1, c - 1, c + 1, c + 1], fill=(255, 255, 255))
+            return sprite
+        return self._get(('projectile', color), build)
+
+    def trail(self, color, size):
+        def build():
+            sprite = Image.new('RGBA', (size * 2 + 1, size * 2 + 1), (0, 0, 0, 0))
+            ImageDraw.Draw(sprite).ellipse([0, 0, size * 2, size * 2], fill=color)
+            return sprite
+        return self._get(('trail', color, size), build)
+
+
+ATLAS = SpriteAtlas()
+
+
+def blit(core, sprite, cx, cy):
+    """Paste a sprite centred on (cx, cy) into an image core, its alpha as the mask.
+
+    Goes straight to the core paste (which clips to the image like
+    Image.paste does): the per-call checks of Image.paste cost more than
+    pasting a small sprite. The core is Pillow's internal API, so the
+    workflow pins Pillow and tests/test_renderers.py checks the atlas
+    frames against draw_frame.
+    """
+    half = sprite.width // 2
+    left, top = cx - half, cy - half
+    sprite_core = sprite.im
+    core.paste(sprite_core, (left, top, left + sprite.width, top + sprite.height), sprite_core)
+
+
+def glow_level(intensity):
+    """The glow stamp level draw_glow_circle uses for an intensity"""
+    return max(0, min(GLOW_LEVELS, round(intensity * GLOW_LEVELS)))
+
+
+def draw_frame_atlas(state):
+    """draw_frame assembled from ATLAS sprites; the pixels are the same"""
+    img = BACKGROUNDS.get((WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE), COLORS['background'],
+                          COLORS['grid_line'], CELL_SIZE * 5, CELL_SIZE)
+    img = draw_particles(img, state.particles)
+    if img.readonly:
+        img = img.copy()  # Shares memory with the particle array otherwise
+    core = img.im
+    half_cell = CELL_SIZE // 2
+
+    for proj in state.projectiles:
+        count = len(proj.trail)
+        for i, (tx, ty) in enumerate(proj.trail):
+            alpha = (i + 1) / count
+            trail_color = tuple(int(c * alpha * 0.5) for c in proj.color)
+            blit(core, ATLAS.trail(trail_color, int(2 * alpha)),
+                 tx * CELL_SIZE + half_cell, ty * CELL_SIZE + half_cell)
+        blit(core, ATLAS.projectile(proj.color), proj.x * CELL_SIZE + half_cell, proj.y * CELL_SIZE + half_cell)
+
+    snake = state.snake
+    last = max(len(snake) - 1, 1)
+    tail, head = COLORS['snake_tail'], COLORS['snake_head']
+    for segment_idx in range(len(snake) - 1, 0, -1):
+        progress = segment_idx / last
+        color = tuple(int(t + (h - t) * (1 - progress)) for t, h in zip(tail, head))
+        sx, sy = snake[segment_idx]
+        blit(core, ATLAS.segment(color), sx * CELL_SIZE + half_cell, sy * CELL_SIZE + half_cell)
+    if snake:
+        dx, dy = state.snake_dir
+        eyes = 'right' if dx > 0 else 'left' if dx < 0 else 'vertical' if dy else None
+        pulse = 0.6 + 0.4 * math.sin(state.frame * 0.2)
+        sx, sy = snake[0]
+        blit(core, ATLAS.head(eyes, glow_level(pulse * 0.3)),
+             sx * CELL_SIZE + half_cell, sy * CELL_SIZE + half_cell)
+
+    for agent in state.agents:
+        level = glow_level(pulse_intensity(agent.pulse_phase, state.frame) * 0.4)
+        blit(core, ATLAS.agent(agent.color, agent.glow, level),
+             agent.x * CELL_SIZE + half_cell, agent.y * CELL_SIZE + half_cell)
+
+    return PALETTE.map(img)
 
-    # Snake
-    draw_snake(draw, frame_num)
 
-    # Agents (on top)
-    for agent in agents:
-        draw_agent(draw, agent, frame_num)
+# ============================================================================
+# NUMPY FRAMEBUFFER
+# ============================================================================
 
-    return img
+_sprite_stamps = {}
+
+
+def sprite_stamp(sprite):
+    """Framebuffer stamp of an ATLAS sprite (the atlas keeps its sprites, so ids are stable)"""
+    stamp = _sprite_stamps.get(id(sprite))
+    if stamp is None:
+        stamp = _sprite_stamps[id(sprite)] = Stamp.sprite(sprite)
+    return stamp
+
+
+def disc_stamp(size):
+    """The pixels draw.ellipse fills for a disc of radius `size` around a point"""
+    return shape_stamp('ellipse', (-size, -size, size, size))
+
+
+def draw_frame_numpy(state):
+    """draw_frame rasterized into a Framebuffer; the pixels are the same.
+
+    Particles, trails and body segments are stamped as discs, the rest as
+    ATLAS sprites; every placement of a stamp is rasterized in one batch.
+    """
+    fb = Framebuffer(BACKGROUNDS.get((WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE), COLORS['background'],
+                                     COLORS['grid_line'], CELL_SIZE * 5, CELL_SIZE))
+    half_cell = CELL_SIZE // 2
+
+    # Particles: a stamp call per disc size, kept in their drawing order
+    particles = state.particles
+    for size in np.unique(particles[:, 2]).tolist():
+        rows = np.flatnonzero(particles[:, 2] == size)
+        group = particles[rows]
+        fb.stamp(disc_stamp(size), group[:, 0], group[:, 1], group[:, 3:6], order=rows)
+
+    for proj in state.projectiles:
+        count = len(proj.trail)
+        for i, (tx, ty) in enumerate(proj.trail):
+            alpha = (i + 1) / count
+            fb.place(disc_stamp(int(2 * alpha)), tx * CELL_SIZE + half_cell, ty * CELL_SIZE + half_cell,
+                     tuple(int(c * alpha * 0.5) for c in proj.color))
+        fb.place(sprite_stamp(ATLAS.projectile(proj.color)),
+                 proj.x * CELL_SIZE + half_cell, proj.y * CELL_SIZE + half_cell)
+
+    snake = state.snake
+    last = max(len(snake) - 1, 1)
+    tail, head = COLORS['snake_tail'], COLORS['snake_head']
+    segment = disc_stamp(CELL_SIZE // 2 - 1)
+    for segment_idx in range(len(snake) - 1, 0, -1):
+        progress = segment_idx / last
+        sx, sy = snake[segment_idx]
+        fb.place(segment, sx * CELL_SIZE + half_cell, sy * CELL_SIZE + half_cell,
+                 tuple(int(t + (h - t) * (1 - progress)) for t, h in zip(tail, head)))
+    if snake:
+        dx, dy = state.snake_dir
+        eyes = 'right' if dx > 0 else 'left' if dx < 0 else 'vertical' if dy else None
+        pulse = 0.6 + 0.4 * math.sin(state.frame * 0.2)
+        sx, sy = snake[0]
+        fb.place(sprite_stamp(ATLAS.head(eyes, glow_level(pulse * 0.3))),
+                 sx * CELL_SIZE + half_cell, sy * CELL_SIZE + half_cell)
+
+    for agent in state.agents:
+        level = glow_level(pulse_intensity(agent.pulse_phase, state.frame) * 0.4)
+        fb.place(sprite_stamp(ATLAS.agent(agent.color, agent.glow, level)),
+                 agent.x * CELL_SIZE + half_cell, agent.y * CELL_SIZE + half_cell)
+
+    return PALETTE.map(fb.image())
+
+
+# Frame renderers selectable with --renderer, by function name: they are
+# looked up when rendering starts, so --profile's wrappers are the ones called
+RENDERERS = {'draw': 'draw_frame', 'atlas': 'draw_frame_atlas', 'numpy': 'draw_frame_numpy'}
+
+
+def snapshot(frame_num):
+    """Capture everything draw_frame needs for the current game state"""
+    return FrameState(
+        frame=frame_num,
+        agents=tuple(AgentView(a.x, a.y, a.color, a.glow, a.pulse_phase) for a in agents),
+        projectiles=tuple(ProjectileView(p.ident, p.x, p.y, p.color, tuple(p.trail)) for p in projectiles),
+        particles=particles.draw_list(CELL_SIZE, WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE),
+        snake=tuple(snake),
+        snake_dir=snake_dir,
+    )
 
 
 # ============================================================================
@@ -374,23 +963,16 @@ def agent_fire(agent):
             agent.cooldown = 15
 
             # Spawn firing particles
-            for _ in range(3):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(0.1, 0.3)
-                particles.append(Particle(
-                    agent.x, agent.y,
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed,
-                    agent.glow,
-                    life=10
-                ))
+            particles.burst(agent.x, agent.y, 3, 0.1, 0.3, agent.glow, life=10)
 
 
 def update_projectiles():
     """Update all projectiles"""
     global score
 
-    for proj in list(projectiles):
+    # Survivors are collected into a new list rather than removed one by one
+    alive = []
+    for proj in projectiles:
         proj.update_trail()
         proj.x = (proj.x + proj.dx) % WIDTH
         proj.y = (proj.y + proj.dy) % HEIGHT
@@ -402,32 +984,20 @@ def update_projectiles():
             hit = True
             score += 1
             # Spawn hit particles
-            for _ in range(8):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(0.2, 0.5)
-                particles.append(Particle(
-                    proj.x, proj.y,
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed,
-                    COLORS['particle'],
-                    life=15
-                ))
+            particles.burst(proj.x, proj.y, 8, 0.2, 0.5, COLORS['particle'], life=15)
 
         # Remove expired or hit projectiles
         if proj.life <= 0 or hit:
             if proj.shooter:
                 proj.shooter.active_projectile = None
-            projectiles.remove(proj)
+        else:
+            alive.append(proj)
+    projectiles[:] = alive
 
 
 def update_particles():
     """Update particle effects"""
-    for p in list(particles):
-        p.x += p.dx
-        p.y += p.dy
-        p.life -= 1
-        if p.life <= 0:
-            particles.remove(p)
+    particles.update()
 
 
 def update_snake():
@@ -437,8 +1007,12 @@ def update_snake():
     if not snake:
         return
 
+    if planner is not None:
+        # Hunt: one step along a shortest path to the nearest agent
+        planner.retarget((agent.x, agent.y) for agent in agents)
+        snake_dir = planner.direction(snake[0], snake_dir) or snake_dir
     # Random direction changes (wandering behavior)
-    if random.random() < 0.06:
+    elif random.random() < 0.06:
         possible_dirs = [(1, 0), (-1, 0), (0, 1), (0, -1)]
         # Avoid immediate reversal
         opposite = (-snake_dir[0], -snake_dir[1])
@@ -448,15 +1022,13 @@ def update_snake():
     # Move snake
     head_x, head_y = snake[0]
     new_head = ((head_x + snake_dir[0]) % WIDTH, (head_y + snake_dir[1]) % HEIGHT)
-    snake.insert(0, new_head)
-    snake.pop()
+    snake.move(new_head)
 
     # Check if snake eats an agent
     for agent in agents:
         if (agent.x, agent.y) == new_head:
             # Snake grows
-            snake.append(snake[-1])
-            snake.append(snake[-1])
+            snake.grow(2)
 
             # Respawn agent
             agent.x = random.randint(10, WIDTH - 10)
@@ -465,25 +1037,79 @@ def update_snake():
             agent.cooldown = 20
 
             # Spawn "eaten" particles
-            for _ in range(12):
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(0.3, 0.6)
-                particles.append(Particle(
-                    new_head[0], new_head[1],
-                    math.cos(angle) * speed,
-                    math.sin(angle) * speed,
-                    agent.glow,
-                    life=20
-                ))
+            particles.burst(new_head[0], new_head[1], 12, 0.3, 0.6, agent.glow, life=20)
+
+
+# ============================================================================
+# SVG OUTPUT
+# ============================================================================
+
+def svg_agent_shape(color, glow):
+    """draw_agent as an SVG fragment around the cell centre (glow at mean pulse)"""
+    size = CELL_SIZE // 2 - 1
+    inner = size // 2
+    return (f'<circle r="{CELL_SIZE * 1.2:g}" fill="{hex_color(glow)}" opacity=".2"/>'
+            f'<path d="M0 -{size}L{size} 0L0 {size}L-{size} 0Z" fill="{hex_color(color)}" '
+            f'stroke="{hex_color(glow)}"/>'
+            f'<path d="M0 -{inner}L{inner} 0L0 {inner}L-{inner} 0Z" fill="{hex_color(_highlight(color))}"/>')
+
+
+def svg_segment_shape(index, length):
+    """One snake segment, coloured by its place in the body when it appeared"""
+    progress = index / max(length - 1, 1)
+    color = tuple(int(t + (h - t) * (1 - progress))
+                  for t, h in zip(COLORS['snake_tail'], COLORS['snake_head']))
+    shape = f'<circle r="{CELL_SIZE // 2 - 1 + (2 if index == 0 else 0)}" fill="{hex_color(color)}"/>'
+    if index == 0:
+        shape = f'<circle r="{CELL_SIZE}" fill="{hex_color(HEAD_GLOW)}" opacity=".15"/>' + shape
+    return shape
+
+
+def svg_projectile_shape(color):
+    return (f'<circle r="6" fill="{hex_color(color)}" opacity=".25"/>'
+            f'<circle r="2" fill="{hex_color(color)}"/><circle r="1" fill="#fff"/>')
+
+
+def record_svg(anim, state):
+    """Add a FrameState's agents, snake segments and projectiles to the SVG.
+
+    Everything moves at most one cell (diagonally) per frame; longer moves
+    wrap round the edge of the grid or respawn, and are drawn as jumps.
+    Particles, projectile trails and the snake's eyes are left out.
+    """
+    def centre(x, y):
+        return x * CELL_SIZE + CELL_SIZE // 2, y * CELL_SIZE + CELL_SIZE // 2
+
+    for proj in state.projectiles:
+        key = ('projectile', proj.ident)
+        if key not in anim:
+            anim.add_track(key, svg_projectile_shape(proj.color), jump=CELL_SIZE * 1.5, layer=0)
+        anim.place(state.frame, key, *centre(proj.x, proj.y))
+    # Tail first so the head is drawn on top
+    for index in range(len(state.snake) - 1, -1, -1):
+        key = ('snake', index)
+        if key not in anim:
+            anim.add_track(key, svg_segment_shape(index, len(state.snake)), jump=CELL_SIZE * 1.5, layer=1)
+        anim.place(state.frame, key, *centre(*state.snake[index]))
+    for index, agent in enumerate(state.agents):
+        key = ('agent', index)
+        if key not in anim:
+            anim.add_track(key, svg_agent_shape(agent.color, agent.glow), jump=CELL_SIZE * 1.5, layer=2)
+        anim.place(state.frame, key, *centre(agent.x, agent.y))
 
 
 # ============================================================================
 # MAIN
 # ============================================================================
 
-def main():
+def simulate(plan=False):
+    """Run the game, yielding a snapshot of every frame
+
+    With `plan` the snake hunts the nearest agent instead of wandering.
+    """
+    global planner
     init_game()
-    frames = []
+    planner = DistanceField(WIDTH, HEIGHT) if plan else None
 
     for frame_num in range(TOTAL_FRAMES):
         # Update game state
@@ -495,19 +1121,81 @@ def main():
         update_particles()
         update_snake()
 
-        # Draw frame
-        frames.append(draw_frame(frame_num))
-
-    # Save animation
-    frames[0].save(
-        'aegis_snake.gif',
-        save_all=True,
-        append_images=frames[1:],
-        duration=FRAME_DURATION,
-        loop=0,
-        optimize=True
-    )
-    print(f'Created aegis_snake.gif ({len(frames)} frames, {FRAME_DURATION}ms/frame)')
+        yield snapshot(frame_num)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render the AEGIS snake hunt animation.')
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help='render frames in N worker processes')
+    parser.add_argument('--seed', type=int, help='random seed for a reproducible animation')
+    parser.add_argument('--deltas', action='store_true',
+                        help='print the dirty rectangle written for every frame')
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default='draw',
+                        help='draw shapes with ImageDraw, paste pre-rasterized sprites, '
+                             'or stamp them into a NumPy framebuffer')
+    parser.add_argument('--plan', action='store_true',
+                        help='steer the snake to the nearest agent instead of wandering')
+    parser.add_argument('--force', action='store_true',
+                        help='render even if this seed is already in the render cache')
+    add_output_arguments(parser, themes=THEMES)
+    add_svg_argument(parser)
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler.install(sys.modules[__name__], PROFILED) if args.profile else None
+
+    # Every output is encoded from the same pass: the GIF is streamed to disk
+    # with only the region that changed since the previous frame encoded
+    gif = GifSink(OUTPUT, FRAME_DURATION, loop=0, delta=True)
+    extras = extra_sinks(args, FRAME_DURATION,
+                         themes={name: theme_palette(name) for name in THEMES})
+
+    # A seeded run is deterministic, so an identical earlier render can be
+    # reused (the cache only holds the GIF, so extra outputs always render)
+    cache = RenderCache()
+    modules = [sys.modules[__name__]] + [sys.modules[name] for name in RENDER_MODULES]
+    key = cache_key(modules, args.seed, plan=args.plan, renderer=args.renderer)
+    if not args.force and not extras and not args.svg and cache.fetch(key, OUTPUT):
+        print(f'Reused cached {OUTPUT}')
+        cache.report(key)
+        if profiler:
+            profiler.report(args.profile)
+        return
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    # The SVG is built from the same snapshots the frames are rendered from
+    snapshots = simulate(args.plan)
+    svg = None
+    if args.svg:
+        svg = SvgAnimation(WIDTH * CELL_SIZE, HEIGHT * CELL_SIZE, TOTAL_FRAMES, FRAME_DURATION,
+                           COLORS['background'])
+        svg.set_grid(COLORS['grid_line'], CELL_SIZE * 5, CELL_SIZE)
+        snapshots = tap(snapshots, lambda state: record_svg(svg, state))
+
+    with OutputPipeline([gif] + extras) as outputs:
+        render = getattr(sys.modules[__name__], RENDERERS[args.renderer])
+        for img in render_frames(render, snapshots, args.workers):
+            outputs.append(img)
+    cache.store(key, OUTPUT)
+    writer = gif.writer
+
+    print(f'Created {OUTPUT} ({writer.frame_count} frames, {FRAME_DURATION}ms/frame)')
+    if args.deltas:
+        for d in writer.deltas:
+            print(f'  frame {d.index:3d}: box {d.bbox}, {d.raw_bytes_saved} px bytes saved, '
+                  f'{d.encoded_bytes} bytes written')
+    saved = sum(d.raw_bytes_saved for d in writer.deltas)
+    print(f'  dirty rectangles: {len(writer.deltas)} blocks written, '
+          f'{saved // max(writer.frame_count, 1)} pixel bytes saved per frame on average')
+    if args.workers <= 1:
+        print(f'  background cache: {BACKGROUNDS.hits} hits, {BACKGROUNDS.misses} misses')
+    if svg:
+        report_size(args.svg, svg.save(args.svg), OUTPUT, os.path.getsize(OUTPUT))
+    cache.report(key)
+    if profiler:
+        profiler.report(args.profile)
 
 
 if __name__ == '__main__':
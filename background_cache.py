@@ -0,0 +1,80 @@
+"""
+background_cache.py
+Pre-rendered static background layers shared by the animation scripts.
+The background fill and grid lines are rasterized once per configuration;
+every frame then starts as a copy of the cached layer instead of redrawing
+each grid line.
+"""
+
+from typing import Tuple, Union
+from PIL import Image, ImageColor, ImageDraw
+
+Color = Union[str, Tuple[int, ...]]
+
+
+def _rgb(color: Color) -> Tuple[int, ...]:
+    """Resolve named/hex colors so equivalent spellings share a layer."""
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)
+    return tuple(color)
+
+
+class BackgroundCache:
+    """Background + grid layers keyed by size, grid spacing, colors and mode."""
+
+    def __init__(self):
+        self.layers = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, size: Tuple[int, int], background: Color, grid_color: Color,
+            x_step: int, y_step: int = None, mode: str = 'RGB', palette=None) -> Image.Image:
+        """Return a fresh copy of the background layer for this configuration.
+
+        Vertical grid lines are drawn every `x_step` pixels and horizontal
+        ones every `y_step` pixels (defaults to `x_step`). P-mode layers need
+        a `palette.Palette` and are drawn with its indices.
+        """
+        if y_step is None:
+            y_step = x_step
+        background, grid_color = _rgb(background), _rgb(grid_color)
+        palette_key = tuple(palette.colors) if palette is not None else None
+        key = (mode, tuple(size), background, grid_color, x_step, y_step, palette_key)
+
+        layer = self.layers.get(key)
+        if layer is None:
+            self.misses += 1
+            layer = self._render(mode, size, background, grid_color, x_step, y_step, palette)
+            self.layers[key] = layer
+        else:
+            self.hits += 1
+        return layer.copy()
+
+    @staticmethod
+    def _render(mode, size, background, grid_color, x_step, y_step, palette) -> Image.Image:
+        width, height = size
+        if mode == 'P':
+            layer = palette.new_image((width, height), background)
+            grid_color = palette.index(grid_color)
+        else:
+            fill = background + (255,) if mode == 'RGBA' else background
+            layer = Image.new(mode, (width, height), fill)
+        draw = ImageDraw.Draw(layer)
+        for x in range(0, width, x_step):
+            draw.line([(x, 0), (x, height)], fill=grid_color, width=1)
+        for y in range(0, height, y_step):
+            draw.line([(0, y), (width, y)], fill=grid_color, width=1)
+        return layer
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the number of cached layers."""
+        return {'hits': self.hits, 'misses': self.misses, 'layers': len(self.layers)}
+
+    def clear(self) -> None:
+        self.layers.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared by every renderer (and every theme variant) in the process
+BACKGROUNDS = BackgroundCache()
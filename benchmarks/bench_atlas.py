@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Sprite atlas benchmark for aegis_snake.
+Renders the frames of one seeded run with draw_frame (ImageDraw shapes) and
+draw_frame_atlas (pre-rasterized sprites), checks that every frame has the
+same pixels and prints the time per frame of each.
+
+    python benchmarks/bench_atlas.py
+    python benchmarks/bench_atlas.py --seeds 1 2 3 --plan
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aegis_snake
+
+
+def time_renderer(render, states):
+    start = time.perf_counter()
+    frames = [render(state) for state in states]
+    return frames, (time.perf_counter() - start) / len(states)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seeds', type=int, nargs='+', default=[1])
+    parser.add_argument('--plan', action='store_true', help="let the snake hunt (it grows longer)")
+    args = parser.parse_args()
+
+    print(f"{'seed':>6}  {'draw':>9}  {'atlas':>9}  {'speedup':>7}  {'sprites':>7}  pixels")
+    for seed in args.seeds:
+        random.seed(seed)
+        states = list(aegis_snake.simulate(args.plan))
+        # Warm both paths (glow stamps, atlas sprites, background layer)
+        aegis_snake.draw_frame(states[0])
+        aegis_snake.draw_frame_atlas(states[0])
+
+        drawn, draw_time = time_renderer(aegis_snake.draw_frame, states)
+        blitted, atlas_time = time_renderer(aegis_snake.draw_frame_atlas, states)
+        same = all(a.tobytes() == b.tobytes() for a, b in zip(drawn, blitted))
+        print(f"{seed:6d}  {draw_time * 1e3:7.2f}ms  {atlas_time * 1e3:7.2f}ms  "
+              f"{draw_time / atlas_time:6.2f}x  {len(aegis_snake.ATLAS.sprites):7d}  "
+              f"{'identical' if same else 'DIFFER'}")
+
+
+if __name__ == '__main__':
+    main()
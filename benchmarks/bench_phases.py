@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Per-phase benchmark of the three animation generators.
+Runs aegis_snake, aegis_constellation and custom_snake_complete with fixed
+seeds at several scales and times the simulation, drawing, glow compositing
+and GIF encoding phases separately. Each scenario then runs a second time
+under tracemalloc to record peak (Python-traced) memory.
+
+Results are written as JSON. Given a baseline, any time or memory figure
+that exceeds its threshold (baseline x ratio) is reported and the exit
+status is 1.
+
+    python benchmarks/bench_phases.py --output bench.json
+    python benchmarks/bench_phases.py --baseline benchmarks/baseline.json
+    python benchmarks/bench_phases.py --only snake --repeat 5
+"""
+import argparse
+import contextlib
+import functools
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy
+import PIL
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aegis_constellation as ac
+import aegis_snake as snake
+import custom_snake_complete as custom
+from gif_stream import GifStreamWriter
+
+PHASES = ('simulate', 'draw', 'glow', 'encode')
+
+# A run regresses when a figure exceeds baseline x ratio
+THRESHOLDS = {'time': 1.25, 'memory': 1.20}
+
+# Absolute slack so that sub-millisecond phases do not flap
+MIN_TIME_DELTA = 0.005
+
+SCENARIOS = {
+    'snake-180f': ('snake', {'frames': 180}),
+    'snake-720f': ('snake', {'frames': 720}),
+    'snake-2x-wide': ('snake', {'frames': 180, 'width': 166}),
+    'constellation-60f': ('constellation', {'frames': 60, 'agents': 1}),
+    'constellation-180f': ('constellation', {'frames': 180, 'agents': 1}),
+    'constellation-4x-agents': ('constellation', {'frames': 60, 'agents': 4}),
+    'constellation-4x-agents-numpy': ('constellation', {'frames': 60, 'agents': 4, 'engine': 'numpy'}),
+    'custom-200s': ('custom', {'steps': 200, 'width': 53, 'height': 7}),
+    'custom-200s-4x-grid': ('custom', {'steps': 200, 'width': 106, 'height': 14}),
+}
+
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+class PhaseTimer:
+    """Accumulated seconds per phase."""
+
+    def __init__(self):
+        self.totals = dict.fromkeys(PHASES, 0.0)
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.totals[name] += time.perf_counter() - start
+
+    def wrap(self, func, name):
+        """func, with its calls added to phase `name`."""
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            with self.phase(name):
+                return func(*args, **kwargs)
+        return timed
+
+
+@contextlib.contextmanager
+def patched(module, **values):
+    """Temporarily replace module attributes."""
+    saved = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in saved.items():
+            setattr(module, name, value)
+
+
+def drive(timer, states, render, writer):
+    """Pull each state, render it and encode it, timing each step.
+
+    Glow time is measured inside render, so it is taken out of draw.
+    """
+    frames = 0
+    while True:
+        with timer.phase('simulate'):
+            state = next(states, None)
+        if state is None:
+            break
+        with timer.phase('draw'):
+            img = render(state)
+        with timer.phase('encode'):
+            writer.append(img)
+        frames += 1
+    timer.totals['draw'] -= timer.totals['glow']
+    return frames
+
+
+# ============================================================================
+# SCENARIOS
+# ============================================================================
+
+def run_snake(timer, path, frames, width=snake.WIDTH):
+    with patched(snake, TOTAL_FRAMES=frames, WIDTH=width,
+                 draw_glow_circle=timer.wrap(snake.draw_glow_circle, 'glow')):
+        with GifStreamWriter(path, snake.FRAME_DURATION, loop=0, delta=True) as writer:
+            return drive(timer, snake.simulate(), snake.draw_frame, writer)
+
+
+def run_constellation(timer, path, frames, agents, engine='python'):
+    specs = {name: dict(spec, count=spec['count'] * agents) for name, spec in ac.AGENT_SPECS.items()}
+    with patched(ac, TOTAL_FRAMES=frames, AGENT_SPECS=specs,
+                 draw_agent_glow=timer.wrap(ac.draw_agent_glow, 'glow')):
+        with GifStreamWriter(path, ac.FRAME_DURATION, loop=0) as writer:
+            return drive(timer, ac.simulate(engine), ac.render_snapshot, writer)
+
+
+def run_custom(timer, path, steps, width, height):
+    game = custom.Game(width, height)
+    for _ in range(15):
+        game.spawn_dot(random.randint(0, width - 1), random.randint(0, height - 1),
+                       random.choice(custom.DOT_COLORS))
+    with GifStreamWriter(path, duration=100, loop=0) as writer:
+        return drive(timer, custom.play(game, steps), custom.render_state, writer)
+
+
+RUNNERS = {'snake': run_snake, 'constellation': run_constellation, 'custom': run_custom}
+
+
+def run_scenario(name, seed, tmpdir, trace_memory=False):
+    """One pass of a scenario; returns (frames, PhaseTimer, peak bytes or None)."""
+    script, params = SCENARIOS[name]
+    random.seed(seed)
+    timer = PhaseTimer()
+    path = os.path.join(tmpdir, name + '.gif')
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            frames = RUNNERS[script](timer, path, **params)
+        peak = tracemalloc.get_traced_memory()[1] if trace_memory else None
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    return frames, timer, peak
+
+
+def benchmark(names, seed, repeat):
+    """Best-of-`repeat` phase times plus traced peak memory per scenario."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name in names:
+            best = None
+            for _ in range(repeat):
+                frames, timer, _ = run_scenario(name, seed, tmpdir)
+                if best is None or sum(timer.totals.values()) < sum(best.values()):
+                    best = timer.totals
+            _, _, peak = run_scenario(name, seed, tmpdir, trace_memory=True)
+            size = os.path.getsize(os.path.join(tmpdir, name + '.gif'))
+
+            results[name] = {
+                'script': SCENARIOS[name][0],
+                'params': SCENARIOS[name][1],
+                'frames': frames,
+                'seconds': {phase: round(best[phase], 6) for phase in PHASES},
+                'total_seconds': round(sum(best.values()), 6),
+                'peak_traced_kb': round(peak / 1024, 1),
+                'gif_bytes': size,
+            }
+            print(f"{name:32s} {frames:4d} frames  "
+                  + '  '.join(f"{phase} {best[phase]:7.3f}s" for phase in PHASES)
+                  + f"  peak {peak / 1024:8.0f} KB", file=sys.stderr)
+    return results
+
+
+# ============================================================================
+# REGRESSIONS
+# ============================================================================
+
+def regressions(results, baseline):
+    """Figures that exceed the baseline's thresholds, as readable strings."""
+    thresholds = baseline.get('thresholds', THRESHOLDS)
+    found = []
+    for name, current in results.items():
+        base = baseline['results'].get(name)
+        if base is None or base['params'] != current['params']:
+            continue
+        for phase in PHASES:
+            old, new = base['seconds'][phase], current['seconds'][phase]
+            if new > old * thresholds['time'] and new - old > MIN_TIME_DELTA:
+                found.append(f"{name}: {phase} {old:.3f}s -> {new:.3f}s")
+        old, new = base['peak_traced_kb'], current['peak_traced_kb']
+        if new > old * thresholds['memory']:
+            found.append(f"{name}: peak memory {old:.0f} KB -> {new:.0f} KB")
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--only', nargs='+', choices=sorted(RUNNERS),
+                        help="benchmark only these scripts")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--repeat', type=int, default=3, help="timing passes per scenario (best is kept)")
+    parser.add_argument('--output', help="write results JSON here (default: stdout)")
+    parser.add_argument('--baseline', help="results JSON to check for regressions against")
+    args = parser.parse_args()
+
+    names = [name for name, (script, _) in SCENARIOS.items()
+             if not args.only or script in args.only]
+    report = {
+        'meta': {
+            'python': platform.python_version(),
+            'pillow': PIL.__version__,
+            'numpy': numpy.__version__,
+            'machine': platform.machine(),
+            'seed': args.seed,
+            'repeat': args.repeat,
+        },
+        'thresholds': THRESHOLDS,
+        'results': benchmark(names, args.seed, args.repeat),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as fp:
+            fp.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as fp:
+            found = regressions(report['results'], json.load(fp))
+        for line in found:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if found:
+            sys.exit(1)
+        print("No regressions against", args.baseline, file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
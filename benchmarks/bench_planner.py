@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Snake planner benchmark.
+Plans a greedy tour over a random calendar-shaped board and times it with
+the distance field repaired incrementally as targets are eaten, against
+rebuilding the field from scratch after every bite.
+
+    python benchmarks/bench_planner.py
+    python benchmarks/bench_planner.py --weeks 53 530 --density 0.6
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_planner import DistanceField, plan_tour
+
+
+def random_targets(width, height, density, seed):
+    rng = random.Random(seed)
+    return [(x, y) for x in range(width) for y in range(height) if rng.random() < density]
+
+
+def tour_with_rebuilds(width, height, start, targets):
+    """plan_tour, but recomputing the whole field after every target eaten."""
+    field = DistanceField(width, height, targets)
+    head, direction, steps = start, (1, 0), 0
+    while field.targets:
+        while field.distance(head):
+            direction = field.direction(head, direction)
+            head = ((head[0] + direction[0]) % width, (head[1] + direction[1]) % height)
+            steps += 1
+        index = head[1] * width + head[0]
+        del field.targets[index]
+        field.rebuild()
+    return steps + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--weeks', type=int, nargs='+', default=[53, 265, 530])
+    parser.add_argument('--density', type=float, default=0.5, help="share of days with contributions")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'board':>8}  {'targets':>7}  {'steps':>6}  {'incremental':>11}  {'rebuild':>9}")
+    for weeks in args.weeks:
+        targets = random_targets(weeks, 7, args.density, args.seed)
+        start = time.perf_counter()
+        path = plan_tour(weeks, 7, (0, 3), targets)
+        incremental = time.perf_counter() - start
+
+        start = time.perf_counter()
+        steps = tour_with_rebuilds(weeks, 7, (0, 3), targets)
+        rebuild = time.perf_counter() - start
+        assert steps == len(path)
+        print(f"{weeks:5d}x7  {len(targets):7d}  {len(path) - 1:6d}  {incremental * 1e3:9.1f}ms  "
+              f"{rebuild * 1e3:7.0f}ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Snake body micro-benchmark.
+Times one move (push head + drop tail) and one self-collision check for a
+plain list body, as the scripts used to do it, against SnakeBody.
+
+    python benchmarks/bench_snake_body.py
+    python benchmarks/bench_snake_body.py --lengths 10 1000 100000 --steps 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snake_body import SnakeBody
+
+
+def straight(length):
+    """A snake lying along the x axis, head at the origin."""
+    return [(-i, 0) for i in range(length)]
+
+
+def time_list(length, steps):
+    body = straight(length)
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        body.insert(0, (step, 0))
+        body.pop()
+    move = (time.perf_counter() - start) / steps
+
+    start = time.perf_counter()
+    for step in range(steps):
+        _ = body[0] in body[1:]
+    check = (time.perf_counter() - start) / steps
+    return move, check
+
+
+def time_snake_body(length, steps):
+    body = SnakeBody(straight(length))
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        body.move((step, 0))
+    move = (time.perf_counter() - start) / steps
+
+    start = time.perf_counter()
+    for step in range(steps):
+        _ = body.hits_itself()
+    check = (time.perf_counter() - start) / steps
+    return move, check
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--lengths', type=int, nargs='+', default=[10, 1000, 100000])
+    parser.add_argument('--steps', type=int, default=1000)
+    args = parser.parse_args()
+
+    print(f"{'length':>8}  {'list move':>11}  {'deque move':>11}  {'list check':>11}  {'set check':>11}")
+    for length in args.lengths:
+        list_move, list_check = time_list(length, args.steps)
+        body_move, body_check = time_snake_body(length, args.steps)
+        print(f"{length:8d}  {list_move * 1e6:9.2f}us  {body_move * 1e6:9.2f}us  "
+              f"{list_check * 1e6:9.2f}us  {body_check * 1e6:9.2f}us")
+
+
+if __name__ == '__main__':
+    main()
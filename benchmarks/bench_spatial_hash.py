@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Spatial hash benchmark for aegis_constellation.
+Times one boids update of N agents on the 830x180 canvas, scanning every
+agent (brute force) versus only the agents in nearby hash cells. It also
+prints the mean candidates the hash hands each agent and how many of them
+are within NEIGHBOR_RADIUS, the least any neighbour index could hand over.
+On this canvas that is ~30% of the swarm, so both columns grow with N.
+
+--fixed-density widens the canvas with the agent count instead (40 agents
+per 830px), which is where the hash makes a frame linear in N.
+
+    python benchmarks/bench_spatial_hash.py
+    python benchmarks/bench_spatial_hash.py --agents 40 1000 10000 --brute-max 1000
+    python benchmarks/bench_spatial_hash.py --fixed-density
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aegis_constellation as ac
+
+
+def make_agents(count: int, seed: int):
+    """Spread `count` agents uniformly over the canvas, cycling agent types."""
+    rng = random.Random(seed)
+    types = list(ac.AGENT_SPECS)
+    return [
+        ac.Agent(
+            x=rng.uniform(0, ac.WIDTH), y=rng.uniform(0, ac.HEIGHT),
+            vx=rng.uniform(-1, 1), vy=rng.uniform(-0.5, 0.5),
+            agent_type=types[i % len(types)], index=i // len(types),
+        )
+        for i in range(count)
+    ]
+
+
+def within_radius(agents) -> float:
+    """Mean number of other agents within NEIGHBOR_RADIUS of each agent."""
+    xy = np.array([(a.x, a.y) for a in agents])
+    total = 0
+    for low in range(0, len(xy), 1000):
+        chunk = xy[low:low + 1000]
+        dist = np.hypot(chunk[:, None, 0] - xy[:, 0], chunk[:, None, 1] - xy[:, 1])
+        total += int(np.count_nonzero(dist < ac.NEIGHBOR_RADIUS)) - len(chunk)
+    return total / len(xy)
+
+
+def time_frame(count: int, seed: int, use_grid: bool):
+    """Seconds for one update of every agent, plus mean candidates and
+    neighbours within NEIGHBOR_RADIUS per agent."""
+    agents = make_agents(count, seed)
+    grid = ac.SpatialHash() if use_grid else None
+    start = time.perf_counter()
+    if grid is not None:
+        grid.rebuild(agents)
+    for agent in agents:
+        ac.update_agent(agent, agents, 0, 'converge', grid)
+    elapsed = time.perf_counter() - start
+
+    if grid is None:
+        candidates = count
+    else:
+        grid.rebuild(agents)
+        candidates = sum(len(grid.nearby(a.x, a.y)) for a in agents) / count
+    return elapsed, candidates, within_radius(agents)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--agents', type=int, nargs='+',
+                        default=[40, 400, 1000, 2500, 10000])
+    parser.add_argument('--brute-max', type=int, default=2500,
+                        help='skip the brute-force scan above this many agents')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--fixed-density', action='store_true',
+                        help='widen the canvas by 830px per 40 agents')
+    args = parser.parse_args()
+
+    width = ac.WIDTH
+    print(f"{'agents':>8} {'canvas':>10} {'brute ms':>10} {'hash ms':>10} {'speedup':>8} "
+          f"{'candidates':>11} {'in radius':>10}")
+    for count in args.agents:
+        if args.fixed_density:
+            ac.WIDTH = max(width, round(width * count / 40))
+        hashed, candidates, neighbours = time_frame(count, args.seed, use_grid=True)
+        if count <= args.brute_max:
+            brute, _, _ = time_frame(count, args.seed, use_grid=False)
+            brute_ms = f"{brute * 1000:10.1f}"
+            speedup = f"{brute / hashed:7.1f}x"
+        else:
+            brute_ms, speedup = f"{'-':>10}", f"{'-':>8}"
+        canvas = f"{ac.WIDTH}x{ac.HEIGHT}"
+        print(f"{count:8d} {canvas:>10} {brute_ms} {hashed * 1000:10.1f} {speedup} "
+              f"{candidates:11.0f} {neighbours:10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Statistical comparison of custom_snake_batch against the reference Game.
+Plays N games one at a time through custom_snake_complete's play() loop and
+N games in one batch, then prints the mean of each outcome for both, with
+the two-sample Kolmogorov-Smirnov distance between their distributions and
+the time per game.
+
+    python benchmarks/compare_batch.py --games 2000
+"""
+import argparse
+import contextlib
+import io
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import custom_snake_complete as custom
+from custom_snake_batch import BatchParams, simulate
+
+STATS = ('survival_steps', 'dots_eaten', 'projectile_hits')
+
+
+def reference_game(params: BatchParams):
+    """One reference game, set up like generate_gif; returns the three outcomes."""
+    fired = []
+    shoot = custom.Dot.shoot
+
+    def recording_shoot(dot, x, y):
+        projectile = shoot(dot, x, y)
+        if projectile:
+            fired.append(projectile)
+        return projectile
+
+    game = custom.Game(params.width, params.height)
+    for _ in range(params.initial_dots):
+        game.spawn_dot(random.randint(0, params.width - 1), random.randint(0, params.height - 1),
+                       random.choice(custom.DOT_COLORS))
+    length = len(game.snake.body)
+
+    custom.Dot.shoot = recording_shoot
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            steps = sum(1 for _ in custom.play(game, params.steps))
+    finally:
+        custom.Dot.shoot = shoot
+    # play() yields once per update, so a game that died ran `steps` updates
+    return steps, len(game.snake.body) - length, sum(1 for p in fired if not p.alive)
+
+
+def ks_distance(a, b):
+    """Largest gap between the empirical CDFs of a and b."""
+    values = np.union1d(a, b)
+    cdf_a = np.searchsorted(np.sort(a), values, side='right') / len(a)
+    cdf_b = np.searchsorted(np.sort(b), values, side='right') / len(b)
+    return float(np.abs(cdf_a - cdf_b).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--games', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+    params = BatchParams()
+
+    random.seed(args.seed)
+    start = time.perf_counter()
+    rows = [reference_game(params) for _ in range(args.games)]
+    reference_time = (time.perf_counter() - start) / args.games
+    reference = {name: np.array(column) for name, column in zip(STATS, zip(*rows))}
+
+    start = time.perf_counter()
+    result = simulate(args.games, params, args.seed)
+    batch_time = (time.perf_counter() - start) / args.games
+
+    # KS distances above this are unlikely (p < 0.05) if the distributions match;
+    # discrete outcomes make the test conservative
+    critical = 1.36 * math.sqrt(2 / args.games)
+    print(f"{args.games} games per engine, KS critical value {critical:.3f}")
+    print(f"{'statistic':18s} {'reference':>10s} {'batch':>10s} {'KS':>7s}")
+    for name in STATS:
+        ours = getattr(result, name)
+        d = ks_distance(reference[name], ours)
+        flag = '' if d <= critical else '  <-- differs'
+        print(f"{name:18s} {reference[name].mean():10.3f} {ours.mean():10.3f} {d:7.3f}{flag}")
+    print(f"time per game: reference {reference_time * 1e3:.2f} ms, batch {batch_time * 1e3:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
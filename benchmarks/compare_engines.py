@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Statistical comparison of the aegis_constellation simulation engines.
+Runs the per-agent reference engine and the NumPy engine from the same
+seeded start positions and prints per-type motion statistics for each,
+plus the time spent per frame.
+
+    python benchmarks/compare_engines.py --seeds 1 2 3 4 5
+"""
+import argparse
+import copy
+import math
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import aegis_constellation as ac
+from aegis_constellation_numpy import SwarmArrays
+
+
+def run(engine: str, agents):
+    """Simulate TOTAL_FRAMES and collect per-type speed and position samples."""
+    samples = {name: {'speed': [], 'x': [], 'y': []} for name in ac.AGENT_SPECS}
+    grid = ac.SpatialHash()
+    swarm = SwarmArrays(agents) if engine == 'numpy' else None
+    start = time.perf_counter()
+    for frame_num in range(ac.TOTAL_FRAMES):
+        phase = ac.PHASES[(frame_num // ac.PHASE_DURATION) % len(ac.PHASES)]
+        if swarm is not None:
+            swarm.step(frame_num, phase)
+            swarm.sync(agents)
+        else:
+            grid.rebuild(agents)
+            for agent in agents:
+                ac.update_agent(agent, agents, frame_num, phase, grid)
+        for agent in agents:
+            s = samples[agent.agent_type]
+            s['speed'].append(math.hypot(agent.vx, agent.vy))
+            s['x'].append(agent.x)
+            s['y'].append(agent.y)
+    elapsed = time.perf_counter() - start
+    return samples, elapsed / ac.TOTAL_FRAMES
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seeds', type=int, nargs='+', default=[1, 2, 3, 4, 5])
+    args = parser.parse_args()
+
+    merged = {engine: {name: {'speed': [], 'x': [], 'y': []} for name in ac.AGENT_SPECS}
+              for engine in ('python', 'numpy')}
+    frame_time = {'python': 0.0, 'numpy': 0.0}
+    for seed in args.seeds:
+        random.seed(seed)
+        start_agents = ac.create_agents()
+        for engine in merged:
+            samples, per_frame = run(engine, copy.deepcopy(start_agents))
+            frame_time[engine] += per_frame / len(args.seeds)
+            for name, s in samples.items():
+                for key, values in s.items():
+                    merged[engine][name][key].extend(values)
+
+    print(f"{'type':<10} {'stat':<12} {'python':>8} {'numpy':>10}")
+    for name in ac.AGENT_SPECS:
+        for key in ('speed', 'x', 'y'):
+            for label, fn in (('mean', statistics.fmean), ('stdev', statistics.pstdev)):
+                ref = fn(merged['python'][name][key])
+                vec = fn(merged['numpy'][name][key])
+                print(f"{name:<10} {key + ' ' + label:<12} {ref:8.2f} {vec:10.2f}")
+    print(f"per-frame update: python {frame_time['python'] * 1000:.2f}ms, "
+          f"numpy {frame_time['numpy'] * 1000:.2f}ms")
+
+
+if __name__ == '__main__':
+    main()
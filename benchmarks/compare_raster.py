@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Pixel comparison of the NumPy framebuffer renderers against ImageDraw.
+Renders the frames of seeded runs of aegis_snake, aegis_constellation and
+custom_snake_complete (on its default board and on a contribution calendar)
+with each script's ImageDraw renderer and its framebuffer renderer, counts
+the pixels that differ and prints the time per frame of both.
+
+aegis_snake_sparks replays the same run with 24-particle bursts going off
+every few frames at a handful of cells. That keeps well over 64 overlapping
+discs on screen, so draw_frame takes its array path for particles and both
+renderers have to keep them in drawing order. --burst adds that many random
+particles to each aegis_snake frame, to show how stamping scales with the
+shape count.
+
+    python benchmarks/compare_raster.py
+    python benchmarks/compare_raster.py --burst 4000
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import aegis_constellation
+import aegis_snake
+import custom_snake_complete as custom
+from contributions import load_calendar
+
+CALENDARS = [os.path.join(ROOT, 'fixtures', f'contributions_{year}.json') for year in (2023, 2024)]
+
+
+def snake_frames(seed, burst):
+    random.seed(seed)
+    states = list(aegis_snake.simulate())
+    if burst:
+        rng = np.random.default_rng(seed)
+        width, height = aegis_snake.WIDTH * aegis_snake.CELL_SIZE, aegis_snake.HEIGHT * aegis_snake.CELL_SIZE
+        for i, state in enumerate(states):
+            extra = np.column_stack([rng.integers(0, width, burst), rng.integers(0, height, burst),
+                                     rng.integers(0, 3, burst), rng.integers(0, 256, (burst, 3))])
+            states[i] = state._replace(particles=np.concatenate([state.particles, extra.astype(np.int32)]))
+    return states, aegis_snake.draw_frame, aegis_snake.draw_frame_numpy
+
+
+def snake_spark_frames(seed, burst):
+    """aegis_snake frames whose particles come from dense, overlapping bursts."""
+    states, draw, numpy_draw = snake_frames(seed, burst)
+    rng = np.random.default_rng(seed)
+    pool = aegis_snake.ParticlePool(rng=rng)
+    colors = [agent['color'] for agent in aegis_snake.AGENTS]
+    width, height = aegis_snake.WIDTH * aegis_snake.CELL_SIZE, aegis_snake.HEIGHT * aegis_snake.CELL_SIZE
+    for i, state in enumerate(states):
+        if i % 3 == 0:
+            for _ in range(4):
+                pool.burst(int(rng.integers(0, aegis_snake.WIDTH)), int(rng.integers(0, aegis_snake.HEIGHT)),
+                           24, 0.05, 0.3, colors[int(rng.integers(len(colors)))], life=20)
+        pool.update()
+        states[i] = state._replace(particles=pool.draw_list(aegis_snake.CELL_SIZE, width, height))
+    return states, draw, numpy_draw
+
+
+def constellation_frames(seed, burst):
+    random.seed(seed)
+    with contextlib.redirect_stdout(io.StringIO()):
+        snapshots = list(aegis_constellation.simulate())
+    return (snapshots, aegis_constellation.render_snapshot,
+            lambda snapshot: aegis_constellation.render_snapshot(snapshot, 'numpy'))
+
+
+def custom_frames(seed, calendar=None):
+    """Snapshots of a game set up like generate_gif (a wrapping, planned one on a calendar)."""
+    random.seed(seed)
+    if calendar is not None:
+        game = custom.Game(calendar.width, calendar.height, wrap=True)
+        custom.spawn_calendar_dots(game, calendar)
+        planner = custom.DistanceField(game.width, game.height)
+    else:
+        game = custom.Game()
+        for _ in range(15):
+            game.spawn_dot(random.randint(0, game.width - 1), random.randint(0, game.height - 1),
+                           random.choice(custom.DOT_COLORS))
+        planner = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        states = list(custom.play(game, 200, custom.DOT_COLORS, planner, copy=True))
+    return states, custom.render_state, custom.render_state_numpy
+
+
+CASES = {
+    'aegis_snake': snake_frames,
+    'aegis_snake_sparks': snake_spark_frames,
+    'aegis_constellation': constellation_frames,
+    'custom_snake': lambda seed, burst: custom_frames(seed),
+    'custom_snake_calendar': lambda seed, burst: custom_frames(seed, load_calendar(CALENDARS)),
+}
+
+
+def time_renderer(render, frames, repeat):
+    """Rendered images and the best time per frame over `repeat` passes."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        images = [render(frame) for frame in frames]
+        best = min(best, (time.perf_counter() - start) / len(frames))
+    return images, best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--seed', type=int, default=3)
+    parser.add_argument('--burst', type=int, default=0, metavar='N',
+                        help="extra random particles in every aegis_snake frame")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='+', choices=list(CASES), default=list(CASES))
+    args = parser.parse_args()
+
+    print(f"{'case':>22}  {'frames':>6}  {'draw':>9}  {'numpy':>9}  {'speedup':>7}  pixels")
+    for name in args.cases:
+        frames, draw, numpy_draw = CASES[name](args.seed, args.burst)
+        # Warm both paths (background layers, sprites, stamps)
+        draw(frames[0])
+        numpy_draw(frames[0])
+        expected, draw_time = time_renderer(draw, frames, args.repeat)
+        actual, numpy_time = time_renderer(numpy_draw, frames, args.repeat)
+
+        differing = 0
+        for a, b in zip(expected, actual):
+            if a.mode != b.mode or a.getpalette() != b.getpalette():
+                differing = None
+                break
+            differing += int(np.count_nonzero(np.asarray(a) != np.asarray(b)))
+        verdict = ('mode/palette differ' if differing is None
+                   else 'identical' if differing == 0 else f'{differing} differ')
+        print(f"{name:>22}  {len(frames):6d}  {draw_time * 1e3:7.2f}ms  {numpy_time * 1e3:7.2f}ms  "
+              f"{draw_time / numpy_time:6.2f}x  {verdict}")
+
+
+if __name__ == '__main__':
+    main()
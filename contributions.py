@@ -0,0 +1,142 @@
+"""
+contributions.py
+Offline loader for GitHub contribution calendars.
+Reads the JSON the GraphQL API returns for
+`user { contributionsCollection { contributionCalendar { weeks {
+contributionDays { date contributionCount contributionLevel } } } } }`
+from local files (no network access) into a compact grid: one byte per
+day holding the contribution level, 0 (none) to 4 (fourth quartile).
+
+Days are placed by date, a column per week (Sunday first) and a row per
+weekday, so several yearly calendars load side by side into one grid -
+ten years make a board about 530 x 7 - and the week where two years meet
+shares a column.
+
+    python contributions.py fixtures/contributions_2023.json fixtures/contributions_2024.json
+"""
+
+import argparse
+import datetime
+import json
+from typing import Iterable, Iterator, List, Tuple, Union
+
+import numpy as np
+
+DAYS_PER_WEEK = 7
+
+# GraphQL ContributionLevel values, in order
+LEVELS = ('NONE', 'FIRST_QUARTILE', 'SECOND_QUARTILE', 'THIRD_QUARTILE', 'FOURTH_QUARTILE')
+
+
+class ContributionGrid:
+    """Contribution levels for `width` weeks x 7 weekdays in a bytearray.
+
+    Cell (x, y) is week x, weekday y (0 = Sunday), stored at x * 7 + y so a
+    week is one contiguous run of bytes. `start` is the Sunday of week 0.
+    """
+
+    __slots__ = ('width', 'height', 'start', 'levels')
+
+    def __init__(self, width: int, start: datetime.date, levels: bytearray = None):
+        self.width = width
+        self.height = DAYS_PER_WEEK
+        self.start = start
+        self.levels = levels if levels is not None else bytearray(width * DAYS_PER_WEEK)
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    def level(self, x: int, y: int) -> int:
+        return self.levels[x * DAYS_PER_WEEK + y]
+
+    def cells(self) -> Iterator[Tuple[int, int, int]]:
+        """(x, y, level) for every day with contributions, week by week."""
+        for i, level in enumerate(self.levels):
+            if level:
+                yield divmod(i, DAYS_PER_WEEK) + (level,)
+
+    def as_array(self) -> np.ndarray:
+        """The levels as a (7, width) uint8 array sharing this grid's memory."""
+        return np.frombuffer(self.levels, dtype=np.uint8).reshape(self.width, DAYS_PER_WEEK).T
+
+    def date(self, x: int, y: int) -> datetime.date:
+        return self.start + datetime.timedelta(days=x * DAYS_PER_WEEK + y)
+
+
+def _calendar(document: dict) -> dict:
+    """The contributionCalendar object of a GraphQL response (or the object itself)."""
+    if 'weeks' in document:
+        return document
+    try:
+        user = document['data']['user']
+        return user['contributionsCollection']['contributionCalendar']
+    except (KeyError, TypeError):
+        raise ValueError("not a GitHub contribution calendar: expected "
+                         "data.user.contributionsCollection.contributionCalendar.weeks") from None
+
+
+def _quartile_levels(counts: List[int]) -> List[int]:
+    """Levels for days without contributionLevel: quartiles of the non-zero counts."""
+    nonzero = [c for c in counts if c > 0]
+    if not nonzero:
+        return [0] * len(counts)
+    bounds = np.percentile(nonzero, [25, 50, 75])
+    return [0 if c <= 0 else 1 + int(np.searchsorted(bounds, c, side='left')) for c in counts]
+
+
+def calendar_days(document: dict) -> List[Tuple[datetime.date, int]]:
+    """(date, level) for every day of one calendar document."""
+    days = [day for week in _calendar(document)['weeks'] for day in week['contributionDays']]
+    dates = [datetime.date.fromisoformat(day['date']) for day in days]
+    if all('contributionLevel' in day for day in days):
+        levels = [LEVELS.index(day['contributionLevel']) for day in days]
+    else:
+        levels = _quartile_levels([day.get('contributionCount', 0) for day in days])
+    return list(zip(dates, levels))
+
+
+def load_calendar(sources: Union[str, Iterable[str]]) -> ContributionGrid:
+    """Load one or more calendar JSON files (e.g. one per year) into one grid.
+
+    Each file holds a GraphQL response, a bare contributionCalendar, or a
+    list of either. Days that appear in several files keep the highest level.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    days: List[Tuple[datetime.date, int]] = []
+    for path in sources:
+        with open(path, encoding='utf-8') as f:
+            document = json.load(f)
+        for calendar in document if isinstance(document, list) else [document]:
+            days.extend(calendar_days(calendar))
+    if not days:
+        raise ValueError("calendar has no days")
+
+    first = min(date for date, _ in days)
+    start = first - datetime.timedelta(days=(first.weekday() + 1) % DAYS_PER_WEEK)  # Sunday
+    offsets = [((date - start).days, level) for date, level in days]
+    width = max(offset for offset, _ in offsets) // DAYS_PER_WEEK + 1
+
+    grid = ContributionGrid(width, start)
+    for offset, level in offsets:
+        if level > grid.levels[offset]:
+            grid.levels[offset] = level
+    return grid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize local contribution calendar files.")
+    parser.add_argument('paths', nargs='+', metavar='JSON')
+    args = parser.parse_args(argv)
+
+    grid = load_calendar(args.paths)
+    counts = np.bincount(np.frombuffer(grid.levels, dtype=np.uint8), minlength=len(LEVELS))
+    print(f"{grid.width}x{grid.height} grid from {grid.start} ({len(grid)} bytes)")
+    for name, count in zip(LEVELS, counts):
+        print(f"  {name:16s} {count:5d} cells")
+    for row in grid.as_array():
+        print('  ' + ''.join(' .oO@'[level] for level in row))
+
+
+if __name__ == '__main__':
+    main()
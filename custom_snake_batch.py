@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+custom_snake_batch.py
+Headless batch simulator for the custom snake game.
+Steps thousands of independent games at once on NumPy arrays shaped
+(games x entities), for tuning fire chances, cooldowns and spawn rates by
+Monte Carlo. It follows the rules of custom_snake_complete's Game.update and
+play() loop, starting the way generate_gif does, with its own random stream:
+individual games differ from the reference, the statistics match (see
+benchmarks/compare_batch.py).
+
+    python custom_snake_batch.py --games 10000 --steps 200 --seed 1
+"""
+import argparse
+from dataclasses import dataclass, fields
+from typing import Dict
+
+import numpy as np
+
+# Dot movement: one of the four neighbours, chosen uniformly
+MOVES = np.array([(-1, 0), (1, 0), (0, -1), (0, 1)], dtype=np.int64)
+# Random turns in play() never head left
+TURNS = np.array([(1, 0), (0, 1), (0, -1)], dtype=np.int64)
+
+
+@dataclass
+class BatchParams:
+    """Game rules; the defaults are custom_snake_complete's."""
+    width: int = 53
+    height: int = 7
+    steps: int = 200
+    initial_dots: int = 15      # Spawned before the first step (as in generate_gif)
+    max_dots: int = 20          # play() only spawns while fewer dots are alive
+    spawn_every: int = 30
+    fire_chance: float = 0.05
+    fire_cooldown: int = 10
+    turn_every: int = 20
+    turn_chance: float = 0.3
+    start_head: tuple = (5, 3)
+
+
+@dataclass
+class BatchResult:
+    """Per-game outcomes, each an array of length `games`."""
+    survival_steps: np.ndarray  # updates run, including the fatal one
+    dots_eaten: np.ndarray
+    projectile_hits: np.ndarray
+    died: np.ndarray
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Mean, standard deviation and quartiles of each statistic."""
+        out = {}
+        for f in fields(self):
+            values = getattr(self, f.name).astype(np.float64)
+            q1, median, q3 = np.percentile(values, [25, 50, 75])
+            out[f.name] = {'mean': values.mean(), 'std': values.std(),
+                           'q1': q1, 'median': median, 'q3': q3}
+        return out
+
+
+class ProjectileBuffer:
+    """Projectile slots per game, left-packed, grown by doubling.
+
+    In the reference game a projectile only disappears when it hits the
+    snake, which ends that game, so slots are never freed.
+    """
+
+    def __init__(self, games: int, capacity: int = 32):
+        self.count = np.zeros(games, dtype=np.int64)
+        self.x = np.zeros((games, capacity), dtype=np.int64)
+        self.y = np.zeros((games, capacity), dtype=np.int64)
+        self.dx = np.zeros((games, capacity), dtype=np.int64)
+        self.dy = np.zeros((games, capacity), dtype=np.int64)
+        self.alive = np.zeros((games, capacity), dtype=bool)
+
+    def _grow(self, capacity: int) -> None:
+        for name in ('x', 'y', 'dx', 'dy', 'alive'):
+            old = getattr(self, name)
+            new = np.zeros((old.shape[0], capacity), dtype=old.dtype)
+            new[:, :old.shape[1]] = old
+            setattr(self, name, new)
+
+    def add(self, fired: np.ndarray, x, y, dx, dy) -> None:
+        """Append one projectile per True entry of the (games x dots) `fired` mask."""
+        games, dots = np.nonzero(fired)
+        if not len(games):
+            return
+        rank = np.cumsum(fired, axis=1) - 1
+        slots = self.count[games] + rank[games, dots]
+        needed = int(slots.max()) + 1
+        if needed > self.x.shape[1]:
+            self._grow(max(needed, self.x.shape[1] * 2))
+        self.x[games, slots] = x[games, dots]
+        self.y[games, slots] = y[games, dots]
+        self.dx[games, slots] = dx[games, dots]
+        self.dy[games, slots] = dy[games, dots]
+        self.alive[games, slots] = True
+        self.count += fired.sum(axis=1)
+
+    def take(self, rows: np.ndarray) -> None:
+        """Keep only the given games, trimming unused slots."""
+        width = max(int(self.count[rows].max(initial=0)), 1)
+        self.count = self.count[rows]
+        for name in ('x', 'y', 'dx', 'dy', 'alive'):
+            setattr(self, name, getattr(self, name)[rows, :width])
+
+
+def simulate(games: int, params: BatchParams = None, seed: int = None) -> BatchResult:
+    """Play `games` independent games to completion and collect outcomes."""
+    p = params or BatchParams()
+    rng = np.random.default_rng(seed)
+    capacity = max(p.initial_dots, p.max_dots)
+    w, h = p.width, p.height
+
+    # Dots
+    dot_x = np.zeros((games, capacity), dtype=np.int64)
+    dot_y = np.zeros((games, capacity), dtype=np.int64)
+    dot_cd = np.zeros((games, capacity), dtype=np.int64)
+    dot_alive = np.zeros((games, capacity), dtype=bool)
+    dot_x[:, :p.initial_dots] = rng.integers(0, w, (games, p.initial_dots))
+    dot_y[:, :p.initial_dots] = rng.integers(0, h, (games, p.initial_dots))
+    dot_alive[:, :p.initial_dots] = True
+
+    projectiles = ProjectileBuffer(games)
+
+    # Snake: only the head collides, and its length is start + dots eaten
+    head_x = np.full(games, p.start_head[0], dtype=np.int64)
+    head_y = np.full(games, p.start_head[1], dtype=np.int64)
+    dir_x = np.ones(games, dtype=np.int64)
+    dir_y = np.zeros(games, dtype=np.int64)
+
+    # Outcomes are indexed by game; the state arrays only by row, and rows
+    # of finished games are dropped once they are half of the batch
+    ids = np.arange(games)
+    running = np.ones(games, dtype=bool)
+    survival = np.full(games, p.steps, dtype=np.int64)
+    eaten = np.zeros(games, dtype=np.int64)
+    hits = np.zeros(games, dtype=np.int64)
+    died = np.zeros(games, dtype=bool)
+
+    for step in range(p.steps):
+        if not running.any():
+            break
+        if running.sum() * 2 < len(running):
+            rows = np.flatnonzero(running)
+            ids, running = ids[rows], running[rows]
+            dot_x, dot_y, dot_cd, dot_alive = dot_x[rows], dot_y[rows], dot_cd[rows], dot_alive[rows]
+            head_x, head_y, dir_x, dir_y = head_x[rows], head_y[rows], dir_x[rows], dir_y[rows]
+            projectiles.take(rows)
+        active = running[:, None] & dot_alive
+
+        # Dots move, then may fire at the (not yet moved) snake head
+        move = MOVES[rng.integers(0, 4, dot_x.shape)]
+        dot_x = np.where(active, (dot_x + move[..., 0]) % w, dot_x)
+        dot_y = np.where(active, (dot_y + move[..., 1]) % h, dot_y)
+
+        cooling = active & (dot_cd > 0)
+        dot_cd = np.where(cooling, dot_cd - 1, dot_cd)
+        ready = active & ~cooling & (rng.random(dot_x.shape) < p.fire_chance)
+        dx = head_x[:, None] - dot_x
+        dy = head_y[:, None] - dot_y
+        distance = np.hypot(dx, dy)
+        fired = ready & (distance > 0)
+        safe = np.where(fired, distance, 1.0)
+        # np.rint rounds half to even, like Python's round()
+        projectiles.add(fired, dot_x, dot_y,
+                        np.rint(dx / safe).astype(np.int64), np.rint(dy / safe).astype(np.int64))
+        dot_cd = np.where(fired, p.fire_cooldown, dot_cd)
+
+        # Projectiles move; any landing on the head kills the snake
+        flying = running[:, None] & projectiles.alive
+        projectiles.x = np.where(flying, (projectiles.x + projectiles.dx) % w, projectiles.x)
+        projectiles.y = np.where(flying, (projectiles.y + projectiles.dy) % h, projectiles.y)
+        hit = flying & (projectiles.x == head_x[:, None]) & (projectiles.y == head_y[:, None])
+        projectiles.alive &= ~hit
+        step_hits = hit.sum(axis=1)
+        hits[ids] += step_hits
+
+        # The snake moves and eats whatever dots share its new head cell
+        head_x = np.where(running, head_x + dir_x, head_x)
+        head_y = np.where(running, head_y + dir_y, head_y)
+        eat = active & (dot_x == head_x[:, None]) & (dot_y == head_y[:, None])
+        eaten[ids] += eat.sum(axis=1)
+        dot_alive &= ~eat
+
+        fatal = running & (step_hits > 0)
+        survival[ids[fatal]] = step + 1
+        died[ids[fatal]] = True
+        running &= ~fatal
+
+        # play(): occasional random turns and dot spawns
+        if step % p.turn_every == 0:
+            turning = running & (rng.random(len(running)) < p.turn_chance)
+            turn = TURNS[rng.integers(0, len(TURNS), len(running))]
+            dir_x = np.where(turning, turn[:, 0], dir_x)
+            dir_y = np.where(turning, turn[:, 1], dir_y)
+        if step % p.spawn_every == 0:
+            spawning = running & (dot_alive.sum(axis=1) < p.max_dots)
+            rows = np.flatnonzero(spawning)
+            slots = np.argmin(dot_alive[rows], axis=1)  # First free slot
+            dot_x[rows, slots] = rng.integers(0, w, len(rows))
+            dot_y[rows, slots] = rng.integers(0, h, len(rows))
+            dot_cd[rows, slots] = 0
+            dot_alive[rows, slots] = True
+
+    return BatchResult(survival, eaten, hits, died)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch Monte Carlo runs of the custom snake game.")
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--seed', type=int)
+    for f in fields(BatchParams):
+        if f.type in (int, float, 'int', 'float'):
+            parser.add_argument('--' + f.name.replace('_', '-'), type=type(f.default), default=f.default)
+    args = parser.parse_args(argv)
+
+    params = BatchParams(**{f.name: getattr(args, f.name) for f in fields(BatchParams)
+                            if hasattr(args, f.name)})
+    result = simulate(args.games, params, args.seed)
+    print(f"{args.games} games x {params.steps} steps on {params.width}x{params.height}")
+    print(f"{'statistic':18s} {'mean':>8s} {'std':>8s} {'q1':>6s} {'median':>6s} {'q3':>6s}")
+    for name, s in result.summary().items():
+        print(f"{name:18s} {s['mean']:8.3f} {s['std']:8.3f} {s['q1']:6.0f} {s['median']:6.0f} {s['q3']:6.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -6,11 +6,63 @@ across the grid and occasionally shoot projectiles toward the snake. When the sn
 This example is intended as a foundation for a GitHub Actions workflow to generate a GIF of your contributions grid.
 """
 
+import argparse
+import functools
 import random
 import math
 import os
-from typing import List, Tuple
-from PIL import Image, ImageDraw
+import sys
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from PIL import Image, ImageColor, ImageDraw
+
+from background_cache import BACKGROUNDS
+from contributions import ContributionGrid, load_calendar
+from framebuffer import Framebuffer, shape_stamp
+from output_pipeline import FrameSink, GifSink, OutputPipeline, add_output_arguments, extra_sinks
+from palette import build_palette
+from parallel_render import render_frames
+from profiling import Profiler, add_profile_argument
+from snake_body import SnakeBody
+from snake_planner import DistanceField
+
+# Rendering colors; frames are drawn straight into P-mode with this palette
+BACKGROUND_COLOR = '#0D1117'
+GRID_COLOR = '#21262D'
+SNAKE_HEAD_COLOR = '#00FF00'
+SNAKE_BODY_COLOR = '#00AA00'
+DOT_COLORS = ['red', 'blue', 'green', 'yellow', 'orange', 'purple', 'cyan', 'magenta']
+# Dot color for each contribution level (1-4) when seeding from a calendar
+LEVEL_DOT_COLORS = ['green', 'cyan', 'yellow', 'red']
+
+# Themes recolor the board; a light variant is the dark render with its palette swapped
+DEFAULT_THEME = 'dark'
+THEMES = {
+    'dark': {'background': BACKGROUND_COLOR, 'grid': GRID_COLOR},
+    'light': {'background': '#FFFFFF', 'grid': '#EBEDF0'},
+}
+
+def theme_palette(theme: str):
+    """The rendering palette with a theme's board colors, entry for entry."""
+    colors = THEMES[theme]
+    return build_palette([colors['background'], colors['grid'], SNAKE_HEAD_COLOR, SNAKE_BODY_COLOR]
+                         + DOT_COLORS)
+
+PALETTE = theme_palette(DEFAULT_THEME)
+
+FRAME_DURATION = 100  # milliseconds
+SNAKE_HEAD_INDEX = PALETTE.index(SNAKE_HEAD_COLOR)
+SNAKE_BODY_INDEX = PALETTE.index(SNAKE_BODY_COLOR)
+
+# Functions timed by --profile (the GIF path renders snapshots via render_state)
+PROFILED = ('render_frame', 'render_state', 'render_state_numpy')
+
+@lru_cache(maxsize=None)
+def resolve_color(color: str) -> Tuple[Tuple[int, int, int], int]:
+    """RGB and palette index of a color name, parsed once per name."""
+    return ImageColor.getrgb(color)[:3], PALETTE.index(color)
 
 class Dot:
     """Represents a colored dot that moves around the grid and can shoot projectiles."""
@@ -18,6 +70,7 @@ class Dot:
         self.x = x
         self.y = y
         self.color = color
+        self.rgb, self.palette_index = resolve_color(color)
         self.alive = True
         self.shoot_cooldown = 0
 
@@ -55,6 +108,7 @@ class Projectile:
         self.dx = dx
         self.dy = dy
         self.color = color
+        self.rgb, self.palette_index = resolve_color(color)
         self.alive = True
 
     def move(self, width: int, height: int) -> None:
@@ -64,20 +118,21 @@ class Projectile:
 class Snake:
     """Represents the snake moving across the grid."""
     def __init__(self, body: List[Tuple[int, int]], direction: Tuple[int, int]):
-        self.body = list(body)
+        self.body = SnakeBody(body)
         self.direction = direction
         self.alive = True
 
-    def move(self) -> None:
-        head_x, head_y = self.body[0]
+    def move(self, wrap: Optional[Tuple[int, int]] = None) -> None:
+        """Step forward; with wrap=(width, height) the head wraps round the board."""
+        head_x, head_y = self.body.head
         dx, dy = self.direction
-        new_head = (head_x + dx, head_y + dy)
-        self.body.insert(0, new_head)
-        self.body.pop()
+        if wrap:
+            self.body.move(((head_x + dx) % wrap[0], (head_y + dy) % wrap[1]))
+        else:
+            self.body.move((head_x + dx, head_y + dy))
 
     def grow(self) -> None:
-        tail = self.body[-1]
-        self.body.append(tail)
+        self.body.grow()
 
     def change_direction(self, new_direction: Tuple[int, int]) -> None:
         self.direction = new_direction
@@ -91,41 +146,125 @@ class Snake:
     def check_collision_with_projectile(self, projectile: Projectile) -> bool:
         return self.body[0] == (projectile.x, projectile.y)
 
+class OccupancyGrid:
+    """Dots bucketed by the cell they are on, so a hit can find them.
+
+    A move is a couple of dict operations. Snake segments are counted per
+    cell by the snake's own SnakeBody, and a projectile only needs to know
+    whether it landed on one of those cells or a dot's, so neither needs
+    another index.
+    """
+
+    def __init__(self):
+        self.dots: Dict[Tuple[int, int], List[Dot]] = {}
+
+    def place(self, dot: Dot) -> None:
+        """Start tracking a dot at its current cell."""
+        cell = (dot.x, dot.y)
+        bucket = self.dots.get(cell)
+        if bucket is None:
+            self.dots[cell] = [dot]
+        else:
+            bucket.append(dot)
+
+    def discard(self, dot: Dot, cell: Tuple[int, int] = None) -> None:
+        """Stop tracking a dot (at `cell`, default its current one)."""
+        cell = (dot.x, dot.y) if cell is None else cell
+        bucket = self.dots[cell]
+        if len(bucket) == 1:
+            del self.dots[cell]
+        else:
+            bucket.remove(dot)
+
+    def moved(self, dot: Dot, old: Tuple[int, int]) -> None:
+        """Move a dot's entry from `old` to its current cell."""
+        if old != (dot.x, dot.y):
+            self.discard(dot, old)
+            self.place(dot)
+
+    def at(self, cell: Tuple[int, int]) -> List[Dot]:
+        """Dots in a cell (empty list if none)."""
+        return self.dots.get(cell, [])
+
+
 class Game:
-    """Main game logic that updates the snake, dots, and projectiles."""
-    def __init__(self, width: int = 53, height: int = 7):
+    """Main game logic that updates the snake, dots, and projectiles.
+
+    By default only the snake's head collides, as in the original game:
+    projectiles hit it and it eats the dots on its cell, found in one scan.
+    `body_collisions` lets projectiles hit any segment, a hash lookup in the
+    snake's SnakeBody. `projectile_hits_dots` lets projectiles destroy the
+    dots they land on; only then are dots kept in an occupancy grid, in step
+    with every move, so entities should be added and moved through the Game.
+    """
+    def __init__(self, width: int = 53, height: int = 7, body_collisions: bool = False,
+                 projectile_hits_dots: bool = False, wrap: bool = False):
         self.width = width
         self.height = height
+        self.body_collisions = body_collisions
+        self.projectile_hits_dots = projectile_hits_dots
+        self.wrap = wrap  # The snake wraps round the edges like the dots do
         # Start with a snake of length 6 moving right
         self.snake = Snake(body=[(5, 3), (4, 3), (3, 3), (2, 3), (1, 3), (0, 3)], direction=(1, 0))
         self.dots: List[Dot] = []
         self.projectiles: List[Projectile] = []
+        self.grid = OccupancyGrid() if projectile_hits_dots else None
+        self._view = None
 
     def spawn_dot(self, x: int, y: int, color: str) -> None:
-        self.dots.append(Dot(x, y, color))
+        dot = Dot(x, y, color)
+        self.dots.append(dot)
+        if self.grid is not None:
+            self.grid.place(dot)
+
+    def view(self) -> "GameView":
+        """Read-only view of the current tick, built once and reused until update()."""
+        if self._view is None:
+            self._view = GameView(self)
+        return self._view
 
     def update(self) -> None:
+        self._view = None
+        grid = self.grid
         # Move dots and possibly shoot
-        for dot in list(self.dots):
-            dot.move(self.width, self.height)
+        for dot in self.dots:
+            if grid is None:
+                dot.move(self.width, self.height)
+            else:
+                old = (dot.x, dot.y)
+                dot.move(self.width, self.height)
+                grid.moved(dot, old)
             if dot.ready_to_shoot():
                 projectile = dot.shoot(*self.snake.head_position())
                 if projectile:
                     self.projectiles.append(projectile)
-        # Move projectiles and check for collision with snake
-        for proj in list(self.projectiles):
+        # Move projectiles and check for collision with snake (and dots)
+        snake_cells = self.snake.body if self.body_collisions else (self.snake.head_position(),)
+        for proj in self.projectiles:
             proj.move(self.width, self.height)
-            if self.snake.check_collision_with_projectile(proj):
+            cell = (proj.x, proj.y)
+            if cell in snake_cells:
                 self.snake.alive = False
                 proj.alive = False
-                self.projectiles.remove(proj)
+            elif grid is not None and cell in grid.dots:
+                for dot in grid.dots.pop(cell):
+                    dot.alive = False
+                proj.alive = False
+        self.projectiles = [p for p in self.projectiles if p.alive]
         # Move snake
-        self.snake.move()
+        self.snake.move((self.width, self.height) if self.wrap else None)
         # Check if snake eats any dots
-        for dot in list(self.dots):
-            if self.snake.check_collision_with_dot(dot):
-                self.snake.grow()
-                self.dots.remove(dot)
+        head = self.snake.head_position()
+        if grid is None:
+            eaten = [dot for dot in self.dots if (dot.x, dot.y) == head]
+        else:
+            eaten = grid.dots.pop(head, ())
+        for dot in eaten:
+            self.snake.grow()
+            dot.alive = False
+        # With the grid, projectiles may have destroyed dots as well
+        if eaten or grid is not None:
+            self.dots = [d for d in self.dots if d.alive]
 
     def is_game_over(self) -> bool:
         return not self.snake.alive
@@ -133,56 +272,110 @@ class Game:
     def state(self) -> dict:
         """Return a dictionary representing the current state for debugging or rendering."""
         return {
-            "snake": self.snake.body,
+            "snake": list(self.snake.body),
             "dots": [(d.x, d.y, d.color) for d in self.dots],
             "projectiles": [(p.x, p.y, p.color) for p in self.projectiles],
         }
 
+class ReadOnlySequence(Sequence):
+    """Indexable, iterable window onto a list that cannot change it."""
+    __slots__ = ('_items',)
+
+    def __init__(self, items):
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, i):
+        return self._items[i]
+
+    def __iter__(self):
+        return iter(self._items)
+
+class GameView:
+    """Zero-copy, read-only view of a Game for rendering.
+
+    Exposes the same fields as FrameState, but the snake, dots and
+    projectiles are the game's own containers and entities (each with
+    `x`, `y`, `rgb` and `palette_index`), so nothing is copied. A view is
+    valid until the next Game.update().
+    """
+    __slots__ = ('width', 'height', 'snake', 'dots', 'projectiles')
+
+    def __init__(self, game: Game):
+        self.width = game.width
+        self.height = game.height
+        self.snake = ReadOnlySequence(game.snake.body)
+        self.dots = ReadOnlySequence(game.dots)
+        self.projectiles = ReadOnlySequence(game.projectiles)
+
+class Marker(NamedTuple):
+    """Position and resolved color of a dot or projectile in a FrameState."""
+    x: int
+    y: int
+    palette_index: int
+
+class FrameState(NamedTuple):
+    """Compact copy of the game state needed to render one frame (or send to a worker)."""
+    width: int
+    height: int
+    snake: Tuple[Tuple[int, int], ...]
+    dots: Tuple[Marker, ...]
+    projectiles: Tuple[Marker, ...]
+
+def snapshot(game: Game) -> FrameState:
+    """Copy the current game state into a FrameState."""
+    return FrameState(
+        width=game.width,
+        height=game.height,
+        snake=tuple(game.snake.body),
+        dots=tuple(Marker(d.x, d.y, d.palette_index) for d in game.dots),
+        projectiles=tuple(Marker(p.x, p.y, p.palette_index) for p in game.projectiles),
+    )
+
 def render_frame(game: Game, cell_size: int = 15) -> Image.Image:
-    """Render the current game state as a PIL Image."""
-    width = game.width * cell_size
-    height = game.height * cell_size
+    """Render the current game state as a P-mode PIL Image, without copying it."""
+    return render_state(game.view(), cell_size)
+
+def render_state(state: FrameState, cell_size: int = 15) -> Image.Image:
+    """Render a FrameState (or GameView) as a P-mode PIL Image."""
+    width = state.width * cell_size
+    height = state.height * cell_size
     
-    # Create image with dark background
-    img = Image.new('RGB', (width, height), color='#0D1117')
+    # Start from the cached dark background with grid lines
+    img = BACKGROUNDS.get((width, height), BACKGROUND_COLOR, GRID_COLOR, cell_size,
+                          mode='P', palette=PALETTE)
     draw = ImageDraw.Draw(img)
     
-    # Draw grid lines
-    for i in range(game.width + 1):
-        x = i * cell_size
-        draw.line([(x, 0), (x, height)], fill='#21262D', width=1)
-    for i in range(game.height + 1):
-        y = i * cell_size
-        draw.line([(0, y), (width, y)], fill='#21262D', width=1)
-    
     # Draw dots
-    for dot_x, dot_y, color in game.state()['dots']:
-        x = dot_x * cell_size
-        y = dot_y * cell_size
+    for dot in state.dots:
+        x = dot.x * cell_size
+        y = dot.y * cell_size
         draw.rectangle(
             [x + 2, y + 2, x + cell_size - 2, y + cell_size - 2],
-            fill=color
+            fill=dot.palette_index
         )
     
     # Draw projectiles
-    for proj_x, proj_y, color in game.state()['projectiles']:
-        x = proj_x * cell_size + cell_size // 2
-        y = proj_y * cell_size + cell_size // 2
+    for proj in state.projectiles:
+        x = proj.x * cell_size + cell_size // 2
+        y = proj.y * cell_size + cell_size // 2
         radius = 3
         draw.ellipse(
             [x - radius, y - radius, x + radius, y + radius],
-            fill=color
+            fill=proj.palette_index
         )
     
     # Draw snake
-    for i, (snake_x, snake_y) in enumerate(game.state()['snake']):
+    for i, (snake_x, snake_y) in enumerate(state.snake):
         x = snake_x * cell_size
         y = snake_y * cell_size
         # Head is brighter green
         if i == 0:
-            color = '#00FF00'
+            color = SNAKE_HEAD_INDEX
         else:
-            color = '#00AA00'
+            color = SNAKE_BODY_INDEX
         draw.rectangle(
             [x + 1, y + 1, x + cell_size - 1, y + cell_size - 1],
             fill=color
@@ -190,38 +383,64 @@ def render_frame(game: Game, cell_size: int = 15) -> Image.Image:
     
     return img
 
-def generate_gif(output_path: str = "dist/custom_snake.gif", num_steps: int = 200, cell_size: int = 15):
-    """Generate an animated GIF of the custom snake game."""
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    game = Game()
-    
-    # Spawn colored dots across the grid
-    colors = ['red', 'blue', 'green', 'yellow', 'orange', 'purple', 'cyan', 'magenta']
-    for i in range(15):
-        x = random.randint(0, game.width - 1)
-        y = random.randint(0, game.height - 1)
-        color = random.choice(colors)
-        game.spawn_dot(x, y, color)
-    
-    frames = []
-    
-    # Generate frames
+def render_state_numpy(state: FrameState, cell_size: int = 15) -> Image.Image:
+    """render_state stamped into a NumPy framebuffer of palette indices; same pixels.
+
+    Every dot, projectile and snake cell of a kind is one batch, however
+    many there are (a calendar board has hundreds).
+    """
+    fb = Framebuffer(BACKGROUNDS.get((state.width * cell_size, state.height * cell_size),
+                                     BACKGROUND_COLOR, GRID_COLOR, cell_size, mode='P', palette=PALETTE))
+    half = cell_size // 2
+    if state.dots:
+        dots = np.array([(dot.x, dot.y, dot.palette_index) for dot in state.dots])
+        fb.stamp(shape_stamp('rectangle', (2, 2, cell_size - 2, cell_size - 2)),
+                 dots[:, 0] * cell_size, dots[:, 1] * cell_size, dots[:, 2])
+    if state.projectiles:
+        projectiles = np.array([(proj.x, proj.y, proj.palette_index) for proj in state.projectiles])
+        fb.stamp(shape_stamp('ellipse', (-3, -3, 3, 3)), projectiles[:, 0] * cell_size + half,
+                 projectiles[:, 1] * cell_size + half, projectiles[:, 2])
+    if state.snake:
+        snake = np.array(state.snake)
+        colors = np.full(len(snake), SNAKE_BODY_INDEX)
+        colors[0] = SNAKE_HEAD_INDEX
+        fb.stamp(shape_stamp('rectangle', (1, 1, cell_size - 1, cell_size - 1)),
+                 snake[:, 0] * cell_size, snake[:, 1] * cell_size, colors)
+    return fb.image()
+
+# Frame renderers selectable with --renderer, by function name: they are
+# looked up when rendering starts, so --profile's wrappers are the ones called
+RENDERERS = {'draw': 'render_state', 'numpy': 'render_state_numpy'}
+
+def play(game: Game, num_steps: int, colors: List[str] = DOT_COLORS,
+         planner: Optional[DistanceField] = None,
+         copy: bool = False) -> Iterator[Union[GameView, FrameState]]:
+    """Advance the game, yielding its state before each update.
+
+    The state is the game's view, valid only until the next one is yielded,
+    so each must be rendered before asking for the next; with `copy` it is
+    a FrameState snapshot that can be kept or sent to a worker process.
+    With a `planner` (a DistanceField the size of a wrapping board) the
+    snake heads for the nearest dot instead of turning at random.
+    """
     for step in range(num_steps):
         if game.is_game_over():
             print(f"Game over at step {step}!")
             break
         
-        # Render current frame
-        frame = render_frame(game, cell_size)
-        frames.append(frame)
+        yield snapshot(game) if copy else game.view()
+        
+        if planner is not None:
+            planner.retarget((dot.x, dot.y) for dot in game.dots)
+            direction = planner.direction(game.snake.head_position(), game.snake.direction)
+            if direction:
+                game.snake.change_direction(direction)
         
         # Update game state
         game.update()
         
         # Occasionally change snake direction
-        if step % 20 == 0 and random.random() < 0.3:
+        if planner is None and step % 20 == 0 and random.random() < 0.3:
             directions = [(1, 0), (0, 1), (0, -1)]
             game.snake.change_direction(random.choice(directions))
         
@@ -231,36 +450,108 @@ def generate_gif(output_path: str = "dist/custom_snake.gif", num_steps: int = 20
             y = random.randint(0, game.height - 1)
             color = random.choice(colors)
             game.spawn_dot(x, y, color)
+
+def spawn_calendar_dots(game: Game, calendar: ContributionGrid, min_level: int = 1) -> int:
+    """Spawn a dot on every calendar day at `min_level` or above, colored by level."""
+    spawned = 0
+    for x, y, level in calendar.cells():
+        if level >= min_level and x < game.width and y < game.height:
+            game.spawn_dot(x, y, LEVEL_DOT_COLORS[level - 1])
+            spawned += 1
+    return spawned
+
+def generate_gif(output_path: str = "dist/custom_snake.gif", num_steps: int = 200, cell_size: int = 15,
+                 workers: int = 1, extra_outputs: Iterable[FrameSink] = (),
+                 calendar: Optional[ContributionGrid] = None, min_level: int = 1,
+                 plan: bool = False, renderer: str = 'draw'):
+    """Generate an animated GIF of the custom snake game.
+
+    With workers > 1, frames are rendered in a process pool; the output is
+    byte-identical to a single-process run with the same random seed.
+    `extra_outputs` are further sinks fed the same frames (WebP, APNG, ...).
+    With a `calendar` the board takes its size and the dots its days with
+    contributions at `min_level` or above. With `plan` the board wraps and
+    the snake is steered by a distance-field planner (see snake_planner).
+    `renderer` picks a RENDERERS entry; both draw the same pixels.
+    """
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
     
-    # Save as GIF
-    if frames:
-        frames[0].save(
-            output_path,
-            save_all=True,
-            append_images=frames[1:],
-            duration=100,  # 100ms per frame
-            loop=0
-        )
+    colors = DOT_COLORS
+    if calendar is not None:
+        game = Game(calendar.width, calendar.height, wrap=plan)
+        spawn_calendar_dots(game, calendar, min_level)
+    else:
+        game = Game(wrap=plan)
+        # Spawn colored dots across the grid
+        for i in range(15):
+            x = random.randint(0, game.width - 1)
+            y = random.randint(0, game.height - 1)
+            color = random.choice(colors)
+            game.spawn_dot(x, y, color)
+    
+    # Frames are streamed into the GIF (and any extra outputs) as they are rendered
+    gif = GifSink(output_path, FRAME_DURATION, loop=0)
+    render = functools.partial(getattr(sys.modules[__name__], RENDERERS[renderer]),
+                               cell_size=cell_size)
+    with OutputPipeline([gif, *extra_outputs]) as outputs:
+        planner = DistanceField(game.width, game.height) if plan else None
+        # Rendering in-process draws each view before the game moves on;
+        # worker processes need snapshots
+        states = play(game, num_steps, colors, planner, copy=workers > 1)
+        for frame in render_frames(render, states, workers):
+            outputs.append(frame)
+    
+    if outputs.frame_count:
         print(f"GIF saved to {output_path}")
+        if workers <= 1:
+            print(f"  background cache: {BACKGROUNDS.hits} hits, {BACKGROUNDS.misses} misses")
         return output_path
     else:
         print("No frames generated!")
         return None
 
-def main():
-    import sys
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Custom snake game with moving, shooting dots.")
+    parser.add_argument('--gif', nargs='?', const="dist/custom_snake.gif", metavar='PATH',
+                        help="render an animated GIF instead of printing the game state")
+    parser.add_argument('--workers', type=int, default=1, metavar='N',
+                        help="render frames in N worker processes")
+    parser.add_argument('--seed', type=int, help="random seed for a reproducible game")
+    parser.add_argument('--calendar', nargs='+', metavar='JSON',
+                        help="seed the board from contribution calendar JSON files (one per year)")
+    parser.add_argument('--plan', action='store_true',
+                        help="steer the snake to the nearest dot on a wrapping board")
+    parser.add_argument('--min-level', type=int, default=1, choices=range(1, 5),
+                        help="only days at this contribution level or above spawn dots")
+    parser.add_argument('--renderer', choices=sorted(RENDERERS), default='draw',
+                        help="draw with ImageDraw, or stamp into a NumPy framebuffer")
+    add_output_arguments(parser, themes=THEMES)
+    add_profile_argument(parser)
+    args = parser.parse_args(argv)
+    profiler = Profiler.install(sys.modules[__name__], PROFILED) if args.profile else None
+    
+    if args.seed is not None:
+        random.seed(args.seed)
+    calendar = load_calendar(args.calendar) if args.calendar else None
     
     # Check if we should generate GIF or run demo
-    if len(sys.argv) > 1 and sys.argv[1] == '--gif':
-        output_path = sys.argv[2] if len(sys.argv) > 2 else "dist/custom_snake.gif"
-        generate_gif(output_path)
+    if args.gif:
+        generate_gif(args.gif, workers=args.workers, calendar=calendar, min_level=args.min_level,
+                     plan=args.plan, renderer=args.renderer,
+                     extra_outputs=extra_sinks(args, FRAME_DURATION,
+                                               themes={name: theme_palette(name) for name in THEMES}))
     else:
         # Run a simple simulation printing the state each turn
-        game = Game()
-        # Spawn sample dots of different colors
-        game.spawn_dot(10, 2, "red")
-        game.spawn_dot(20, 4, "blue")
-        game.spawn_dot(30, 1, "green")
+        if calendar is not None:
+            game = Game(calendar.width, calendar.height)
+            spawn_calendar_dots(game, calendar, args.min_level)
+        else:
+            game = Game()
+            # Spawn sample dots of different colors
+            game.spawn_dot(10, 2, "red")
+            game.spawn_dot(20, 4, "blue")
+            game.spawn_dot(30, 1, "green")
         
         for step in range(50):
             if game.is_game_over():
@@ -269,5 +560,8 @@ def main():
             game.update()
             print(f"Step {step}:", game.state())
 
+    if profiler:
+        profiler.report(args.profile)
+
 if __name__ == "__main__":
     main()
@@ -8,6 +8,8 @@ Dots move randomly and occasionally shoot projectiles at the snake. When the sna
 import random
 import math
 
+from snake_body import SnakeBody
+
 class Dot:
     def __init__(self, x, y, color):
         self.x = x
@@ -63,23 +65,21 @@ class Projectile:
 
 class Snake:
     def __init__(self, body, direction):
-        self.body = list(body)
+        self.body = SnakeBody(body)
         self.direction = direction  # (dx, dy)
         self.alive = True
 
     def move(self):
         """Move the snake forward by one cell."""
-        head_x, head_y = self.body[0]
+        head_x, head_y = self.body.head
         dx, dy = self.direction
         new_head = (head_x + dx, head_y + dy)
-        # Insert new head and remove tail
-        self.body.insert(0, new_head)
-        self.body.pop()
+        # Push the new head and drop the tail, both O(1)
+        self.body.move(new_head)
 
     def grow(self):
         """Grow the snake by adding an extra segment at the tail."""
-        tail = self.body[-1]
-        self.body.append(tail)
+        self.body.grow()
 
     def check_collision_with_dot(self, dot):
         return self.body[0] == (dot.x, dot.y)
@@ -0,0 +1,266 @@
+"""
+framebuffer.py
+NumPy raster backend for the animation scripts.
+A Framebuffer holds a frame as a uint8 array (H x W x 3 for RGB frames,
+H x W palette indices for P frames) and draws by stamping. A Stamp is a
+shape or sprite rasterized once by PIL into pixel offsets, and one call
+places it at any number of positions with index arithmetic, instead of one
+ImageDraw call per shape. The frame goes back to PIL with a single
+Image.fromarray.
+
+Stamps are queued and composited when the image is taken. Every placement
+has a place in the draw order, and the queued pixel writes are replayed per
+pixel in that order with Pillow's own integer blending (paste with an alpha
+mask, or alpha_composite onto an opaque frame). Overlapping shapes therefore
+come out exactly as the same sequence of ImageDraw/paste calls draws them.
+Writes hidden under a later opaque one are skipped, and the blends above it
+are applied one round per depth of overlap.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image, ImageDraw
+
+# How a sprite's alpha is combined with the frame: Image.paste(sprite, box,
+# sprite), or Image.alpha_composite onto an opaque frame
+COMPOSITES = ('paste', 'over')
+
+
+def _div255(values: np.ndarray) -> np.ndarray:
+    """Pillow's rounded division by 255 (DIV255 in its C code)."""
+    values = values + 128
+    return ((values >> 8) + values) >> 8
+
+
+def _blend(dst: np.ndarray, src: np.ndarray, alpha: np.ndarray, over: np.ndarray) -> np.ndarray:
+    """Pillow's paste and alpha_composite arithmetic, per write (int32 arrays)."""
+    pasted = _div255(dst * (255 - alpha) + src * alpha)
+    if not over.any():
+        return pasted
+    # alpha_composite with an opaque destination: 7 bits of extra precision
+    tmp = (src * alpha + dst * (255 - alpha)) * 128 + (128 << 7)
+    composited = (((tmp >> 8) + tmp) >> 8) >> 7
+    return np.where(over, composited, pasted)
+
+
+class Stamp:
+    """Pixels a shape or sprite covers, relative to the point it is placed at.
+
+    `dx`, `dy` are the pixel offsets and `alpha` their coverage (255 is
+    opaque). `colors` holds a color per pixel for sprites; shapes have none
+    and take their color from each placement.
+    """
+
+    __slots__ = ('dx', 'dy', 'alpha', 'colors', 'composite', 'bounds')
+
+    def __init__(self, dx: np.ndarray, dy: np.ndarray, alpha: np.ndarray,
+                 colors: Optional[np.ndarray] = None, composite: str = 'paste'):
+        if composite not in COMPOSITES:
+            raise ValueError(f"unknown composite {composite!r}, expected one of {COMPOSITES}")
+        self.dx = np.asarray(dx, dtype=np.int64)
+        self.dy = np.asarray(dy, dtype=np.int64)
+        self.alpha = np.asarray(alpha, dtype=np.uint8)
+        self.colors = colors
+        self.composite = composite
+        # Offsets of the bounding box, to tell placements that need no clipping
+        self.bounds = ((int(self.dx.min()), int(self.dy.min()), int(self.dx.max()), int(self.dy.max()))
+                       if len(self.dx) else (0, 0, 0, 0))
+
+    def __len__(self) -> int:
+        return len(self.dx)
+
+    @classmethod
+    def shape(cls, kind: str, xy: Sequence[float]) -> 'Stamp':
+        """The pixels ImageDraw fills for `kind` ('ellipse', 'rectangle' or 'polygon').
+
+        `xy` is given relative to the placement point. Rasterizing is the
+        same at every whole-pixel position, so placing the stamp at (x, y)
+        fills what drawing the shape shifted by (x, y) does.
+        """
+        flat = list(np.ravel(xy).tolist())
+        points = list(zip(flat[0::2], flat[1::2]))
+        left = int(np.floor(min(x for x, _ in points)))
+        top = int(np.floor(min(y for _, y in points)))
+        right = int(np.ceil(max(x for x, _ in points)))
+        bottom = int(np.ceil(max(y for _, y in points)))
+        mask = Image.new('L', (right - left + 1, bottom - top + 1), 0)
+        getattr(ImageDraw.Draw(mask), kind)([(x - left, y - top) for x, y in points], fill=255)
+        ys, xs = np.nonzero(np.asarray(mask))
+        return cls(xs + left, ys + top, np.full(len(xs), 255))
+
+    @classmethod
+    def sprite(cls, image: Image.Image, composite: str = 'paste') -> 'Stamp':
+        """An RGBA sprite whose centre pixel (width // 2, height // 2) is placed.
+
+        Fully transparent pixels are dropped; the rest blend by their alpha.
+        """
+        rgba = np.asarray(image.convert('RGBA'))
+        ys, xs = np.nonzero(rgba[..., 3])
+        return cls(xs - image.width // 2, ys - image.height // 2, rgba[ys, xs, 3],
+                   rgba[ys, xs, :3], composite)
+
+
+@lru_cache(maxsize=None)
+def shape_stamp(kind: str, xy: Tuple[float, ...]) -> Stamp:
+    """Stamp.shape, built once per shape and size."""
+    return Stamp.shape(kind, xy)
+
+
+class Framebuffer:
+    """A frame as a uint8 array, drawn on by stamping shapes and sprites.
+
+    RGB(A) images become H x W x 3 arrays (an RGBA frame is taken to be
+    opaque), P images H x W arrays of palette indices, whose colors are
+    then indices too. `pixels` may be written directly; pending stamps go
+    over whatever it holds when the image is taken.
+    """
+
+    def __init__(self, image: Image.Image):
+        if image.mode not in ('RGB', 'RGBA', 'P'):
+            raise ValueError(f"framebuffer needs an RGB or P image, got {image.mode}")
+        self.palette = image.getpalette() if image.mode == 'P' else None
+        self.pixels = np.array(image.convert('RGB') if image.mode == 'RGBA' else image)
+        self.height, self.width = self.pixels.shape[:2]
+        self._queue = []
+        self._placed: Dict[int, Tuple[Stamp, list, list, list, list]] = {}
+        self._next = 0
+
+    def stamp(self, stamp: Stamp, xs: Sequence[int], ys: Sequence[int], colors=None,
+              order: Sequence[int] = None) -> None:
+        """Queue `stamp` at every (xs[i], ys[i]).
+
+        Shape stamps need `colors`: one per placement, or one for all.
+        `order` places each one in the draw order (higher is drawn later);
+        by default they follow everything queued so far, in sequence.
+        """
+        xs = np.asarray(xs, dtype=np.int64).reshape(-1)
+        ys = np.asarray(ys, dtype=np.int64).reshape(-1)
+        count = len(xs)
+        if order is None:
+            order = np.arange(self._next, self._next + count)
+        else:
+            order = np.broadcast_to(np.asarray(order, dtype=np.int64), (count,))
+        if count == 0:
+            return
+        self._next = max(self._next, int(order.max()) + 1)
+
+        left, top, right, bottom = stamp.bounds
+        if (xs.min() + left >= 0 and xs.max() + right < self.width
+                and ys.min() + top >= 0 and ys.max() + bottom < self.height):
+            # Nothing to clip: every placement writes all of its pixels
+            index = ((ys * self.width + xs)[:, None] + (stamp.dy * self.width + stamp.dx)).ravel()
+            which = np.repeat(np.arange(count), len(stamp))
+            pixel = np.tile(np.arange(len(stamp)), count)
+        else:
+            x = xs[:, None] + stamp.dx
+            y = ys[:, None] + stamp.dy
+            inside = (x >= 0) & (x < self.width) & (y >= 0) & (y < self.height)
+            which, pixel = np.nonzero(inside)
+            index = y[inside] * self.width + x[inside]
+        if stamp.colors is not None:
+            color = stamp.colors[pixel]
+        else:
+            if colors is None:
+                raise ValueError("shape stamps need colors")
+            colors = np.asarray(colors, dtype=np.uint8)
+            if colors.ndim < self.pixels.ndim - 1:
+                colors = np.broadcast_to(colors, (count,) + self.pixels.shape[2:])
+            color = colors[which]
+        self._queue.append((index, order[which], stamp.alpha[pixel],
+                            color, np.full(len(which), stamp.composite == 'over')))
+
+    def place(self, stamp: Stamp, x: int, y: int, color=None) -> None:
+        """Queue one placement, next in the draw order.
+
+        Placements are collected per stamp and handed to stamp() together,
+        so drawing entity by entity still rasterizes in batches.
+        """
+        entry = self._placed.get(id(stamp))
+        if entry is None:
+            entry = self._placed[id(stamp)] = (stamp, [], [], [], [])
+        entry[1].append(x)
+        entry[2].append(y)
+        entry[3].append(color)
+        entry[4].append(self._next)
+        self._next += 1
+
+    def _composite(self) -> None:
+        """Apply every queued write, per pixel in draw order."""
+        placed, self._placed = self._placed, {}
+        for stamp, xs, ys, colors, order in placed.values():
+            self.stamp(stamp, xs, ys, None if stamp.colors is not None else colors, order)
+        if not self._queue:
+            return
+        index, order, alpha, color, over = (np.concatenate(parts) for parts in zip(*self._queue))
+        self._queue = []
+        flat = self.pixels.reshape(self.width * self.height, -1)
+        color = color.reshape(len(index), -1)
+
+        # Pixels that are only ever written opaquely just take their last
+        # write; only those under a blend need their writes in order
+        opaque = alpha == 255
+        if opaque.all():
+            self._write_last(flat, index, order, color)
+            return
+        blended = np.zeros(len(flat), dtype=bool)
+        blended[index[~opaque]] = True
+        simple = ~blended[index]
+        self._write_last(flat, index[simple], order[simple], color[simple])
+        ordered = ~simple
+        self._write_ordered(flat, index[ordered], order[ordered], alpha[ordered],
+                            color[ordered], over[ordered])
+
+    @staticmethod
+    def _write_last(flat, index, order, color) -> None:
+        """Opaque writes: each pixel gets the one latest in the draw order."""
+        last = np.full(len(flat), -1, dtype=np.int64)
+        np.maximum.at(last, index, order)
+        shown = order == last[index]
+        flat[index[shown]] = color[shown]
+
+    @staticmethod
+    def _write_ordered(flat, index, order, alpha, color, over) -> None:
+        """Any writes: replayed per pixel in draw order, a round per overlap depth."""
+        # Group the writes by pixel, each group in draw order (a placement
+        # covers a pixel at most once, so the combined keys are unique, and
+        # its pixels are queued in ascending order: a stable sort merges runs)
+        sort = np.argsort(index * (int(order.max()) + 1) + order, kind='stable')
+        index = index[sort]
+        position = np.arange(len(index))
+        first = np.ones(len(index), dtype=bool)
+        np.not_equal(index[1:], index[:-1], out=first[1:])
+        group = np.cumsum(first) - 1
+        start = position[first]
+        end = np.append(start[1:], len(index)) - 1
+
+        # A pixel shows its last opaque write and the blends drawn after it;
+        # depth counts the writes from there, and each depth is one round
+        opaque = np.where(alpha[sort] == 255, position, -1)
+        depth = position - np.maximum(np.maximum.accumulate(opaque)[end], start)[group]
+        keep = np.flatnonzero(depth >= 0)
+        keep = keep[np.argsort(depth[keep], kind='stable')]
+        rounds = np.bincount(depth[keep]).tolist()
+        index = index[keep]
+        keep = sort[keep]
+        alpha, color, over = alpha[keep], color[keep], over[keep]
+
+        low = 0
+        for count in rounds:
+            at, src, a = index[low:low + count], color[low:low + count], alpha[low:low + count]
+            if (a == 255).all():
+                flat[at] = src
+            else:
+                # Blending with alpha 255 gives the source exactly
+                flat[at] = _blend(flat[at].astype(np.int32), src.astype(np.int32),
+                                  a[:, None].astype(np.int32), over[low:low + count, None])
+            low += count
+
+    def image(self) -> Image.Image:
+        """The finished frame as a PIL image (P frames keep their palette)."""
+        self._composite()
+        img = Image.fromarray(self.pixels)
+        if self.palette is not None:
+            img.putpalette(self.palette)
+        return img
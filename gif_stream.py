@@ -0,0 +1,135 @@
+"""
+gif_stream.py
+Streaming animated GIF writer.
+Frames are encoded and written to disk as they arrive, so only the current
+frame is ever held in memory no matter how long the animation is.
+"""
+
+from typing import List, NamedTuple, Optional, Tuple
+from PIL import GifImagePlugin, Image, ImageChops
+
+# Disposal method 1: leave the frame in place for the next one to draw over
+DISPOSAL_KEEP = 1
+
+
+class FrameDelta(NamedTuple):
+    """What the delta encoder wrote for one frame."""
+    index: int
+    bbox: Tuple[int, int, int, int]
+    raw_bytes_saved: int   # P-mode pixel bytes not written versus a full frame
+    encoded_bytes: int
+
+
+class GifStreamWriter:
+    """Append frames one at a time to an animated GIF on disk.
+
+    The first frame's palette becomes the global color table; later frames
+    carry a local color table only when their palette differs from it.
+    With `optimize`, each frame's palette is trimmed to the colors it uses.
+
+    With `delta`, each frame is diffed against the previous one and only the
+    changed bounding box is written (disposal 1 keeps the rest on screen).
+    Frames identical to their predecessor just extend its duration. Per-frame
+    results are collected in `deltas`.
+    """
+
+    def __init__(self, path: str, duration: int, loop: int = 0, optimize: bool = False,
+                 delta: bool = False):
+        self.path = path
+        self.duration = duration
+        self.loop = loop
+        self.optimize = optimize
+        self.delta = delta
+        self.frame_count = 0
+        self.deltas: List[FrameDelta] = []
+        self._fp = None
+        self._global_palette: Optional[bytes] = None
+        self._previous: Optional[Image.Image] = None
+        self._pending = None  # (index, cropped frame, bbox, duration) awaiting its final duration
+
+    def __enter__(self) -> "GifStreamWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _to_palette(self, frame: Image.Image) -> Image.Image:
+        """Quantize to a palette image, trimming unused entries if optimizing."""
+        if frame.mode in ('P', 'L'):
+            im = frame
+        else:
+            im = frame.convert('P', palette=Image.Palette.ADAPTIVE)
+        if self.optimize:
+            used = [i for i, count in enumerate(im.histogram()) if count]
+            im = im.remap_palette(used)
+        return im
+
+    def _changed_box(self, im: Image.Image):
+        """Bounding box of pixels that differ from the previous frame.
+
+        Returns the full frame when there is nothing to diff against (or the
+        palettes differ, so equal indices need not mean equal colors), and
+        None when the frame is identical to the previous one.
+        """
+        full = (0, 0) + im.size
+        prev = self._previous
+        if prev is None or prev.size != im.size or prev.mode != im.mode:
+            return full
+        if im.mode == 'P' and prev.palette.palette != im.palette.palette:
+            return full
+        return ImageChops.difference(prev, im).getbbox()
+
+    def _write(self, im: Image.Image, offset: Tuple[int, int], duration: int) -> int:
+        """Encode one image block; returns the number of bytes written."""
+        params = {'duration': duration}
+        if self._fp is None:
+            self._fp = open(self.path, 'wb')
+            header, _ = GifImagePlugin.getheader(im, info={'loop': self.loop, 'duration': duration})
+            self._fp.write(b''.join(header))
+            self._global_palette = bytes(im.palette.palette)
+        elif bytes(im.palette.palette) != self._global_palette:
+            params['include_color_table'] = True
+        if self.delta:
+            params['disposal'] = DISPOSAL_KEEP
+        data = b''.join(GifImagePlugin.getdata(im, offset, **params))
+        self._fp.write(data)
+        return len(data)
+
+    def _flush(self) -> None:
+        """Write the held-back delta frame now that its duration is final."""
+        if self._pending is None:
+            return
+        index, im, bbox, duration = self._pending
+        self._pending = None
+        width, height = self._previous.size
+        size = self._write(im, bbox[:2], duration)
+        saved = width * height - (bbox[2] - bbox[0]) * (bbox[3] - bbox[1])
+        self.deltas.append(FrameDelta(index, bbox, saved, size))
+
+    def append(self, frame: Image.Image) -> None:
+        """Encode one frame and write it to the file."""
+        im = self._to_palette(frame)
+        if not self.delta:
+            # The encoder stores its options on the image; leave the caller's alone
+            self._write(im.copy() if im is frame else im, (0, 0), self.duration)
+            self.frame_count += 1
+            return
+
+        bbox = self._changed_box(im)
+        if bbox is None:
+            # Nothing changed: keep showing the previous frame for longer
+            index, pending, pending_box, duration = self._pending
+            self._pending = (index, pending, pending_box, duration + self.duration)
+        else:
+            self._flush()
+            self._pending = (self.frame_count, im.crop(bbox), bbox, self.duration)
+            self._previous = im
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """Write the GIF trailer and close the file (no-op if nothing was written)."""
+        self._flush()
+        if self._fp is not None:
+            self._fp.write(b';')
+            self._fp.close()
+            self._fp = None
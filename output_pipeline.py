@@ -0,0 +1,232 @@
+"""
+output_pipeline.py
+Fan rendered frames out to several encoders in one pass.
+Each output (GIF, animated WebP, APNG, still PNGs) is a sink with its own
+worker thread and bounded queue: the render loop hands every frame over
+once and only blocks when an encoder falls `queue_size` frames behind.
+Theme variants are sinks too: they recolor each indexed frame by swapping
+its palette before handing it to their own encoder.
+
+Pillow's animated WebP and APNG writers cannot consume frames as a stream
+(WebP turns append_images into a list up front, APNG walks it twice), so
+those sinks collect their frames and encode them when the pipeline closes.
+Frames are kept as rendered, which for the palette-mapped scripts is one
+byte per pixel. The GIF sink streams to disk as frames arrive.
+"""
+
+import queue
+import threading
+from typing import Dict, Iterable, List, Optional
+
+from PIL import Image
+
+from gif_stream import GifStreamWriter
+from palette import Palette, swap_palette
+
+
+# ============================================================================
+# SINKS
+# ============================================================================
+
+class FrameSink:
+    """One output; `write` is called with every frame, in order, on one thread."""
+
+    def write(self, index: int, frame: Image.Image) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class GifSink(FrameSink):
+    """Streaming animated GIF; the GifStreamWriter is exposed as `writer`."""
+
+    def __init__(self, path: str, duration: int, loop: int = 0, **options):
+        self.writer = GifStreamWriter(path, duration, loop=loop, **options)
+
+    def write(self, index, frame):
+        self.writer.append(frame)
+
+    def close(self):
+        self.writer.close()
+
+
+class _CollectingSink(FrameSink):
+    """Collects frames and saves them as one animation at close."""
+    format = None
+
+    def __init__(self, path: str, duration: int, loop: int = 0, **options):
+        self.path = path
+        self.options = dict(options, duration=duration, loop=loop)
+        self.frames: List[Image.Image] = []
+
+    def write(self, index, frame):
+        self.frames.append(frame)
+
+    def close(self):
+        if self.frames:
+            first, *rest = self.frames
+            # save() sets attributes on the image, which other sinks may share
+            first.copy().save(self.path, format=self.format, save_all=True, append_images=rest,
+                       **self.options)
+        self.frames = []
+
+
+class WebPSink(_CollectingSink):
+    """Animated WebP, lossless unless told otherwise."""
+    format = 'WEBP'
+
+    def __init__(self, path: str, duration: int, loop: int = 0, lossless: bool = True, **options):
+        super().__init__(path, duration, loop, lossless=lossless, **options)
+
+
+class ApngSink(_CollectingSink):
+    """Animated PNG."""
+    format = 'PNG'
+
+
+class StillSink(FrameSink):
+    """Saves selected frames as PNGs: {frame index: path}."""
+
+    def __init__(self, frames: Dict[int, str]):
+        self.frames = dict(frames)
+
+    def write(self, index, frame):
+        path = self.frames.get(index)
+        if path:
+            frame.copy().save(path)  # save() sets attributes on the shared frame
+
+
+class PaletteSwapSink(FrameSink):
+    """Feeds another sink the frames recolored with a palette of the same layout."""
+
+    def __init__(self, sink: FrameSink, palette: Palette):
+        self.sink = sink
+        self.palette = palette
+
+    def write(self, index, frame):
+        self.sink.write(index, swap_palette(frame, self.palette))
+
+    def close(self):
+        self.sink.close()
+
+
+def sink_for_path(path: str, duration: int, loop: int = 0) -> FrameSink:
+    """Animation sink chosen by file extension (.webp, .png, otherwise GIF)."""
+    extension = path.lower().rsplit('.', 1)[-1]
+    if extension == 'webp':
+        return WebPSink(path, duration, loop)
+    if extension in ('png', 'apng'):
+        return ApngSink(path, duration, loop)
+    return GifSink(path, duration, loop, delta=True)
+
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+_DONE = object()
+
+
+class OutputPipeline:
+    """Hand each frame to every sink, each running on its own thread.
+
+    Frames are shared between sinks, so sinks must not modify them (that
+    includes Pillow's save(), which stores encoder options on the image). An
+    exception in a sink stops only that sink; it is re-raised by close().
+    """
+
+    def __init__(self, sinks: Iterable[FrameSink], queue_size: int = 8):
+        self.sinks = list(sinks)
+        self.frame_count = 0
+        self._queues = [queue.Queue(maxsize=queue_size) for _ in self.sinks]
+        self._errors: List[BaseException] = []
+        self._threads = [
+            threading.Thread(target=self._run, args=(sink, q), name=type(sink).__name__, daemon=True)
+            for sink, q in zip(self.sinks, self._queues)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __enter__(self) -> "OutputPipeline":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run(self, sink: FrameSink, frames: queue.Queue) -> None:
+        failed = False
+        while True:
+            item = frames.get()
+            if item is _DONE:
+                break
+            if failed:
+                continue  # Keep draining so the producer never blocks on us
+            try:
+                sink.write(*item)
+            except BaseException as e:
+                self._errors.append(e)
+                failed = True
+        if not failed:
+            try:
+                sink.close()
+            except BaseException as e:
+                self._errors.append(e)
+
+    def append(self, frame: Image.Image) -> None:
+        """Queue a frame for every sink (blocks while any queue is full)."""
+        item = (self.frame_count, frame)
+        for q in self._queues:
+            q.put(item)
+        self.frame_count += 1
+
+    def close(self) -> None:
+        """Flush every sink, wait for them to finish and raise the first error."""
+        if not self._threads:
+            return
+        for q in self._queues:
+            q.put(_DONE)
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        if self._errors:
+            raise self._errors[0]
+
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def add_output_arguments(parser, themes: Iterable[str] = ()) -> None:
+    """Shared --webp/--apng/--still (and --theme, given theme names) options."""
+    parser.add_argument('--webp', metavar='PATH', help="also write an animated WebP")
+    parser.add_argument('--apng', metavar='PATH', help="also write an animated PNG")
+    parser.add_argument('--still', nargs=2, action='append', default=[], metavar=('FRAME', 'PATH'),
+                        help="also save frame FRAME as a PNG (repeatable)")
+    themes = list(themes)
+    if themes:
+        parser.add_argument('--theme', nargs=2, action='append', default=[], metavar=('NAME', 'PATH'),
+                            help=f"also write the animation in theme NAME ({', '.join(themes)}) "
+                                 "to PATH (.gif, .webp or .png; repeatable)")
+
+
+def extra_sinks(args, duration: int, loop: int = 0, stills: Optional[Dict[int, str]] = None,
+                themes: Optional[Dict[str, Palette]] = None) -> List[FrameSink]:
+    """Sinks for the extra outputs requested on the command line.
+
+    `themes` maps theme names to palettes laid out like the rendered frames'.
+    """
+    sinks: List[FrameSink] = []
+    for name, path in getattr(args, 'theme', []):
+        if not themes or name not in themes:
+            raise ValueError(f"unknown theme {name!r}; choose from {', '.join(themes or ())}")
+        sinks.append(PaletteSwapSink(sink_for_path(path, duration, loop), themes[name]))
+    if args.webp:
+        sinks.append(WebPSink(args.webp, duration, loop))
+    if args.apng:
+        sinks.append(ApngSink(args.apng, duration, loop))
+    frames = dict(stills or {})
+    frames.update((int(index), path) for index, path in args.still)
+    if frames:
+        sinks.append(StillSink(frames))
+    return sinks
@@ -0,0 +1,199 @@
+"""
+palette.py
+Fixed global palettes for the animation scripts.
+Each script derives one palette from its color tables, plus ramps for glows
+and gradients. Frames are then drawn straight into P-mode images or mapped
+through a precomputed RGB -> index lookup table, so the GIF encoder never
+has to quantize a frame (and the colors cannot flicker between frames).
+
+Color themes reuse one palette layout with different colors: a frame
+rendered once can be shown in another theme by swapping its 256-entry
+color table, without touching the pixels. For that, a blended or gradient
+pixel must land on a ramp entry and never on a solid color's: the solid
+entries are only matched exactly, everything else goes to the nearest
+ramp entry, and so each index keeps one meaning in every theme.
+"""
+
+from typing import Iterable, List, Sequence, Tuple, Union
+import numpy as np
+from PIL import Image, ImageColor
+
+RGB = Tuple[int, int, int]
+Color = Union[str, Sequence[int]]
+
+# Lookup table resolution per channel (6 bits -> 64x64x64 entries)
+LUT_BITS = 6
+
+
+def mix(a: RGB, b: RGB, t: float) -> RGB:
+    """Linear blend from color a (t=0) to color b (t=1)."""
+    return tuple(int(round(ca + (cb - ca) * t)) for ca, cb in zip(a, b))
+
+
+def ramp(start: RGB, end: RGB, steps: int) -> List[RGB]:
+    """`steps` colors from start to end inclusive."""
+    if steps == 1:
+        return [tuple(start)]
+    return [mix(start, end, i / (steps - 1)) for i in range(steps)]
+
+
+def _rgb(color: Color) -> RGB:
+    if isinstance(color, str):
+        return ImageColor.getrgb(color)[:3]
+    return tuple(color[:3])
+
+
+class Palette:
+    """Up to 256 colors with exact, nearest and whole-image index lookups.
+
+    Entries keep the order they were given in (duplicates included), so two
+    palettes built from the same layout line up index for index. Entries
+    from `ramp_start` on are the ramps: colors that match no entry exactly
+    map to the nearest of those. Without ramps any entry can be nearest.
+    """
+
+    def __init__(self, colors: Iterable[Color], ramp_start: int = 0):
+        self.colors = [_rgb(c) for c in colors]
+        if not self.colors or len(self.colors) > 256:
+            raise ValueError(f"palette needs 1-256 colors, got {len(self.colors)}")
+        self.ramp_start = ramp_start if ramp_start < len(self.colors) else 0
+        self._index = {}
+        for i, color in enumerate(self.colors):
+            self._index.setdefault(color, i)
+        self._lut = None
+        self._nearest = None  # Cell -> nearest ramp entry, ignoring solid colors
+        self._solid = None  # Cell -> the solid color it holds, as map() packs pixels (0 if none)
+        self._solid_extra = []  # (packed, index) of solid colors sharing a cell
+
+    def __len__(self):
+        return len(self.colors)
+
+    @property
+    def flat(self) -> List[int]:
+        """768-value palette for putpalette, padded with the first color."""
+        padded = self.colors + [self.colors[0]] * (256 - len(self.colors))
+        return [c for color in padded for c in color]
+
+    @property
+    def lut(self) -> np.ndarray:
+        """Palette index for every (r, g, b) >> (8 - LUT_BITS) cell.
+
+        That is the nearest (ramp) entry, except in cells holding a palette
+        color, which map to it; map() sends pixels there that are not
+        exactly a solid color to the nearest ramp entry after all.
+        """
+        if self._lut is None:
+            self._build_lut()
+        return self._lut
+
+    def _build_lut(self) -> None:
+        size = 1 << LUT_BITS
+        shift = 8 - LUT_BITS
+        centers = (np.arange(size, dtype=np.uint16) << shift) + (1 << shift >> 1)
+        r, g, b = np.meshgrid(centers, centers, centers, indexing='ij')
+        cube = np.stack([r, g, b], axis=-1).astype(np.uint8).reshape(size * size, size, 3)
+
+        # Pillow's fixed-palette conversion does the nearest-color search in C,
+        # over the ramp entries (padded with the first of them)
+        ramps = self.colors[self.ramp_start:]
+        pal_img = Image.new('P', (1, 1))
+        pal_img.putpalette([c for color in ramps + ramps[:1] * (256 - len(ramps)) for c in color])
+        mapped = Image.fromarray(cube).quantize(palette=pal_img, dither=Image.Dither.NONE)
+        lut = np.asarray(mapped, dtype=np.uint8).reshape(-1).copy()
+        lut[lut >= len(ramps)] = 0  # Padding entries repeat the first ramp color
+        lut += self.ramp_start
+
+        # Colors that are in the palette always map to themselves
+        solid = []
+        for color, i in self._index.items():
+            if i >= self.ramp_start:
+                lut[self._cell(*color)] = i
+            else:
+                solid.append((color, i))
+        if solid:
+            self._nearest = lut.copy()
+            self._solid = np.zeros(len(lut), dtype=np.uint32)
+            for color, i in solid:
+                cell = self._cell(*color)
+                value = color[0] | color[1] << 8 | color[2] << 16 | 0xFF000000
+                if not self._solid[cell]:
+                    lut[cell], self._solid[cell] = i, value
+                else:
+                    self._solid_extra.append((value, i))
+        self._lut = lut
+
+    @staticmethod
+    def _cell(r: int, g: int, b: int) -> int:
+        shift = 8 - LUT_BITS
+        return ((r >> shift) << (2 * LUT_BITS)) | ((g >> shift) << LUT_BITS) | (b >> shift)
+
+    def index(self, color: Color) -> int:
+        """Palette index of a color: exact match, else the nearest (ramp) entry."""
+        rgb = _rgb(color)
+        i = self._index.get(rgb)
+        if i is None:
+            lut = self.lut if self._nearest is None else self._nearest
+            i = int(lut[self._cell(*rgb)])
+        return i
+
+    def new_image(self, size: Tuple[int, int], color: Color = 0) -> Image.Image:
+        """Blank P-mode image carrying this palette, filled with `color`."""
+        fill = color if isinstance(color, int) else self.index(color)
+        img = Image.new('P', size, fill)
+        img.putpalette(self.flat)
+        return img
+
+    def map(self, img: Image.Image) -> Image.Image:
+        """Map an RGB(A) frame onto this palette through the lookup table."""
+        if img.mode == 'P' and img.getpalette() == self.flat:
+            return img
+        # One 0xFFBBGGRR integer per pixel (RGBX pads with 255)
+        pixels = np.asarray(img.convert('RGBX')).view('<u4')[..., 0]
+        shift = 8 - LUT_BITS
+        mask = (1 << LUT_BITS) - 1
+        # Its LUT cell (r, g, b top bits), computed in place to spare temporaries
+        cells = pixels >> (16 + shift)
+        cells &= mask
+        part = pixels >> (8 + shift - LUT_BITS)
+        part &= mask << LUT_BITS
+        cells |= part
+        np.bitwise_and(pixels, mask << shift, out=part)
+        part <<= 2 * LUT_BITS - shift
+        cells |= part
+        del part
+        cells = cells.astype(np.intp)
+        indices = np.take(self.lut, cells)
+        if self._solid is not None:
+            # Pixels in a solid color's cell that are not exactly that color
+            # are blends, which belong on the nearest ramp entry
+            solid = np.take(self._solid, cells)
+            stray = np.flatnonzero((solid != pixels) & (solid != 0))
+            if len(stray):
+                flat = indices.reshape(-1)
+                flat[stray] = np.take(self._nearest, cells.reshape(-1)[stray])
+            for value, i in self._solid_extra:
+                indices[pixels == value] = i
+        out = Image.frombytes('P', img.size, indices.tobytes())
+        out.putpalette(self.flat)
+        return out
+
+
+def swap_palette(frame: Image.Image, palette: Palette) -> Image.Image:
+    """Copy of an indexed frame showing the same indices through `palette`."""
+    if frame.mode != 'P':
+        raise ValueError(f"palette swap needs a P-mode frame, got {frame.mode}")
+    out = frame.copy()
+    out.putpalette(palette.flat)
+    return out
+
+
+def build_palette(colors: Iterable[Color], ramps: Iterable[Tuple[Color, Color, int]] = ()) -> Palette:
+    """Palette of the given flat colors followed by each (start, end, steps) ramp.
+
+    With ramps, the flat colors are only used for exact matches.
+    """
+    entries = [_rgb(c) for c in colors]
+    ramp_start = len(entries)
+    for start, end, steps in ramps:
+        entries.extend(ramp(_rgb(start), _rgb(end), steps))
+    return Palette(entries, ramp_start)
@@ -0,0 +1,42 @@
+"""
+parallel_render.py
+Process-pool frame rendering.
+The simulation runs sequentially in the parent process and yields compact
+per-frame snapshots; rendering a frame depends only on its snapshot, so the
+snapshots are farmed out to worker processes and the rendered frames are
+handed back in their original order for the encoder.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from PIL import Image
+
+Snapshot = TypeVar('Snapshot')
+
+
+def render_frames(render: Callable[[Snapshot], Image.Image], snapshots: Iterable[Snapshot],
+                  workers: int = 1, prefetch: int = None) -> Iterator[Image.Image]:
+    """Yield `render(snapshot)` for every snapshot, in order.
+
+    With more than one worker the renders run in a process pool; `render`
+    must then be a picklable module-level function. The simulation only runs
+    `prefetch` frames (default: four per worker) ahead of the encoder, so
+    memory stays bounded however long the animation is.
+    """
+    if workers <= 1:
+        for snapshot in snapshots:
+            yield render(snapshot)
+        return
+
+    if prefetch is None:
+        prefetch = workers * 4
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for snapshot in snapshots:
+            pending.append(pool.submit(render, snapshot))
+            if len(pending) >= prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -0,0 +1,93 @@
+"""
+profiling.py
+Opt-in timers for the generators' hot functions.
+`Profiler.install` swaps named module attributes for timing wrappers, so
+callers that look the function up through the module (every call site in
+these scripts) are measured. Nothing is wrapped unless --profile is given,
+so an unprofiled run executes exactly the original functions.
+
+Only the calling process is measured: frames rendered in --workers
+processes are not counted.
+"""
+
+import functools
+import json
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List
+
+
+def _p95(samples: List[int]) -> int:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+
+class Profiler:
+    """Per-function call durations, in nanoseconds."""
+
+    def __init__(self):
+        self.samples: Dict[str, List[int]] = defaultdict(list)
+        self._installed = []
+
+    @classmethod
+    def install(cls, module, names: Iterable[str]) -> "Profiler":
+        """New profiler timing the given functions of `module`."""
+        profiler = cls()
+        for name in names:
+            profiler.wrap(module, name)
+        return profiler
+
+    def wrap(self, module, name: str) -> None:
+        """Replace module.name with a timed wrapper (missing names are skipped)."""
+        func = getattr(module, name, None)
+        if func is None:
+            return
+        samples = self.samples[name]
+        clock = time.perf_counter_ns
+
+        @functools.wraps(func)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                samples.append(clock() - start)
+
+        setattr(module, name, timed)
+        self._installed.append((module, name, func))
+
+    def uninstall(self) -> None:
+        """Put the original functions back."""
+        for module, name, func in reversed(self._installed):
+            setattr(module, name, func)
+        self._installed.clear()
+
+    def stats(self) -> Dict[str, dict]:
+        """Calls, total and p95 milliseconds per function, slowest total first."""
+        rows = {
+            name: {
+                'calls': len(samples),
+                'total_ms': round(sum(samples) / 1e6, 3),
+                'p95_ms': round(_p95(samples) / 1e6, 4),
+            }
+            for name, samples in self.samples.items() if samples
+        }
+        return dict(sorted(rows.items(), key=lambda item: -item[1]['total_ms']))
+
+    def report(self, fmt: str = 'table', file=sys.stdout) -> None:
+        """Print the stats as a JSON object or an aligned table."""
+        stats = self.stats()
+        if fmt == 'json':
+            print(json.dumps(stats, indent=2), file=file)
+            return
+        print(f"{'function':24s} {'calls':>8s} {'total ms':>10s} {'p95 ms':>9s}", file=file)
+        for name, row in stats.items():
+            print(f"{name:24s} {row['calls']:8d} {row['total_ms']:10.1f} {row['p95_ms']:9.3f}",
+                  file=file)
+
+
+def add_profile_argument(parser) -> None:
+    """The shared --profile [table|json] option."""
+    parser.add_argument('--profile', nargs='?', const='table', choices=['table', 'json'],
+                        help="time the hot functions and print a report at the end")
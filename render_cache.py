@@ -0,0 +1,155 @@
+"""
+render_cache.py
+Content-addressed cache for rendered animations.
+An output is keyed by a hash of everything that determines its bytes: the
+source of the generator and the modules it renders with, their config
+constants, the random seed and the Pillow/NumPy versions. A run whose key is
+already cached just copies the stored file into place instead of rendering.
+
+Unseeded runs are random by design and are never cached.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from typing import Iterable, Optional
+
+import numpy
+import PIL
+
+CACHE_DIR = '.render_cache'
+MAX_ENTRIES = 16
+STATS_FILE = 'stats.json'
+
+_CONSTANT_TYPES = (bool, int, float, str, tuple, list, dict, type(None))
+
+
+def _plain(value) -> bool:
+    """Whether `value` is plain data all the way down.
+
+    Anything else (a function, a class instance) may repr with its memory
+    address, which would change the key on every run.
+    """
+    if isinstance(value, dict):
+        return all(_plain(k) and _plain(v) for k, v in value.items())
+    if isinstance(value, (tuple, list)):
+        return all(_plain(item) for item in value)
+    return isinstance(value, _CONSTANT_TYPES)
+
+
+def _constants(module) -> dict:
+    """UPPER_CASE module globals with plain values, as stable reprs."""
+    return {
+        name: repr(value) for name, value in sorted(vars(module).items())
+        if name.isupper() and _plain(value)
+    }
+
+
+def cache_key(modules: Iterable, seed: Optional[int], **extra) -> Optional[str]:
+    """Hex digest identifying one rendered output, or None if it is unseeded.
+
+    `extra` holds any options that change the output bytes.
+    """
+    if seed is None:
+        return None
+    digest = hashlib.sha256()
+    for module in modules:
+        with open(module.__file__, 'rb') as fp:
+            digest.update(fp.read())
+        digest.update(json.dumps(_constants(module), sort_keys=True).encode())
+    digest.update(json.dumps({
+        'seed': seed,
+        'pillow': PIL.__version__,
+        'numpy': numpy.__version__,
+        'extra': {k: repr(v) for k, v in sorted(extra.items())},
+    }, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+class RenderCache:
+    """Stored outputs in a local directory, named by key.
+
+    Only the `max_entries` most recently used files are kept. Hit and miss
+    counts persist across runs in the cache directory.
+    """
+
+    def __init__(self, directory: str = CACHE_DIR, max_entries: int = MAX_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._totals = self._load_totals()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, key + suffix)
+
+    def _load_totals(self) -> dict:
+        try:
+            with open(os.path.join(self.directory, STATS_FILE)) as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return {'hits': 0, 'misses': 0}
+
+    def _save_totals(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, STATS_FILE), 'w') as fp:
+            json.dump(self._totals, fp)
+
+    def _count(self, hit: bool) -> None:
+        field = 'hits' if hit else 'misses'
+        setattr(self, field, getattr(self, field) + 1)
+        self._totals[field] = self._totals.get(field, 0) + 1
+        self._save_totals()
+
+    def fetch(self, key: Optional[str], output: str) -> bool:
+        """Copy the cached output for `key` to `output`; False on a miss."""
+        if key is None:
+            return False
+        path = self._path(key, os.path.splitext(output)[1])
+        if not os.path.exists(path):
+            self._count(hit=False)
+            return False
+        shutil.copyfile(path, output)
+        os.utime(path)  # Mark as recently used
+        self._count(hit=True)
+        return True
+
+    def store(self, key: Optional[str], output: str) -> None:
+        """Save a freshly rendered output under `key`, evicting old entries."""
+        if key is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(key, os.path.splitext(output)[1])
+        tmp = path + '.tmp'
+        shutil.copyfile(output, tmp)
+        os.replace(tmp, path)
+        self._evict()
+
+    def _entries(self):
+        return [os.path.join(self.directory, name) for name in os.listdir(self.directory)
+                if name != STATS_FILE and not name.endswith('.tmp')]
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries(), key=os.path.getmtime, reverse=True)
+        for path in entries[self.max_entries:]:
+            os.remove(path)
+
+    def stats(self) -> dict:
+        """This run's hits/misses, lifetime totals and the cache footprint."""
+        entries = self._entries() if os.path.isdir(self.directory) else []
+        return {
+            'hits': self.hits, 'misses': self.misses,
+            'total_hits': self._totals.get('hits', 0),
+            'total_misses': self._totals.get('misses', 0),
+            'entries': len(entries),
+            'bytes': sum(os.path.getsize(p) for p in entries),
+        }
+
+    def report(self, key: Optional[str], file=sys.stdout) -> None:
+        """Print a one-line summary of the cache for this run."""
+        s = self.stats()
+        state = 'unseeded, not cached' if key is None else f'key {key[:12]}'
+        print(f'  render cache: {state}; {s["entries"]} entries, {s["bytes"] / 1024:.0f} KB, '
+              f'{s["total_hits"]} hits / {s["total_misses"]} misses overall', file=file)
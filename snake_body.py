@@ -0,0 +1,92 @@
+"""
+snake_body.py
+Snake body with O(1) movement, growth and self-collision checks.
+Segments live in a deque (head first, tail last) alongside a Counter of the
+cells they cover. Moving pushes a head and pops a tail in constant time,
+instead of shifting the whole list with insert(0, ...), and `cell in body`
+is a hash lookup rather than a scan.
+
+Grown segments repeat the tail cell until the snake moves on, so a cell can
+hold several segments; the Counter keeps a count per cell.
+"""
+
+from collections import Counter, deque
+from typing import Iterable, Iterator, Tuple
+
+Cell = Tuple[int, int]
+
+
+class SnakeBody:
+    """Ordered snake segments, head first, with per-cell occupancy."""
+
+    __slots__ = ('_segments', '_cells')
+
+    def __init__(self, cells: Iterable[Cell] = ()):
+        self._segments = deque(cells)
+        self._cells = Counter(self._segments)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Cell]:
+        return iter(self._segments)
+
+    def __reversed__(self) -> Iterator[Cell]:
+        return reversed(self._segments)
+
+    def __getitem__(self, i: int) -> Cell:
+        # O(1) at either end (head/tail), O(n) in the middle like any deque
+        return self._segments[i]
+
+    def __contains__(self, cell: Cell) -> bool:
+        return self._cells[cell] > 0
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, SnakeBody):
+            return self._segments == other._segments
+        return list(self._segments) == other
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self._segments)!r})"
+
+    @property
+    def head(self) -> Cell:
+        return self._segments[0]
+
+    @property
+    def tail(self) -> Cell:
+        return self._segments[-1]
+
+    def count(self, cell: Cell) -> int:
+        """Number of segments on a cell."""
+        return self._cells[cell]
+
+    def push_head(self, cell: Cell) -> None:
+        """Add a new head segment."""
+        self._segments.appendleft(cell)
+        self._cells[cell] += 1
+
+    def pop_tail(self) -> Cell:
+        """Remove and return the tail segment."""
+        cell = self._segments.pop()
+        remaining = self._cells[cell] - 1
+        if remaining:
+            self._cells[cell] = remaining
+        else:
+            del self._cells[cell]
+        return cell
+
+    def move(self, new_head: Cell) -> Cell:
+        """Step forward: push `new_head` and drop the tail, which is returned."""
+        self.push_head(new_head)
+        return self.pop_tail()
+
+    def grow(self, segments: int = 1) -> None:
+        """Extend the snake by repeating its tail cell."""
+        tail = self._segments[-1]
+        self._segments.extend([tail] * segments)
+        self._cells[tail] += segments
+
+    def hits_itself(self) -> bool:
+        """True if the head shares its cell with another segment."""
+        return self._cells[self._segments[0]] > 1
@@ -0,0 +1,218 @@
+"""
+snake_planner.py
+Distance-field path planning for the snakes.
+A DistanceField holds, for every cell of a wrapping (torus) grid, the number
+of moves to the nearest target cell and which target that is. The snake
+steers by walking downhill: each move goes to a neighbour one step closer,
+so it always heads for the nearest target by a shortest path.
+
+The field is kept up to date incrementally. Adding a target only relaxes
+the cells it is now closest to (a BFS that stops where it brings no
+improvement). Removing one (it was eaten, or moved away) only touches the
+region that target owned: those cells are cleared and refilled from the
+surrounding cells of other targets with a bucket queue, since the boundary
+distances they start from differ. Neither walks the whole grid, which is
+what lets multi-year boards (530 x 7 and up) replan every step.
+
+    plan_tour(width, height, start, targets) -> the cells of a greedy tour
+"""
+
+from collections import Counter
+from typing import Iterable, List, Optional, Tuple
+
+Cell = Tuple[int, int]
+
+# Distance of cells no target can reach (there are no targets left)
+UNREACHABLE = 1 << 30
+
+# Unit moves, in the order ties are broken
+DIRECTIONS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+
+
+class DistanceField:
+    """Multi-source BFS distances to a set of target cells on a torus.
+
+    `dist[i]` and `owner[i]` are indexed by i = y * width + x; `owner` is the
+    index of the nearest target (-1 where unreachable). Targets are counted,
+    so a cell stays a target until every entity on it has been removed.
+    """
+
+    def __init__(self, width: int, height: int, targets: Iterable[Cell] = ()):
+        self.width = width
+        self.height = height
+        size = width * height
+        self.dist = [UNREACHABLE] * size
+        self.owner = [-1] * size
+        self.targets: Counter = Counter()
+        self._neighbours = [self._wrap_neighbours(i) for i in range(size)]
+        self.targets.update(self._index(cell) for cell in targets)
+        if self.targets:
+            self.rebuild()
+
+    def _wrap_neighbours(self, i: int) -> Tuple[int, ...]:
+        y, x = divmod(i, self.width)
+        return tuple(((y + dy) % self.height) * self.width + (x + dx) % self.width
+                     for dx, dy in DIRECTIONS)
+
+    def _index(self, cell: Cell) -> int:
+        x, y = cell
+        return (y % self.height) * self.width + x % self.width
+
+    def distance(self, cell: Cell) -> int:
+        return self.dist[self._index(cell)]
+
+    def nearest(self, cell: Cell) -> Optional[Cell]:
+        """The target cell closest to `cell` (None if there are no targets)."""
+        owner = self.owner[self._index(cell)]
+        if owner < 0:
+            return None
+        y, x = divmod(owner, self.width)
+        return x, y
+
+    # ------------------------------------------------------------------------
+    # Incremental updates
+
+    def add(self, cell: Cell) -> None:
+        """Make `cell` a target (again), relaxing only the cells it is closer to."""
+        source = self._index(cell)
+        self.targets[source] += 1
+        if self.dist[source] == 0:
+            return
+        dist, owner, neighbours = self.dist, self.owner, self._neighbours
+        dist[source] = 0
+        owner[source] = source
+        frontier = [source]
+        d = 0
+        while frontier:
+            d += 1
+            next_frontier = []
+            for i in frontier:
+                for n in neighbours[i]:
+                    if d < dist[n]:
+                        dist[n] = d
+                        owner[n] = source
+                        next_frontier.append(n)
+            frontier = next_frontier
+
+    def remove(self, cell: Cell) -> None:
+        """Drop one target from `cell`; once none are left, repair its region."""
+        source = self._index(cell)
+        if self.targets[source] > 1:
+            self.targets[source] -= 1
+            return
+        if not self.targets.pop(source, 0):
+            raise KeyError(f"{cell} is not a target")
+        dist, owner, neighbours = self.dist, self.owner, self._neighbours
+
+        # The cells that were closest to this target form a connected region
+        # around it (each got its distance from a neighbour in the region)
+        region = [source]
+        owner[source] = -1
+        for i in region:
+            for n in neighbours[i]:
+                if owner[n] == source:
+                    owner[n] = -1
+                    region.append(n)
+        for i in region:
+            dist[i] = UNREACHABLE
+
+        # Refill from the boundary: bucket b holds cells reachable in b moves
+        buckets: List[List[Tuple[int, int]]] = []
+        for i in region:
+            for n in neighbours[i]:
+                if owner[n] >= 0:
+                    d = dist[n] + 1
+                    while len(buckets) <= d:
+                        buckets.append([])
+                    buckets[d].append((i, owner[n]))
+        d = 0
+        while d < len(buckets):
+            for i, o in buckets[d]:
+                if d < dist[i]:
+                    dist[i] = d
+                    owner[i] = o
+                    if len(buckets) <= d + 1:
+                        buckets.append([])
+                    buckets[d + 1].extend((n, o) for n in neighbours[i] if d + 1 < dist[n])
+            d += 1
+
+    def move(self, old: Cell, new: Cell) -> None:
+        """A target moved from `old` to `new`."""
+        if self._index(old) != self._index(new):
+            self.add(new)
+            self.remove(old)
+
+    def retarget(self, cells: Iterable[Cell]) -> None:
+        """Update the field so the targets are exactly `cells` (a multiset)."""
+        wanted = Counter(self._index(cell) for cell in cells)
+        width = self.width
+        for i in wanted - self.targets:
+            for _ in range(wanted[i] - self.targets[i]):
+                self.add((i % width, i // width))
+        for i in self.targets - wanted:
+            for _ in range(self.targets[i] - wanted[i]):
+                self.remove((i % width, i // width))
+
+    def rebuild(self) -> None:
+        """Recompute the whole field from scratch (one multi-source BFS)."""
+        dist, owner, neighbours = self.dist, self.owner, self._neighbours
+        for i in range(len(dist)):
+            dist[i] = UNREACHABLE
+            owner[i] = -1
+        frontier = sorted(self.targets)
+        for i in frontier:
+            dist[i] = 0
+            owner[i] = i
+        d = 0
+        while frontier:
+            d += 1
+            next_frontier = []
+            for i in frontier:
+                for n in neighbours[i]:
+                    if dist[n] == UNREACHABLE:
+                        dist[n] = d
+                        owner[n] = owner[i]
+                        next_frontier.append(n)
+            frontier = next_frontier
+
+    # ------------------------------------------------------------------------
+    # Steering
+
+    def direction(self, head: Cell, current: Cell = None) -> Optional[Cell]:
+        """A unit move from `head` that gets one step closer to a target.
+
+        Keeps `current` when it is one of the shortest moves, so the snake
+        turns as little as possible. None when `head` is on a target or no
+        target is left.
+        """
+        i = self._index(head)
+        d = self.dist[i]
+        if d == 0 or d == UNREACHABLE:
+            return None
+        x, y = head
+        options = ((current,) if current else ()) + DIRECTIONS
+        for dx, dy in options:
+            if self.dist[self._index((x + dx, y + dy))] == d - 1:
+                return dx, dy
+        raise AssertionError("distance field is inconsistent")
+
+
+def plan_tour(width: int, height: int, start: Cell, targets: Iterable[Cell],
+              direction: Cell = (1, 0)) -> List[Cell]:
+    """Cells visited by a snake that always heads for the nearest uneaten target.
+
+    A greedy nearest-neighbour tour: every target is eaten, each leg is a
+    shortest path, and the field is repaired as targets are eaten.
+    """
+    field = DistanceField(width, height, targets)
+    x, y = start
+    path = [(x % width, y % height)]
+    while field.targets:
+        head = path[-1]
+        while field.distance(head):
+            direction = field.direction(head, direction)
+            head = ((head[0] + direction[0]) % width, (head[1] + direction[1]) % height)
+            path.append(head)
+        for _ in range(field.targets[field._index(head)]):
+            field.remove(head)
+    return path
@@ -0,0 +1,266 @@
+"""
+svg_backend.py
+Vector output for the animation scripts: one self-contained animated SVG.
+Each entity (agent, snake segment, projectile) becomes a single element
+whose trajectory is played back by a CSS @keyframes animation, so the file
+grows with how much things move rather than with frames x pixels. Shapes
+are written once in <defs> and referenced with <use>.
+
+Trajectories are compressed before they are written: keyframes that a
+linear animation would reproduce anyway (points on the line between their
+neighbours) are dropped, so a snake segment gliding along a row costs two
+keyframes however many cells it crosses, and a pause costs two more. Jumps
+(wrapping round the grid, respawning) are kept instant with a step-end
+timing function on the keyframe before them. Entities that are only present
+for part of the loop (projectiles, grown segments) also get a step opacity
+animation.
+"""
+
+import math
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+Color = Tuple[int, ...]
+Keyframe = Tuple[int, float, float, float]  # frame, x, y, angle (degrees)
+
+# Largest position error, in pixels (and degrees), a dropped keyframe may cause
+TOLERANCE = 0.5
+
+
+def hex_color(color: Color) -> str:
+    """#rrggbb for an RGB(A) tuple (alpha is ignored)."""
+    return '#%02x%02x%02x' % tuple(color[:3])
+
+
+def _num(value: float) -> str:
+    """Shortest spelling of a coordinate, to one decimal place."""
+    text = f'{value:.1f}'.rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _percent(frame: int, frame_count: int) -> str:
+    text = f'{100 * frame / frame_count:.3f}'.rstrip('0').rstrip('.')
+    return text + '%'
+
+
+# ============================================================================
+# TRAJECTORY COMPRESSION
+# ============================================================================
+
+def drop_collinear(points: Sequence[Keyframe], tolerance: float = TOLERANCE) -> List[Keyframe]:
+    """Keyframes for a linear animation, without those it would interpolate.
+
+    A run of points is replaced by its two ends while every point in between
+    lies within `tolerance` of where linear interpolation (in time) puts it.
+    """
+    if len(points) <= 2:
+        return list(points)
+    kept = [points[0]]
+    anchor = 0
+    for end in range(2, len(points)):
+        f0, *a = points[anchor]
+        f1, *b = points[end]
+        span = f1 - f0
+        for i in range(anchor + 1, end):
+            f, *p = points[i]
+            t = (f - f0) / span
+            if any(abs(pa + (pb - pa) * t - v) > tolerance for pa, pb, v in zip(a, b, p)):
+                anchor = end - 1
+                kept.append(points[anchor])
+                break
+    kept.append(points[-1])
+    return kept
+
+
+def split_jumps(points: Sequence[Keyframe], jump: Optional[float]) -> List[List[Keyframe]]:
+    """Split a trajectory where the entity jumps rather than moves.
+
+    A jump is a gap in the frames (the entity was not there) or a move of
+    more than `jump` pixels from one frame to the next, e.g. wrapping round
+    the edge of a torus. Interpolating across either would show a slide.
+    """
+    runs: List[List[Keyframe]] = []
+    for point in points:
+        if runs:
+            frame, x, y, _ = runs[-1][-1]
+            moved = jump is not None and math.hypot(point[1] - x, point[2] - y) > jump
+            if point[0] == frame + 1 and not moved:
+                runs[-1].append(point)
+                continue
+        runs.append([point])
+    return runs
+
+
+# ============================================================================
+# ANIMATION
+# ============================================================================
+
+class Track:
+    """One element: its shape, layer and where it is on each frame."""
+
+    __slots__ = ('shape', 'jump', 'layer', 'points')
+
+    def __init__(self, shape: str, jump: Optional[float], layer: int):
+        self.shape = shape
+        self.jump = jump
+        self.layer = layer
+        self.points: List[Keyframe] = []
+
+    def visible_runs(self) -> List[Tuple[int, int]]:
+        """[first, last] frame ranges in which the element was placed."""
+        runs = []
+        for frame, *_ in self.points:
+            if runs and runs[-1][1] == frame - 1:
+                runs[-1][1] = frame
+            else:
+                runs.append([frame, frame])
+        return [tuple(run) for run in runs]
+
+
+class SvgAnimation:
+    """Collects entity positions frame by frame and writes them as one SVG.
+
+    Call add_track() the first time an entity appears, then place() on every
+    frame it is visible. Shapes are SVG fragments drawn around the origin.
+    """
+
+    def __init__(self, width: int, height: int, frame_count: int, frame_ms: int,
+                 background: Color):
+        self.width = width
+        self.height = height
+        self.frame_count = frame_count
+        self.frame_ms = frame_ms
+        self.background = background
+        self.grid: Optional[Tuple[Color, int, int]] = None
+        self.tracks: Dict[Hashable, Track] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.tracks
+
+    def set_grid(self, color: Color, x_step: int, y_step: int = None) -> None:
+        """Grid lines matching background_cache: one pixel wide, from 0 every step."""
+        self.grid = (color, x_step, y_step or x_step)
+
+    def add_track(self, key: Hashable, shape: str, jump: float = None, layer: int = 0) -> None:
+        """Register an entity; moves longer than `jump` pixels per frame are instant."""
+        self.tracks[key] = Track(shape, jump, layer)
+
+    def place(self, frame: int, key: Hashable, x: float, y: float, angle: float = 0.0) -> None:
+        """Record where the entity `key` is on `frame` (rotated by `angle` degrees)."""
+        points = self.tracks[key].points
+        if points:
+            # Rotate the short way round so interpolation does not spin
+            angle += 360 * round((points[-1][3] - angle) / 360)
+        points.append((frame, x, y, angle))
+
+    # ------------------------------------------------------------------------
+
+    def _transform(self, point: Keyframe, css: bool) -> str:
+        _, x, y, angle = point
+        unit = 'px' if css else ''
+        text = f'translate({_num(x)}{unit},{_num(y)}{unit})'
+        if abs(angle) >= 0.05:
+            text += f' rotate({_num(angle)}{"deg" if css else ""})'
+        return text
+
+    def _keyframes(self, name: str, frames: Iterable[Tuple[int, str]]) -> str:
+        body = ''.join(f'{_percent(frame, self.frame_count)}{{{style}}}' for frame, style in frames)
+        return f'@keyframes {name}{{{body}}}'
+
+    def _background(self) -> List[str]:
+        parts = [f'<rect width="100%" height="100%" fill="{hex_color(self.background)}"/>']
+        if self.grid:
+            color, x_step, y_step = self.grid
+            parts.insert(0, (f'<defs><pattern id="grid" width="{x_step}" height="{y_step}" '
+                             f'patternUnits="userSpaceOnUse"><path d="M.5 {y_step}V.5H{x_step}" '
+                             f'fill="none" stroke="{hex_color(color)}"/></pattern></defs>'))
+            parts.append('<rect width="100%" height="100%" fill="url(#grid)"/>')
+        return parts
+
+    def render(self) -> str:
+        """The complete SVG document."""
+        duration = f'{self.frame_count * self.frame_ms / 1000:g}s'
+        shapes: Dict[str, str] = {}
+        styles: List[str] = []
+        elements: List[str] = []
+
+        ordered = sorted(self.tracks.values(), key=lambda track: track.layer)
+        for n, track in enumerate(ordered):
+            if not track.points:
+                continue
+            name = f'e{n:x}'
+            shape_id = shapes.setdefault(track.shape, f's{len(shapes):x}')
+            animations = []
+
+            # Linear within runs; the last keyframe of a run holds until the next
+            frames = []
+            for run in split_jumps(track.points, track.jump):
+                frames += [[p[0], self._transform(p, css=True), ''] for p in drop_collinear(run)]
+                frames[-1][2] = ';animation-timing-function:step-end'
+            frames = [f for i, f in enumerate(frames)
+                      if i == 0 or i == len(frames) - 1 or f[1:] != frames[i - 1][1:]
+                      or f[1:] != frames[i + 1][1:]]
+            attrs = ''
+            if len({t for _, t, _ in frames}) == 1:
+                attrs = f' transform="{self._transform(track.points[0], css=False)}"'
+            else:
+                if frames[0][0] > 0:
+                    frames.insert(0, [0] + frames[0][1:])
+                frames.append([self.frame_count, frames[-1][1], ''])
+                styles.append(self._keyframes(
+                    'm' + name, ((f, f'transform:{t}{timing}') for f, t, timing in frames)))
+                animations.append(f'm{name} {duration} linear infinite')
+
+            runs = track.visible_runs()
+            if runs != [(0, self.frame_count - 1)]:
+                frames = [(0, 'opacity:0')]
+                for first, last in runs:
+                    frames.append((first, 'opacity:1'))
+                    if last + 1 < self.frame_count:
+                        frames.append((last + 1, 'opacity:0'))
+                if frames[1][0] == 0:
+                    del frames[0]
+                styles.append(self._keyframes('v' + name, frames))
+                animations.append(f'v{name} {duration} step-end infinite')
+                if runs[0][0] > 0:
+                    attrs += ' opacity="0"'
+
+            if animations:
+                styles.append(f'#{name}{{animation:{",".join(animations)}}}')
+            elements.append(f'<use id="{name}" href="#{shape_id}"{attrs}/>')
+
+        defs = ''.join(f'<g id="{shape_id}">{shape}</g>' for shape, shape_id in shapes.items())
+        return ''.join([
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{self.width}" height="{self.height}" '
+            f'viewBox="0 0 {self.width} {self.height}">',
+            f'<style>{"".join(styles)}</style>',
+            *self._background(),
+            f'<defs>{defs}</defs>',
+            *elements,
+            '</svg>\n',
+        ])
+
+    def save(self, path: str) -> int:
+        """Write the SVG to `path` and return its size in bytes."""
+        data = self.render().encode('utf-8')
+        with open(path, 'wb') as f:
+            f.write(data)
+        return len(data)
+
+
+def tap(items: Iterable, record) -> Iterator:
+    """Pass every item to `record` on its way through (e.g. snapshots to the renderer)."""
+    for item in items:
+        record(item)
+        yield item
+
+
+def add_svg_argument(parser) -> None:
+    """Shared --svg option for the generator scripts."""
+    parser.add_argument('--svg', metavar='PATH',
+                        help="also write an animated SVG built from the entity trajectories")
+
+
+def report_size(svg_path: str, svg_bytes: int, gif_path: str, gif_bytes: int) -> None:
+    """Print the SVG's size next to the GIF's."""
+    print(f'  SVG {svg_path}: {svg_bytes / 1024:.1f} KB, '
+          f'{svg_bytes / max(gif_bytes, 1):.1%} of {gif_path} ({gif_bytes / 1024:.1f} KB)')
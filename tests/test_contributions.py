@@ -0,0 +1,109 @@
+"""
+load_calendar on the bundled fixtures: grid size, every day's level at its
+date's cell, two years joined on their shared week, and quartile levels for
+calendars without contributionLevel.
+"""
+import datetime
+import json
+import os
+
+import numpy as np
+import pytest
+
+from contributions import LEVELS, load_calendar
+
+FIXTURES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'fixtures')
+CALENDARS = [os.path.join(FIXTURES, f'contributions_{year}.json') for year in (2023, 2024)]
+
+
+def fixture_days(path):
+    with open(path, encoding='utf-8') as f:
+        weeks = json.load(f)['data']['user']['contributionsCollection']['contributionCalendar']['weeks']
+    return [day for week in weeks for day in week['contributionDays']]
+
+
+def cell(grid, date):
+    """(week, weekday) of `date` in the grid."""
+    return divmod((datetime.date.fromisoformat(date) - grid.start).days, 7)
+
+
+def write_calendar(path, days):
+    """A bare contributionCalendar of `days`, a week per seven of them."""
+    weeks = [{'contributionDays': days[i:i + 7]} for i in range(0, len(days), 7)]
+    path.write_text(json.dumps({'weeks': weeks}), encoding='utf-8')
+    return str(path)
+
+
+@pytest.mark.parametrize('path', CALENDARS)
+def test_one_year(path):
+    grid = load_calendar(path)
+    days = fixture_days(path)
+    # Both years start a week on their first day's Sunday and span 53 weeks
+    assert (grid.width, grid.height) == (53, 7)
+    assert grid.start.weekday() == 6
+    assert len(grid) == grid.width * grid.height
+    for day in days:
+        x, y = cell(grid, day['date'])
+        assert grid.level(x, y) == LEVELS.index(day['contributionLevel']), day['date']
+        assert grid.date(x, y).isoformat() == day['date']
+    assert sum(1 for _ in grid.cells()) == sum(day['contributionLevel'] != 'NONE' for day in days)
+
+
+def test_years_join_on_shared_week():
+    grid = load_calendar(CALENDARS)
+    # 2023-12-31 is a Sunday and 2024-01-01 the Monday after, in the same column
+    assert (grid.width, grid.height) == (105, 7)
+    assert grid.start == datetime.date(2023, 1, 1)
+    assert cell(grid, '2023-12-31') == (52, 0)
+    assert cell(grid, '2024-01-01') == (52, 1)
+    assert cell(grid, '2024-12-31') == (104, 2)
+
+    for path in CALENDARS:
+        for day in fixture_days(path):
+            x, y = cell(grid, day['date'])
+            assert grid.level(x, y) == LEVELS.index(day['contributionLevel']), day['date']
+    # The combined grid is each year's grid placed at its first week; the
+    # shared week holds the end of one year and the start of the next
+    expected = np.zeros((7, grid.width), dtype=np.uint8)
+    for path in CALENDARS:
+        year = load_calendar(path)
+        shift = (year.start - grid.start).days // 7
+        np.maximum(expected[:, shift:shift + year.width], year.as_array(),
+                   out=expected[:, shift:shift + year.width])
+    assert (grid.as_array() == expected).all()
+
+
+def test_overlapping_days_keep_highest_level(tmp_path):
+    low = write_calendar(tmp_path / 'low.json', [
+        {'date': '2024-03-03', 'contributionCount': 1, 'contributionLevel': 'FIRST_QUARTILE'},
+        {'date': '2024-03-04', 'contributionCount': 9, 'contributionLevel': 'FOURTH_QUARTILE'}])
+    high = write_calendar(tmp_path / 'high.json', [
+        {'date': '2024-03-03', 'contributionCount': 5, 'contributionLevel': 'THIRD_QUARTILE'},
+        {'date': '2024-03-04', 'contributionCount': 0, 'contributionLevel': 'NONE'}])
+    grid = load_calendar([low, high])
+    assert (grid.width, grid.level(0, 0), grid.level(0, 1)) == (1, 3, 4)
+
+
+def test_quartile_fallback_without_levels(tmp_path):
+    start = datetime.date(2024, 3, 3)
+    counts = [0, 1, 2, 3, 4, 5, 6, 7, 8, 0]
+    days = [{'date': (start + datetime.timedelta(days=i)).isoformat(), 'contributionCount': count}
+            for i, count in enumerate(counts)]
+    grid = load_calendar(write_calendar(tmp_path / 'counts.json', days))
+    # Quartile bounds of the counts 1..8 are 2.75, 4.5 and 6.25
+    assert (grid.width, grid.start) == (2, start)
+    assert [grid.level(*divmod(i, 7)) for i in range(len(counts))] == [0, 1, 1, 2, 2, 3, 3, 4, 4, 0]
+
+
+def test_quartile_fallback_on_fixture(tmp_path):
+    days = fixture_days(CALENDARS[0])
+    for day in days:
+        del day['contributionLevel']
+    grid = load_calendar(write_calendar(tmp_path / 'counts.json', days))
+    assert (grid.width, grid.height) == (53, 7)
+    levels = [grid.level(*cell(grid, day['date'])) for day in days]
+    assert [level > 0 for level in levels] == [day['contributionCount'] > 0 for day in days]
+    # Levels rise with the count and every quartile is used
+    by_count = sorted(zip((day['contributionCount'] for day in days), levels))
+    assert [level for _, level in by_count] == sorted(levels)
+    assert set(levels) == {0, 1, 2, 3, 4}
@@ -0,0 +1,24 @@
+"""
+aegis_snake's renderers draw the same frame: the sprite atlas and the NumPy
+framebuffer must match ImageDraw pixel for pixel.
+"""
+import random
+
+import numpy as np
+import pytest
+
+import aegis_snake
+
+
+@pytest.fixture(scope='module')
+def states():
+    random.seed(3)
+    return list(aegis_snake.simulate())[::6]
+
+
+@pytest.mark.parametrize('renderer', sorted(set(aegis_snake.RENDERERS) - {'draw'}))
+def test_snake_renderers_match_draw(states, renderer):
+    render = getattr(aegis_snake, aegis_snake.RENDERERS[renderer])
+    for state in states:
+        expected = np.asarray(aegis_snake.draw_frame(state))
+        assert np.array_equal(np.asarray(render(state)), expected), f"frame {state.frame}"
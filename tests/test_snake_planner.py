@@ -0,0 +1,92 @@
+"""
+DistanceField's incremental updates on small wrapping boards: after every
+add, remove, move and retarget the distances must equal those of a field
+built from scratch, and plan_tour must eat every target.
+"""
+import random
+from collections import Counter
+
+import pytest
+
+from snake_planner import UNREACHABLE, DistanceField, plan_tour
+
+BOARDS = [(1, 1), (1, 5), (2, 2), (3, 7), (5, 4), (8, 3), (9, 6)]
+
+
+def torus_distance(width, height, a, b):
+    dx, dy = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return min(dx, width - dx) + min(dy, height - dy)
+
+
+def random_cell(rng, width, height):
+    return rng.randrange(width), rng.randrange(height)
+
+
+def assert_matches_fresh(field, targets):
+    """field agrees with a DistanceField built on the multiset `targets`."""
+    width, height = field.width, field.height
+    fresh = DistanceField(width, height, targets.elements())
+    assert field.dist == fresh.dist
+    assert field.targets == fresh.targets
+    # Ties may go to a different target, but the owner must be one at that distance
+    for i, owner in enumerate(field.owner):
+        if field.dist[i] == UNREACHABLE:
+            assert owner == -1
+        else:
+            assert field.targets[owner] > 0
+            cell, target = divmod(i, width)[::-1], divmod(owner, width)[::-1]
+            assert torus_distance(width, height, cell, target) == field.dist[i]
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('width, height', BOARDS)
+def test_incremental_updates_match_rebuild(width, height, seed):
+    rng = random.Random(seed)
+    targets = Counter(random_cell(rng, width, height) for _ in range(rng.randrange(4)))
+    field = DistanceField(width, height, targets.elements())
+    assert_matches_fresh(field, targets)
+    for _ in range(60):
+        op = rng.choice(['add', 'remove', 'move', 'retarget'])
+        if op == 'add' or (op in ('remove', 'move') and not targets):
+            cell = random_cell(rng, width, height)
+            field.add(cell)
+            targets[cell] += 1
+        elif op == 'remove':
+            cell = rng.choice(sorted(targets))
+            field.remove(cell)
+            targets[cell] -= 1
+        elif op == 'move':
+            old = rng.choice(sorted(targets))
+            if rng.random() < 0.5:
+                dx, dy = rng.choice([(1, 0), (0, 1), (-1, 0), (0, -1)])
+                new = ((old[0] + dx) % width, (old[1] + dy) % height)
+            else:
+                new = random_cell(rng, width, height)
+            field.move(old, new)
+            targets[old] -= 1
+            targets[new] += 1
+        else:
+            targets = Counter(random_cell(rng, width, height) for _ in range(rng.randrange(6)))
+            field.retarget(targets.elements())
+        targets = +targets
+        assert_matches_fresh(field, targets)
+
+
+def test_remove_missing_target_raises():
+    field = DistanceField(4, 3, [(1, 1)])
+    with pytest.raises(KeyError):
+        field.remove((2, 2))
+
+
+@pytest.mark.parametrize('seed', range(6))
+@pytest.mark.parametrize('width, height', BOARDS)
+def test_plan_tour_visits_every_target(width, height, seed):
+    rng = random.Random(seed)
+    start = random_cell(rng, width, height)
+    targets = [random_cell(rng, width, height) for _ in range(rng.randrange(1, 10))]
+    path = plan_tour(width, height, start, targets)
+    assert path[0] == start
+    assert set(targets) <= set(path)
+    assert path[-1] in targets
+    for a, b in zip(path, path[1:]):
+        assert torus_distance(width, height, a, b) == 1
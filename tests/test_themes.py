@@ -0,0 +1,75 @@
+"""
+Theme variants are the default render with its palette swapped. A themed
+frame may only show the colors the same frame rendered in that theme shows,
+plus the theme's ramp colors (glows and gradients round to neighbouring
+steps): blended pixels must never land on a solid color's entry.
+"""
+import contextlib
+import io
+import random
+
+import numpy as np
+import pytest
+
+import aegis_constellation
+import aegis_snake
+from palette import swap_palette
+
+
+class Unmapped:
+    """Stands in for a script's PALETTE to get its frames in RGB."""
+
+    def map(self, img):
+        return img.convert('RGB')
+
+
+def colors_of(img):
+    packed = np.unique(np.asarray(img.convert('RGBX')).view('<u4') & 0xFFFFFF).tolist()
+    return {(value & 0xFF, value >> 8 & 0xFF, value >> 16) for value in packed}
+
+
+def snake_frames(monkeypatch):
+    random.seed(3)
+    monkeypatch.setattr(aegis_snake, 'TOTAL_FRAMES', 150)
+    states = list(aegis_snake.simulate())[::10]
+    monkeypatch.setattr(aegis_snake, 'PALETTE', Unmapped())
+
+    def render(theme):
+        with monkeypatch.context() as patch:
+            for name, color in aegis_snake.THEMES[theme].items():
+                if name in aegis_snake.COLORS:
+                    patch.setitem(aegis_snake.COLORS, name, color)
+            return [aegis_snake.draw_frame(state) for state in states]
+    return render
+
+
+def constellation_frames(monkeypatch):
+    random.seed(3)
+    monkeypatch.setattr(aegis_constellation, 'TOTAL_FRAMES', 60)
+    with contextlib.redirect_stdout(io.StringIO()):
+        snapshots = list(aegis_constellation.simulate())[::10]
+    monkeypatch.setattr(aegis_constellation, 'PALETTE', Unmapped())
+
+    def render(theme):
+        colors = aegis_constellation.THEMES[theme]
+        with monkeypatch.context() as patch:
+            patch.setattr(aegis_constellation, 'BACKGROUND', colors['background'])
+            patch.setattr(aegis_constellation, 'GRID_COLOR', colors['grid'])
+            patch.setattr(aegis_constellation, 'CONNECTION_COLOR', colors['connection'])
+            return [aegis_constellation.render_snapshot(snapshot) for snapshot in snapshots]
+    return render
+
+
+@pytest.mark.parametrize('module, frames', [(aegis_snake, snake_frames),
+                                            (aegis_constellation, constellation_frames)])
+def test_themed_frames_only_show_expected_colors(monkeypatch, module, frames):
+    palette = module.PALETTE
+    render = frames(monkeypatch)
+    rendered = [palette.map(img) for img in render(module.DEFAULT_THEME)]
+    for name in module.THEMES:
+        theme = module.theme_palette(name)
+        ramps = set(theme.colors[theme.ramp_start:])
+        for i, (frame, direct) in enumerate(zip(rendered, render(name))):
+            expected = colors_of(theme.map(direct)) | ramps
+            unexpected = colors_of(swap_palette(frame, theme)) - expected
+            assert not unexpected, f"{name} frame {i}: {sorted(unexpected)}"